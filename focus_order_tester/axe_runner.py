@@ -4,10 +4,19 @@ Axe Runner Module for Focus Order Tester
 Runs axe-core accessibility analysis focusing on SC 2.4.3 (Focus Order) related rules.
 """
 import asyncio
-from dataclasses import dataclass, field
+import hashlib
+import re
+import weakref
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import BrowserContext, Page
+
+from .browser_session import BrowserSession
+from .readiness import LoadState, ReadinessConfig
+from .result_cache import ResultCache, cache_key, page_fingerprint
 
 
 # Rules related to WCAG SC 2.4.3 Focus Order
@@ -19,6 +28,85 @@ SC_243_RULES = [
 ]
 
 
+# axe-core bundle shipped with the package, resolved independently of the CWD
+AXE_BUNDLE_PATH = Path(__file__).resolve().parent.parent / "lib" / "axe.min.js"
+AXE_BUNDLE_SHA256 = "1d7975184c74f8bc15076edf2e6c207570a67933366de570c05a2c5af1732e6a"
+AXE_CDN_URL = "https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.8.4/axe.min.js"
+
+
+@dataclass(frozen=True)
+class AxeBundle:
+    """axe-core source held in memory, with its version and content hash"""
+    source: str
+    version: str
+    sha256: str
+
+
+@lru_cache(maxsize=None)
+def load_axe_bundle(path: Path = AXE_BUNDLE_PATH, expected_sha256: Optional[str] = None) -> AxeBundle:
+    """
+    Read an axe-core bundle once per process.
+    
+    Args:
+        path: Path to axe.min.js
+        expected_sha256: Optional hash the file must match
+        
+    Returns:
+        AxeBundle with the source, the version from its license header and its hash
+        
+    Raises:
+        FileNotFoundError: If the bundle does not exist
+        ValueError: If the hash does not match or no version header is found
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"axe-core bundle not found: {path}")
+    
+    source = path.read_text(encoding="utf-8")
+    sha256 = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    if expected_sha256 and sha256 != expected_sha256:
+        raise ValueError(f"axe-core bundle hash mismatch for {path}: {sha256}")
+    
+    match = re.match(r"/\*! axe v(\S+)", source)
+    if not match:
+        raise ValueError(f"axe-core version header not found in {path}")
+    
+    return AxeBundle(source=source, version=match.group(1), sha256=sha256)
+
+
+# In lean mode only violations are collected and each one is reduced
+# in-page to the fields _parse_violations reads, so passes, incomplete
+# results and per-check data never cross the CDP connection.
+_RUN_AXE_JS = """
+    async ({rules, lean, maxNodes, maxHtml}) => {
+        const options = {runOnly: {type: 'rule', values: rules}};
+        if (!lean) {
+            return await axe.run(options);
+        }
+        options.resultTypes = ['violations'];
+        const results = await axe.run(document, options);
+        const clip = html => maxHtml && html.length > maxHtml ? html.slice(0, maxHtml) + '…' : html;
+        return {
+            violations: results.violations.map(v => {
+                const nodes = maxNodes ? v.nodes.slice(0, maxNodes) : v.nodes;
+                return {
+                    id: v.id,
+                    impact: v.impact,
+                    description: v.description,
+                    helpUrl: v.helpUrl,
+                    omittedNodes: v.nodes.length - nodes.length,
+                    nodes: nodes.map(n => ({
+                        html: clip(n.html),
+                        target: n.target,
+                        failureSummary: n.failureSummary
+                    }))
+                };
+            })
+        };
+    }
+"""
+
+
 @dataclass
 class FocusOrderViolation:
     """Represents a focus order violation found by axe-core"""
@@ -27,6 +115,7 @@ class FocusOrderViolation:
     impact: str
     help_url: str
     nodes: List[Dict[str, Any]] = field(default_factory=list)
+    omitted_nodes: int = 0  # Nodes dropped by the max_nodes cap
 
 
 class AxeRunner:
@@ -36,79 +125,189 @@ class AxeRunner:
     Usage:
         async with AxeRunner() as runner:
             violations = await runner.analyze("https://example.com")
+    
+    Pass a shared BrowserSession to reuse one browser across analyzers;
+    otherwise the runner owns a private session. Pages are considered
+    ready at DOMContentLoaded unless a ReadinessConfig is given.
+    
+    axe-core is read into memory once and registered as an init script on
+    each browser context. The CDN is only used when allow_cdn is set and
+    the bundle file is missing.
+    
+    In lean mode (the default) results are trimmed in the page before
+    being returned; max_nodes and max_html_length further cap the nodes
+    kept per rule and the length of each node's HTML snippet.
+    
+    With a ResultCache, pages whose normalized DOM, axe version and rule
+    configuration match a stored entry return the stored violations
+    without running axe.
     """
     
-    def __init__(self, headless: bool = True):
-        self.headless = headless
-        self._playwright = None
-        self._browser: Optional[Browser] = None
+    def __init__(
+        self,
+        headless: bool = True,
+        session: Optional[BrowserSession] = None,
+        readiness: Optional[ReadinessConfig] = None,
+        axe_path: Optional[Path] = None,
+        allow_cdn: bool = False,
+        lean: bool = True,
+        max_nodes: Optional[int] = None,
+        max_html_length: Optional[int] = None,
+        cache: Optional[ResultCache] = None
+    ):
+        self.headless = session.headless if session else headless
+        self.session = session
+        self.readiness = readiness or ReadinessConfig(LoadState("domcontentloaded"))
+        self.axe_path = Path(axe_path) if axe_path else AXE_BUNDLE_PATH
+        self.allow_cdn = allow_cdn
+        self.lean = lean
+        self.max_nodes = max_nodes
+        self.max_html_length = max_html_length
+        self.cache = cache
+        self.bundle: Optional[AxeBundle] = None
+        self._owns_session = session is None
+        self._prepared_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
     
     async def __aenter__(self):
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        try:
+            # Only the shipped bundle is pinned; a custom path is trusted as is
+            expected = AXE_BUNDLE_SHA256 if self.axe_path == AXE_BUNDLE_PATH else None
+            self.bundle = load_axe_bundle(self.axe_path, expected)
+        except FileNotFoundError:
+            if not self.allow_cdn:
+                raise
+            print(f"⚠️ axe-core bundle not found at {self.axe_path}, falling back to {AXE_CDN_URL}")
+        
+        if self._owns_session:
+            self.session = BrowserSession(headless=self.headless)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        if self._owns_session and self.session:
+            await self.session.close()
+            self.session = None
+    
+    async def new_context(self) -> BrowserContext:
+        """
+        Create a new isolated browser context on the runner's browser.
+        
+        Returns:
+            BrowserContext that the caller is responsible for closing
+        """
+        if not self.session:
+            raise RuntimeError("AxeRunner must be used as async context manager")
+        
+        context = await self.session.new_context()
+        await self.prepare_context(context)
+        return context
     
-    async def analyze(self, url: str) -> List[FocusOrderViolation]:
+    async def prepare_context(self, context: BrowserContext) -> None:
+        """
+        Register axe-core on a context so every page it opens has it.
+        
+        Safe to call repeatedly; the script is registered once per context.
+        """
+        if self.bundle and context not in self._prepared_contexts:
+            await context.add_init_script(script=self.bundle.source)
+            self._prepared_contexts.add(context)
+    
+    async def analyze(
+        self,
+        url: str,
+        context: Optional[BrowserContext] = None,
+        timings: Optional[Dict[str, Any]] = None
+    ) -> List[FocusOrderViolation]:
         """
         Analyze a page for focus order violations.
         
         Args:
             url: The URL to analyze (can be http://, https://, file://, or data:)
+            context: Optional browser context to open the page in
+                (defaults to a fresh context on the runner's browser)
+            timings: Optional dict that receives the page's "readiness" info
             
         Returns:
             List of FocusOrderViolation objects
         """
-        if not self._browser:
+        if not self.session:
             raise RuntimeError("AxeRunner must be used as async context manager")
         
-        page = await self._browser.new_page()
+        owned_context = None
+        if context is None:
+            context = owned_context = await self.session.new_context()
+        await self.prepare_context(context)
+        page = await context.new_page()
         
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            
-            # Inject and run axe-core
-            results = await self._run_axe(page)
-            
-            # Filter and parse violations
-            violations = self._parse_violations(results)
-            
-            return violations
+            ready = await self.readiness.navigate(page, url)
+            if timings is not None:
+                timings["readiness"] = asdict(ready)
+            return await self.analyze_page(page)
         finally:
             await page.close()
+            if owned_context:
+                await owned_context.close()
+    
+    async def analyze_page(self, page: Page) -> List[FocusOrderViolation]:
+        """
+        Analyze an already loaded page for focus order violations.
+        
+        The page is left open so later phases can reuse it.
+        
+        Args:
+            page: Loaded Playwright page
+            
+        Returns:
+            List of FocusOrderViolation objects
+        """
+        key = None
+        if self.cache is not None:
+            key = cache_key("axe", page.url, await page_fingerprint(page), self._cache_config())
+            cached = self.cache.get(key)
+            if cached is not None:
+                return [FocusOrderViolation(**v) for v in cached]
+        
+        # Inject and run axe-core
+        results = await self._run_axe(page)
+        
+        # Filter and parse violations
+        violations = self._parse_violations(results)
+        if key:
+            self.cache.put(key, [asdict(v) for v in violations])
+        return violations
+    
+    def _cache_config(self) -> List[Any]:
+        """Everything besides the page that determines the violations"""
+        version = self.bundle.version if self.bundle else AXE_CDN_URL
+        return [version, SC_243_RULES, self.lean, self.max_nodes, self.max_html_length]
     
     async def _run_axe(self, page: Page) -> Dict[str, Any]:
-        """Inject axe-core and run analysis"""
-        # Dictionary of local paths to check
-        # We check relative to current working directory
-        import os
-        local_axe = "lib/axe.min.js"
-        
-        if os.path.exists(local_axe):
-            await page.add_script_tag(path=local_axe)
-        else:
-            # Fallback to CDN
-            await page.add_script_tag(url="https://cdnjs.cloudflare.com/ajax/libs/axe-core/4.8.4/axe.min.js")
+        """Ensure the expected axe-core is present and run analysis"""
+        await self._ensure_axe(page)
         
         # Run axe with focus order related rules
-        results = await page.evaluate("""
-            async () => {
-                const results = await axe.run({
-                    runOnly: {
-                        type: 'rule',
-                        values: ['tabindex', 'focus-order-semantics', 'nested-interactive', 'aria-hidden-focus']
-                    }
-                });
-                return results;
-            }
-        """)
-        
-        return results
+        return await page.evaluate(_RUN_AXE_JS, {
+            "rules": SC_243_RULES,
+            "lean": self.lean,
+            "maxNodes": self.max_nodes,
+            "maxHtml": self.max_html_length,
+        })
+    
+    async def _ensure_axe(self, page: Page) -> None:
+        """
+        Check the page's axe-core version, injecting it when needed.
+        
+        The init script covers pages opened after prepare_context; pages
+        that predate it, or that replaced window.axe with their own copy,
+        get the in-memory bundle injected directly.
+        """
+        if not self.bundle:
+            await page.add_script_tag(url=AXE_CDN_URL)
+            return
+        
+        version = await page.evaluate("() => window.axe ? window.axe.version : null")
+        if version != self.bundle.version:
+            await page.add_script_tag(content=self.bundle.source)
     
     def _parse_violations(self, results: Dict[str, Any]) -> List[FocusOrderViolation]:
         """Parse axe-core results into FocusOrderViolation objects"""
@@ -128,24 +327,32 @@ class AxeRunner:
                 description=violation.get("description", ""),
                 impact=violation.get("impact", ""),
                 help_url=violation.get("helpUrl", ""),
-                nodes=nodes
+                nodes=nodes,
+                omitted_nodes=violation.get("omittedNodes", 0)
             ))
         
         return violations
 
 
-async def run_axe_analysis(url: str, headless: bool = True) -> Dict[str, Any]:
+async def run_axe_analysis(
+    url: str,
+    headless: bool = True,
+    session: Optional[BrowserSession] = None,
+    allow_cdn: bool = False
+) -> Dict[str, Any]:
     """
     Convenience function to run axe analysis on a single URL.
     
     Args:
         url: The URL to analyze
         headless: Whether to run browser in headless mode
+        session: Optional shared BrowserSession to run in
+        allow_cdn: Load axe-core from the CDN if the local bundle is missing
         
     Returns:
         Dict with url, timestamp, and violations
     """
-    async with AxeRunner(headless=headless) as runner:
+    async with AxeRunner(headless=headless, session=session, allow_cdn=allow_cdn) as runner:
         violations = await runner.analyze(url)
         
         return {
@@ -0,0 +1,265 @@
+"""
+Browser Session Module for Focus Order Tester
+
+Shares a single Playwright driver and Chromium instance between analyzers,
+and pools the browser contexts handed out on it.
+"""
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+from .resource_blocker import ResourceBlocker
+
+
+class BrowserSession:
+    """
+    Owns one Chromium instance that AxeRunner, FocusTracer and
+    TriggerTracker can share through injection.
+
+    The browser is launched lazily on first use, so the launch cost is
+    paid once per run and only if a page is actually needed.
+
+    Usage:
+        async with BrowserSession() as session:
+            async with AxeRunner(session=session) as runner:
+                violations = await runner.analyze("https://example.com")
+
+    Pass a ResourceBlocker to apply it to every context the session creates.
+    """
+
+    def __init__(self, headless: bool = True, resource_blocker: Optional[ResourceBlocker] = None):
+        self.headless = headless
+        self.resource_blocker = resource_blocker
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._launch_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def get_browser(self) -> Browser:
+        """Return the shared browser, launching it on first call"""
+        async with self._launch_lock:
+            if not self._browser:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self._browser
+
+    async def new_context(self) -> BrowserContext:
+        """
+        Create a new isolated browser context on the shared browser.
+
+        Returns:
+            BrowserContext that the caller is responsible for closing
+        """
+        browser = await self.get_browser()
+        context = await browser.new_context()
+        if self.resource_blocker:
+            await self.resource_blocker.attach(context)
+        return context
+
+    async def relaunch(self) -> None:
+        """Close the browser so the next use launches a fresh one"""
+        async with self._launch_lock:
+            if self._browser:
+                await self._browser.close()
+                self._browser = None
+
+    async def close(self) -> None:
+        """Close the browser and stop the Playwright driver"""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+@dataclass
+class PoolStats:
+    """Lifetime counters for a ContextPool"""
+    contexts_created: int = 0
+    contexts_recycled: int = 0
+    peak_live_contexts: int = 0
+    browser_relaunches: int = 0
+
+
+class ContextPool:
+    """
+    Leases browser contexts from a BrowserSession with bounded memory use.
+
+    - At most max_contexts contexts are alive at once; acquire() waits.
+    - A context is closed and replaced after pages_per_context leases.
+    - The browser is relaunched after pages_per_browser leases, or when the
+      RSS of the browser process tree exceeds rss_limit_mb. Relaunching
+      waits until every leased context has been released.
+
+    Each lease counts as one page (one URL processed in the context).
+
+    Usage:
+        pool = ContextPool(session, max_contexts=4)
+        context = await pool.acquire()
+        try:
+            ...
+        finally:
+            await pool.release(context)
+    """
+
+    def __init__(
+        self,
+        session: BrowserSession,
+        max_contexts: int = 4,
+        pages_per_context: int = 50,
+        pages_per_browser: int = 1000,
+        rss_limit_mb: Optional[float] = None,
+        context_factory: Optional[Callable[[], Awaitable[BrowserContext]]] = None
+    ):
+        self.session = session
+        self.max_contexts = max(1, max_contexts)
+        self.pages_per_context = pages_per_context
+        self.pages_per_browser = pages_per_browser
+        self.rss_limit_mb = rss_limit_mb
+        self.stats = PoolStats()
+        # Contexts are created by the factory so callers can prepare them
+        self._new_context = context_factory or session.new_context
+        self._idle: List[BrowserContext] = []
+        self._uses: Dict[BrowserContext, int] = {}
+        self._leased = 0
+        self._pages_since_launch = 0
+        self._draining = False
+        self._condition = asyncio.Condition()
+
+    @property
+    def live_contexts(self) -> int:
+        """Number of contexts currently open, leased or idle"""
+        return len(self._uses)
+
+    async def acquire(self) -> BrowserContext:
+        """Lease a context, creating one if the pool has room"""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: not self._draining and (self._idle or self.live_contexts < self.max_contexts)
+            )
+            self._leased += 1
+            if self._idle:
+                return self._idle.pop()
+
+            # Reserve the slot before awaiting so concurrent acquires see it
+            placeholder = object()
+            self._uses[placeholder] = 0
+
+        try:
+            context = await self._new_context()
+        except Exception:
+            async with self._condition:
+                del self._uses[placeholder]
+                self._leased -= 1
+                self._condition.notify_all()
+            raise
+
+        async with self._condition:
+            del self._uses[placeholder]
+            self._uses[context] = 0
+            self.stats.contexts_created += 1
+            self.stats.peak_live_contexts = max(self.stats.peak_live_contexts, self.live_contexts)
+        return context
+
+    async def release(self, context: BrowserContext, broken: bool = False) -> None:
+        """
+        Return a leased context, recycling it or the browser when due.
+
+        Args:
+            context: Context returned by acquire()
+            broken: The lease failed in a way that may have left the
+                context unusable, so close it instead of reusing it
+        """
+        async with self._condition:
+            self._leased -= 1
+            self._uses[context] += 1
+            self._pages_since_launch += 1
+
+            if not self._draining and self._browser_due():
+                self._draining = True
+
+            if broken or self._draining or (
+                self.pages_per_context and self._uses[context] >= self.pages_per_context
+            ):
+                await self._close(context)
+                self.stats.contexts_recycled += 1
+            else:
+                self._idle.append(context)
+
+            if self._draining and self._leased == 0:
+                while self._idle:
+                    await self._close(self._idle.pop())
+                    self.stats.contexts_recycled += 1
+                await self.session.relaunch()
+                self.stats.browser_relaunches += 1
+                self._pages_since_launch = 0
+                self._draining = False
+
+            self._condition.notify_all()
+
+    async def close(self) -> None:
+        """Close all idle contexts (leased ones are closed by their holders)"""
+        async with self._condition:
+            while self._idle:
+                await self._close(self._idle.pop())
+
+    def _browser_due(self) -> bool:
+        """Whether the browser has served enough pages or grown too large"""
+        if self.pages_per_browser and self._pages_since_launch >= self.pages_per_browser:
+            return True
+        if self.rss_limit_mb:
+            rss_mb = browser_rss_mb()
+            return rss_mb is not None and rss_mb > self.rss_limit_mb
+        return False
+
+    async def _close(self, context: BrowserContext) -> None:
+        del self._uses[context]
+        try:
+            await context.close()
+        except Exception:
+            # Context already gone with its browser; nothing left to free
+            pass
+
+
+def browser_rss_mb() -> Optional[float]:
+    """
+    Resident memory of this process's descendants (driver and browser) in MB.
+
+    Reads /proc, so returns None on platforms without it.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss_kb: Dict[int, int] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            status = (entry / "status").read_text()
+        except OSError:
+            continue
+        pid = int(entry.name)
+        for line in status.splitlines():
+            if line.startswith("PPid:"):
+                children.setdefault(int(line.split()[1]), []).append(pid)
+            elif line.startswith("VmRSS:"):
+                rss_kb[pid] = int(line.split()[1])
+
+    total_kb = 0
+    pending = list(children.get(os.getpid(), []))
+    while pending:
+        pid = pending.pop()
+        total_kb += rss_kb.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    return total_kb / 1024
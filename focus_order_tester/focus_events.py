@@ -0,0 +1,127 @@
+"""
+Focus Events Module for Focus Order Tester
+
+Reports focus changes from the page to Python as they happen, so key
+presses can wait for the resulting focus event instead of sleeping for a
+fixed time. A recorder script installed on each context pushes focusin
+events (and focus leaving the document) through an exposed binding.
+"""
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from playwright.async_api import BrowserContext, Page
+
+
+DEFAULT_FOCUS_TIMEOUT_MS = 500
+
+# The fixed delay the event wait replaces, for reporting the time saved
+FIXED_SLEEP_MS = 50
+
+_BINDING = "__focusOrderTesterFocus"
+
+# focusout with no relatedTarget means focus left the document (e.g. Tab
+# past the last element), which never produces a focusin. As an init
+# script it also runs in child frames, whose focus events never reach the
+# top document.
+_RECORDER_JS = """
+    (() => {
+        if (window.__focusOrderTesterRecorder) return;
+        window.__focusOrderTesterRecorder = true;
+        const report = type => {
+            const binding = window.__focusOrderTesterFocus;
+            if (typeof binding === 'function') binding({type, time: performance.now()});
+        };
+        document.addEventListener('focusin', () => report('focusin'), true);
+        document.addEventListener('focusout', e => {
+            if (!e.relatedTarget) report('focusout');
+        }, true);
+    })()
+"""
+
+_context_installs: "weakref.WeakKeyDictionary[BrowserContext, asyncio.Future]" = weakref.WeakKeyDictionary()
+_page_events: "weakref.WeakKeyDictionary[Page, asyncio.Queue]" = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class FocusWaitStats:
+    """Time spent waiting for focus to settle after key presses"""
+    steps: int = 0
+    timeouts: int = 0
+    wait_ms: float = 0.0
+
+    def record(self, elapsed_ms: float, timed_out: bool) -> None:
+        self.steps += 1
+        self.timeouts += int(timed_out)
+        self.wait_ms += elapsed_ms
+
+
+def _on_focus(source: Dict[str, Any], event: Dict[str, Any]) -> None:
+    queue = _page_events.get(source.get("page"))
+    if queue is not None:
+        queue.put_nowait(event)
+
+
+async def _install_context(context: BrowserContext) -> None:
+    await context.expose_binding(_BINDING, _on_focus)
+    await context.add_init_script(script=_RECORDER_JS)
+
+
+async def install_focus_recorder(page: Page) -> None:
+    """
+    Start reporting a page's focus changes.
+
+    The binding and init script are registered once per context, so later
+    pages get the recorder on load; the page itself is instrumented
+    directly in case it was loaded before that.
+    """
+    context = page.context
+    install = _context_installs.get(context)
+    if install is None:
+        install = _context_installs[context] = asyncio.ensure_future(_install_context(context))
+    await install
+
+    if page not in _page_events:
+        _page_events[page] = asyncio.Queue()
+    await page.evaluate(_RECORDER_JS)
+
+
+async def press_and_wait_for_focus(
+    page: Page,
+    key: str = "Tab",
+    timeout_ms: float = DEFAULT_FOCUS_TIMEOUT_MS,
+    stats: Optional[FocusWaitStats] = None
+) -> bool:
+    """
+    Press a key and wait until the page reports a focus change.
+
+    Args:
+        page: Page to press the key in
+        key: Key to press
+        timeout_ms: Longest to wait for a focus event
+        stats: Optional stats that receive the wait time of this step
+
+    Returns:
+        True if a focus event arrived, False if the wait timed out
+    """
+    queue = _page_events.get(page)
+    if queue is None:
+        await install_focus_recorder(page)
+        queue = _page_events[page]
+
+    # Discard events caused by anything before this key press
+    while not queue.empty():
+        queue.get_nowait()
+
+    start = time.monotonic()
+    await page.keyboard.press(key)
+    try:
+        await asyncio.wait_for(queue.get(), timeout_ms / 1000)
+        timed_out = False
+    except asyncio.TimeoutError:
+        timed_out = True
+
+    if stats is not None:
+        stats.record((time.monotonic() - start) * 1000, timed_out)
+    return not timed_out
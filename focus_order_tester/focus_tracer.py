@@ -1,12 +1,108 @@
 """
 Focus Tracer Module for Focus Order Tester
 
-Traces the actual focus path through a page by simulating Tab key navigation.
+Traces the actual focus path through a page by simulating Tab key navigation,
+or computes the sequential focus navigation order in the page in one step.
 """
 import asyncio
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from typing import AsyncGenerator, AsyncIterator, List, Dict, Any, Optional, Tuple
+from playwright.async_api import BrowserContext, Page
+
+from .browser_session import BrowserSession
+from .focus_events import DEFAULT_FOCUS_TIMEOUT_MS, FocusWaitStats, press_and_wait_for_focus
+from .page_scripts import FOCUSABLES_JS, IDENTITY_JS
+from .readiness import LoadState, ReadinessConfig
+from .result_cache import ResultCache, cache_key, page_fingerprint
+
+
+# keyboard: press Tab per element (ground truth, slow)
+# analytic: compute the order in one evaluate
+# hybrid:   analytic, with Tab presses verifying the order's boundaries
+# batched:  press Tab in bursts, reading an in-page focus log per burst
+TRACE_MODES = ("keyboard", "analytic", "hybrid", "batched")
+
+DEFAULT_BATCH_SIZE = 10
+
+# Longest focus cycle reported as a keyboard trap; longer loops end the
+# trace as before
+DEFAULT_TRAP_CYCLE = 3
+
+# Logs every focusin target for batched tracing; focus leaving the
+# document is logged as null so Python can stop there. The real target is
+# taken from the composed path, and same-origin frames get listeners of
+# their own since their focus events stay inside the frame. Installing
+# again replaces an earlier log. Returns the DOM order when withDom is set.
+_FOCUS_LOG_JS = """
+    (withDom) => {
+""" + IDENTITY_JS + FOCUSABLES_JS + """
+        if (window.__focusOrderTesterLog) window.__focusOrderTesterLog.stop();
+        const focused = identity.active();
+        if (focused) focused.blur();
+        
+        const docs = [];
+        const addDocument = doc => {
+            docs.push(doc);
+            doc.querySelectorAll('iframe, frame').forEach(frame => {
+                if (frame.contentDocument) addDocument(frame.contentDocument);
+            });
+        };
+        addDocument(document);
+        
+        const entries = [];
+        const onFocusIn = e => {
+            const el = e.composedPath()[0];
+            // Focus entering a same-origin frame is logged inside the frame
+            if (!el.contentDocument) entries.push(identity.describe(el));
+        };
+        // Only the top document sees focus leave the page; a frame's
+        // focusout without relatedTarget just means focus left the frame
+        const onFocusOut = e => {
+            if (!e.relatedTarget) entries.push(null);
+        };
+        docs.forEach(doc => doc.addEventListener('focusin', onFocusIn, true));
+        document.addEventListener('focusout', onFocusOut, true);
+        window.__focusOrderTesterLog = {
+            read: () => entries.splice(0),
+            stop: () => {
+                docs.forEach(doc => doc.removeEventListener('focusin', onFocusIn, true));
+                document.removeEventListener('focusout', onFocusOut, true);
+            }
+        };
+        return withDom ? flatOrder(focusScope()).map(c => identity.describe(c.el)) : null;
+    }
+"""
+
+# Sequential focus navigation order per the HTML spec, from a single walk
+# that covers shadow roots and same-origin frames. The ordered elements
+# are kept on window for verification. With withDom, the flat tree order
+# of the same elements is returned as well.
+_ANALYTIC_ORDER_JS = """
+    (withDom) => {
+""" + IDENTITY_JS + FOCUSABLES_JS + """
+        const scope = focusScope();
+        const ordered = tabOrder(scope);
+        window.__focusOrderTesterOrder = ordered;
+        
+        return {
+            order: ordered.map(el => identity.describe(el)),
+            dom: withDom ? flatOrder(scope).map(c => identity.describe(c.el)) : null
+        };
+    }
+"""
+
+# Starts a keyboard trace from the top of the document, returning the
+# DOM order of focusable elements when withDom is set
+_START_TRACE_JS = """
+    (withDom) => {
+""" + IDENTITY_JS + FOCUSABLES_JS + """
+        const focused = identity.active();
+        if (focused) focused.blur();
+        document.body.focus();
+        return withDom ? flatOrder(focusScope()).map(c => identity.describe(c.el)) : null;
+    }
+"""
 
 
 @dataclass
@@ -19,6 +115,44 @@ class FocusElement:
     position: int
     role: Optional[str] = None
     aria_label: Optional[str] = None
+    uid: Optional[int] = None  # In-page identity, stable for one page load
+    # Selectors of the iframes and shadow hosts enclosing the element, from
+    # the top document down; selector is relative to the innermost of them
+    context_path: List[str] = field(default_factory=list)
+    
+    @property
+    def qualified_selector(self) -> str:
+        """Selector prefixed with its frame and shadow host path"""
+        return " >>> ".join([*self.context_path, self.selector])
+
+
+@dataclass
+class FocusTrap:
+    """A short focus cycle that Tab never leaves (WCAG 2.1.2)"""
+    elements: List[FocusElement]  # The cycle, in focus order
+    start: int  # Position in the focus path where the cycle begins
+    reverse: bool = False  # Found by a Shift+Tab trace
+
+
+def element_from_description(info: Dict[str, Any], position: int) -> FocusElement:
+    """Build a FocusElement from an in-page element description"""
+    return FocusElement(
+        tag_name=info["tagName"],
+        selector=info["selector"],
+        text_content=info["textContent"],
+        tab_index=info["tabIndex"],
+        position=position,
+        role=info.get("role"),
+        aria_label=info.get("ariaLabel"),
+        uid=info.get("uid"),
+        context_path=info.get("contextPath") or []
+    )
+
+
+def _extend_dom_order(dom_order: Optional[List[FocusElement]], elements: Optional[List[Dict[str, Any]]]) -> None:
+    """Fill a caller's dom_order list from in-page element descriptions"""
+    if dom_order is not None and elements:
+        dom_order.extend(element_from_description(info, position) for position, info in enumerate(elements))
 
 
 class FocusTracer:
@@ -28,105 +162,579 @@ class FocusTracer:
     Usage:
         async with FocusTracer() as tracer:
             focus_path = await tracer.trace("https://example.com")
+            
+            # Or stream elements as they are found
+            async for element in tracer.iter_trace("https://example.com"):
+                print(element.selector)
+    
+    Pass a shared BrowserSession to reuse one browser across analyzers;
+    otherwise the tracer owns a private session. Pages are considered
+    ready at DOMContentLoaded unless a ReadinessConfig is given.
+    
+    The mode selects how the path is found (see TRACE_MODES). The analytic
+    mode is not capped by max_elements; a hybrid trace whose boundary
+    checks disagree with the analytic order falls back to the keyboard.
+    
+    With a ResultCache, pages whose normalized DOM matches a stored
+    trace return it without pressing Tab.
+    
+    After each Tab press the tracer waits for the page to report the
+    focus change (up to focus_timeout_ms) and records the wait in
+    focus_stats. The batched mode skips those waits: it presses Tab
+    batch_size times and then reads every focus change from an in-page
+    log with a single evaluate.
     """
     
-    def __init__(self, headless: bool = True):
-        self.headless = headless
-        self._playwright = None
-        self._browser: Optional[Browser] = None
+    def __init__(
+        self,
+        headless: bool = True,
+        session: Optional[BrowserSession] = None,
+        readiness: Optional[ReadinessConfig] = None,
+        cache: Optional[ResultCache] = None,
+        mode: str = "keyboard",
+        focus_timeout_ms: float = DEFAULT_FOCUS_TIMEOUT_MS,
+        focus_stats: Optional[FocusWaitStats] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        trap_cycle: int = DEFAULT_TRAP_CYCLE
+    ):
+        if mode not in TRACE_MODES:
+            raise ValueError(f"Unknown trace mode: {mode}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.headless = session.headless if session else headless
+        self.session = session
+        self.readiness = readiness or ReadinessConfig(LoadState("domcontentloaded"))
+        self.cache = cache
+        self.mode = mode
+        self.focus_timeout_ms = focus_timeout_ms
+        self.focus_stats = focus_stats if focus_stats is not None else FocusWaitStats()
+        self.batch_size = batch_size
+        self.trap_cycle = trap_cycle
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        if self._owns_session:
+            self.session = BrowserSession(headless=self.headless)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        if self._owns_session and self.session:
+            await self.session.close()
+            self.session = None
     
-    async def trace(self, url: str, max_elements: int = 100) -> List[FocusElement]:
+    async def trace(
+        self,
+        url: str,
+        max_elements: int = 100,
+        context: Optional[BrowserContext] = None,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None
+    ) -> List[FocusElement]:
         """
         Trace focus path by simulating Tab key presses.
         
         Args:
             url: The URL to trace
             max_elements: Maximum elements to trace (prevents infinite loops)
+            context: Optional browser context to open the page in
+                (defaults to a fresh context on the tracer's browser)
+            dom_order: Optional list that receives the focusable elements
+                in DOM order
+            traps: Optional list that receives the keyboard trap that
+                ended the trace, if any
             
         Returns:
             List of FocusElement in focus order
         """
-        if not self._browser:
+        return [
+            element async for element in
+            self.iter_trace(url, max_elements=max_elements, context=context, dom_order=dom_order, traps=traps)
+        ]
+    
+    async def iter_trace(
+        self,
+        url: str,
+        max_elements: int = 100,
+        context: Optional[BrowserContext] = None,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None
+    ) -> AsyncIterator[FocusElement]:
+        """
+        Trace focus path, yielding each element as soon as it is found.
+        
+        The page stays open until the generator finishes or is closed. To
+        stop early, break out of the loop inside contextlib.aclosing() (or
+        call aclose()) so the page is closed right away:
+        
+            async with aclosing(tracer.iter_trace(url)) as elements:
+                async for element in elements:
+                    if element.tag_name == "iframe":
+                        break
+        
+        Args:
+            url: The URL to trace
+            max_elements: Maximum elements to trace (prevents infinite loops)
+            context: Optional browser context to open the page in
+                (defaults to a fresh context on the tracer's browser)
+            dom_order: Optional list that receives the focusable elements
+                in DOM order, filled before the first element is yielded
+            traps: Optional list that receives the keyboard trap that
+                ended the trace, if any
+            
+        Yields:
+            FocusElement in focus order
+        """
+        if not self.session:
             raise RuntimeError("FocusTracer must be used as async context manager")
         
-        page = await self._browser.new_page()
-        focus_path = []
+        owned_context = None
+        if context is None:
+            context = owned_context = await self.session.new_context()
+        page = await context.new_page()
         
         try:
-            await page.goto(url, wait_until="domcontentloaded")
+            await self.readiness.navigate(page, url)
+            async for element in self.iter_trace_page(
+                page, max_elements=max_elements, dom_order=dom_order, traps=traps
+            ):
+                yield element
+        finally:
+            await page.close()
+            if owned_context:
+                await owned_context.close()
+    
+    async def trace_bidirectional(
+        self,
+        url: str,
+        max_elements: int = 100,
+        context: Optional[BrowserContext] = None,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None
+    ) -> Tuple[List[FocusElement], List[FocusElement]]:
+        """
+        Trace focus path with Tab and Shift+Tab concurrently.
+        
+        Args:
+            url: The URL to trace
+            max_elements: Maximum elements per direction
+            context: Optional browser context to open the pages in
+                (defaults to a fresh context on the tracer's browser)
+            dom_order: Optional list that receives the focusable elements
+                in DOM order
+            traps: Optional list that receives keyboard traps found in
+                either direction
             
-            # Start from body to ensure clean state
-            await page.evaluate("document.body.focus()")
+        Returns:
+            Tuple of (forward path, reverse path)
+        """
+        if not self.session:
+            raise RuntimeError("FocusTracer must be used as async context manager")
+        
+        owned_context = None
+        if context is None:
+            context = owned_context = await self.session.new_context()
+        page = await context.new_page()
+        
+        try:
+            await self.readiness.navigate(page, url)
+            return await self.trace_page_bidirectional(
+                page, max_elements=max_elements, dom_order=dom_order, traps=traps
+            )
+        finally:
+            await page.close()
+            if owned_context:
+                await owned_context.close()
+    
+    async def trace_page(
+        self,
+        page: Page,
+        max_elements: int = 100,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None,
+        reverse: bool = False
+    ) -> List[FocusElement]:
+        """
+        Trace focus path on an already loaded page.
+        
+        Only focus is moved; the DOM is left untouched and the page stays
+        open so later phases can reuse it.
+        
+        Args:
+            page: Loaded Playwright page
+            max_elements: Maximum elements to trace (prevents infinite loops)
+            dom_order: Optional list that receives the focusable elements
+                in DOM order, captured by the evaluate that starts the trace
+                and described with the same identities as the focus path
+            traps: Optional list that receives the keyboard trap that
+                ended the trace, if any
+            reverse: Trace with Shift+Tab from the end of the document
+                (always key-driven, by keyboard or in bursts in batched mode)
             
-            seen_selectors = set()
-            position = 0
+        Returns:
+            List of FocusElement in focus order
+        """
+        return [
+            element async for element in
+            self.iter_trace_page(
+                page, max_elements=max_elements, dom_order=dom_order, traps=traps, reverse=reverse
+            )
+        ]
+    
+    async def iter_trace_page(
+        self,
+        page: Page,
+        max_elements: int = 100,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None,
+        reverse: bool = False
+    ) -> AsyncIterator[FocusElement]:
+        """
+        Trace focus path on an already loaded page, yielding each element
+        as soon as it is found.
+        
+        Keyboard and batched traces yield per Tab press or burst; analytic
+        and hybrid traces yield once the order is computed (and, for hybrid,
+        verified). Only complete traces are stored in the cache.
+        
+        Args:
+            page: Loaded Playwright page
+            max_elements: Maximum elements to trace (prevents infinite loops)
+            dom_order: Optional list that receives the focusable elements
+                in DOM order, filled before the first element is yielded
+            traps: Optional list that receives the keyboard trap that
+                ended the trace, if any
+            reverse: Trace with Shift+Tab from the end of the document
             
-            for _ in range(max_elements):
-                # Press Tab
-                await page.keyboard.press("Tab")
-                await asyncio.sleep(0.05)  # Small delay for focus to settle
-                
-                # Get currently focused element info
-                element_info = await page.evaluate("""
-                    (index) => {
-                        const el = document.activeElement;
-                        if (!el || el === document.body) return null;
-                        
-                        // Generate a unique selector using index
-                        let selector = el.tagName.toLowerCase();
-                        if (el.id) selector = '#' + el.id;
-                        else selector = el.tagName.toLowerCase() + '_' + index;
-                        
-                        return {
-                            tagName: el.tagName.toLowerCase(),
-                            selector: selector,
-                            textContent: (el.textContent || '').trim().slice(0, 100),
-                            tabIndex: el.tabIndex,
-                            role: el.getAttribute('role'),
-                            ariaLabel: el.getAttribute('aria-label')
-                        };
+        Yields:
+            FocusElement in focus order
+        """
+        with_dom = dom_order is not None
+        found: List[FocusTrap] = []
+        key = None
+        if self.cache is not None:
+            key = cache_key(
+                "focus",
+                page.url,
+                await page_fingerprint(page),
+                [self.mode, max_elements, self.batch_size, with_dom, self.trap_cycle, reverse]
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                if with_dom:
+                    dom_order.extend(FocusElement(**e) for e in cached["dom_order"])
+                if traps is not None and cached.get("trap"):
+                    trap = cached["trap"]
+                    traps.append(FocusTrap(
+                        [FocusElement(**e) for e in trap["elements"]], trap["start"], trap.get("reverse", reverse)
+                    ))
+                for e in cached["focus_path"]:
+                    yield FocusElement(**e)
+                return
+        
+        focus_path = []
+        async for element in self._trace_steps(page, max_elements, dom_order, found, reverse):
+            focus_path.append(element)
+            yield element
+        
+        for trap in found:
+            trap.reverse = reverse
+        if traps is not None:
+            traps.extend(found)
+        if key:
+            self.cache.put(key, {
+                "focus_path": [asdict(e) for e in focus_path],
+                "dom_order": [asdict(e) for e in dom_order] if with_dom else None,
+                "trap": asdict(found[0]) if found else None
+            })
+    
+    async def _trace_steps(
+        self,
+        page: Page,
+        max_elements: int,
+        dom_order: Optional[List[FocusElement]],
+        traps: List[FocusTrap],
+        reverse: bool = False
+    ) -> AsyncIterator[FocusElement]:
+        """Dispatch to the trace of the configured mode"""
+        if reverse:
+            trace = self._tab_through_batched if self.mode == "batched" else self._tab_through
+            steps = trace(page, max_elements, dom_order, traps, key="Shift+Tab")
+        elif self.mode == "keyboard":
+            steps = self._tab_through(page, max_elements, dom_order, traps)
+        elif self.mode == "batched":
+            steps = self._tab_through_batched(page, max_elements, dom_order, traps)
+        else:
+            focus_path = await self._analytic_order(page, dom_order)
+            if self.mode == "analytic" or await self._verify_boundaries(page, focus_path):
+                for element in focus_path:
+                    yield element
+                return
+            print(f"⚠️ Analytic focus order disagrees with Tab navigation on {page.url}, tracing by keyboard")
+            steps = self._tab_through(page, max_elements, traps=traps)
+        
+        async for element in steps:
+            yield element
+    
+    async def trace_page_bidirectional(
+        self,
+        page: Page,
+        max_elements: int = 100,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None
+    ) -> Tuple[List[FocusElement], List[FocusElement]]:
+        """
+        Trace a loaded page with Tab and with Shift+Tab at the same time.
+        
+        The reverse trace runs in a second page of the same context, loaded
+        from the same URL while the forward trace is already running.
+        
+        Args:
+            page: Loaded Playwright page, traced forward
+            max_elements: Maximum elements per direction
+            dom_order: Optional list that receives the focusable elements
+                in DOM order (from the forward page)
+            traps: Optional list that receives keyboard traps found in
+                either direction
+            
+        Returns:
+            Tuple of (forward path, reverse path), each in the order the
+            elements were focused
+        """
+        async def reverse_trace() -> List[FocusElement]:
+            reverse_page = await page.context.new_page()
+            try:
+                await self.readiness.navigate(reverse_page, page.url)
+                return await self.trace_page(reverse_page, max_elements=max_elements, traps=traps, reverse=True)
+            finally:
+                await reverse_page.close()
+        
+        forward, reverse = await asyncio.gather(
+            self.trace_page(page, max_elements=max_elements, dom_order=dom_order, traps=traps),
+            reverse_trace()
+        )
+        return forward, reverse
+    
+    def reached_limit(self, focus_path: List[FocusElement], max_elements: int = 100, reverse: bool = False) -> bool:
+        """Whether a Tab-driven trace stopped at max_elements rather than at a cycle"""
+        key_driven = reverse or self.mode in ("keyboard", "batched")
+        return key_driven and len(focus_path) >= max_elements
+    
+    async def _analytic_order(
+        self,
+        page: Page,
+        dom_order: Optional[List[FocusElement]] = None
+    ) -> List[FocusElement]:
+        """Compute the sequential focus navigation order in one evaluate"""
+        result = await page.evaluate(_ANALYTIC_ORDER_JS, dom_order is not None)
+        _extend_dom_order(dom_order, result["dom"])
+        return [element_from_description(info, position) for position, info in enumerate(result["order"])]
+    
+    async def _verify_boundaries(self, page: Page, focus_path: List[FocusElement]) -> bool:
+        """
+        Check the analytic order against real Tab presses at its edges.
+        
+        Tab is pressed from the document start and from the element before
+        each checkpoint: the first element, the first tabindex=0 element
+        after a positive-tabindex run, and the last element.
+        """
+        if not focus_path:
+            return True
+        
+        checkpoints = {0, len(focus_path) - 1}
+        first_natural = next((e.position for e in focus_path if e.tab_index <= 0), 0)
+        checkpoints.add(first_natural)
+        
+        for index in sorted(checkpoints):
+            await page.evaluate("""
+                (index) => {
+""" + IDENTITY_JS + """
+                    if (index === 0) {
+                        const focused = identity.active();
+                        if (focused) focused.blur();
+                        document.body.focus();
+                    } else {
+                        window.__focusOrderTesterOrder[index - 1].focus();
                     }
-                """, position)
-                
-                if not element_info:
-                    break
+                }
+            """, index)
+            await press_and_wait_for_focus(page, "Tab", self.focus_timeout_ms, self.focus_stats)
+            matches = await page.evaluate("""
+                (index) => {
+""" + IDENTITY_JS + """
+                    return identity.active() === window.__focusOrderTesterOrder[index];
+                }
+            """, index)
+            if not matches:
+                return False
+        
+        return True
+    
+    async def _tab_through_batched(
+        self,
+        page: Page,
+        max_elements: int,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None,
+        key: str = "Tab"
+    ) -> AsyncIterator[FocusElement]:
+        """Press Tab (or key) in bursts and read the focus log once per burst"""
+        _extend_dom_order(dom_order, await page.evaluate(_FOCUS_LOG_JS, dom_order is not None))
+        try:
+            async for element in self._follow_focus(
+                self._batched_steps(page, max_elements, key), max_elements, dom_order, traps
+            ):
+                yield element
+        finally:
+            await page.evaluate("() => window.__focusOrderTesterLog && window.__focusOrderTesterLog.stop()")
+    
+    async def _batched_steps(
+        self,
+        page: Page,
+        max_elements: int,
+        key: str = "Tab"
+    ) -> AsyncGenerator[Optional[Dict[str, Any]], None]:
+        """Yield the logged focus targets of key bursts, at most max_elements (plus a trap check) presses"""
+        presses_left = max_elements + self.trap_cycle
+        last = None
+        while presses_left > 0:
+            burst = min(self.batch_size, presses_left)
+            for _ in range(burst):
+                await page.keyboard.press(key)
+            presses_left -= burst
+            
+            entries = await page.evaluate("() => window.__focusOrderTesterLog.read()")
+            if not entries:
+                # No focus change in a whole burst: focus is stuck where it is,
+                # unless it is moving inside a frame or host the log cannot see
+                if last is None:
+                    return
+                if last.get("opaque"):
+                    continue
+                entries = [last]
+            
+            for info in entries:
+                yield info
+            last = entries[-1]
+    
+    async def _tab_through(
+        self,
+        page: Page,
+        max_elements: int,
+        dom_order: Optional[List[FocusElement]] = None,
+        traps: Optional[List[FocusTrap]] = None,
+        key: str = "Tab"
+    ) -> AsyncIterator[FocusElement]:
+        """Press Tab (or key) until focus cycles and yield each focused element"""
+        # Start from body to ensure clean state
+        _extend_dom_order(dom_order, await page.evaluate(_START_TRACE_JS, dom_order is not None))
+        
+        async for element in self._follow_focus(self._keyboard_steps(page, key), max_elements, dom_order, traps):
+            yield element
+    
+    async def _keyboard_steps(self, page: Page, key: str = "Tab") -> AsyncGenerator[Optional[Dict[str, Any]], None]:
+        """Press Tab (or key) and yield the focused element, once per press"""
+        while True:
+            # Press Tab and wait for focus to move
+            await press_and_wait_for_focus(page, key, self.focus_timeout_ms, self.focus_stats)
+            
+            # Get currently focused element info
+            yield await page.evaluate("""
+                () => {
+""" + IDENTITY_JS + """
+                    const el = identity.active();
+                    if (!el || el === document.body) return null;
+                    return identity.describe(el);
+                }
+            """)
+    
+    async def _follow_focus(
+        self,
+        steps: AsyncGenerator[Optional[Dict[str, Any]], None],
+        max_elements: int,
+        dom_order: Optional[List[FocusElement]],
+        traps: Optional[List[FocusTrap]]
+    ) -> AsyncIterator[FocusElement]:
+        """
+        Turn focused-element descriptions into the focus path.
+        
+        The path ends when focus leaves the document (null) or returns to
+        an element already on it. A return that closes a cycle of at most
+        trap_cycle elements is followed for one more lap; if focus goes
+        round the same cycle again, the cycle is recorded in traps as a
+        keyboard trap. Focus going round from the first element only counts
+        when dom_order shows focusable elements the cycle never reaches.
+        
+        Repeats of an opaque element (a cross-origin frame or closed shadow
+        host) are focus moving between its inner Tab stops, not a cycle;
+        they are skipped, and the path ends if focus stays inside it for
+        max_elements presses.
+        """
+        focus_path: List[FocusElement] = []
+        positions: Dict[int, int] = {}
+        cycle: Optional[List[int]] = None
+        lap = 0
+        previous = None
+        stalled = 0
+        
+        try:
+            async for info in steps:
+                if info and info.get("opaque") and info["uid"] == previous:
+                    stalled += 1
+                    if stalled >= max_elements:
+                        return
+                    continue
+                stalled = 0
+                previous = info["uid"] if info else None
                 
-                # Check if we've cycled back to start
-                if element_info["selector"] in seen_selectors:
-                    break
+                if cycle is not None:
+                    lap += 1
+                    if not info or info["uid"] != cycle[lap % len(cycle)]:
+                        return
+                    if lap == len(cycle):
+                        start = positions[cycle[0]]
+                        if traps is not None:
+                            traps.append(FocusTrap(focus_path[start:], start))
+                        return
+                    continue
                 
-                seen_selectors.add(element_info["selector"])
+                # Focus left the document
+                if not info:
+                    return
                 
-                focus_path.append(FocusElement(
-                    tag_name=element_info["tagName"],
-                    selector=element_info["selector"],
-                    text_content=element_info["textContent"],
-                    tab_index=element_info["tabIndex"],
-                    position=position,
-                    role=element_info.get("role"),
-                    aria_label=element_info.get("ariaLabel")
-                ))
+                if info["uid"] in positions:
+                    start = positions[info["uid"]]
+                    length = len(focus_path) - start
+                    escapes = start == 0 and (not dom_order or len(dom_order) <= length)
+                    if length > self.trap_cycle or escapes:
+                        # Cycled back to start
+                        return
+                    cycle = [e.uid for e in focus_path[start:]]
+                    continue
                 
-                position += 1
-            
-            return focus_path
-            
+                positions[info["uid"]] = len(focus_path)
+                element = element_from_description(info, len(focus_path))
+                focus_path.append(element)
+                yield element
+                if len(focus_path) >= max_elements:
+                    return
         finally:
-            await page.close()
+            await steps.aclose()
 
 
-async def trace_focus_path(url: str, headless: bool = True, max_elements: int = 100) -> Dict[str, Any]:
+async def trace_focus_path(
+    url: str,
+    headless: bool = True,
+    max_elements: int = 100,
+    session: Optional[BrowserSession] = None,
+    context: Optional[BrowserContext] = None,
+    readiness: Optional[ReadinessConfig] = None,
+    cache: Optional[ResultCache] = None,
+    mode: str = "keyboard",
+    focus_timeout_ms: float = DEFAULT_FOCUS_TIMEOUT_MS,
+    focus_stats: Optional[FocusWaitStats] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    bidirectional: bool = False
+) -> Dict[str, Any]:
     """
     Convenience function to trace focus path on a single URL.
     
@@ -134,60 +742,273 @@ async def trace_focus_path(url: str, headless: bool = True, max_elements: int =
         url: The URL to trace
         headless: Whether to run browser in headless mode
         max_elements: Maximum elements to trace
+        session: Optional shared BrowserSession (avoids a browser launch)
+        context: Optional browser context to open the page in
+        readiness: Optional page readiness configuration
+        cache: Optional result cache for unchanged pages
+        mode: Trace mode, one of TRACE_MODES
+        focus_timeout_ms: Longest wait for focus to move after a Tab press
+        focus_stats: Optional stats that receive the per-step focus waits
+        batch_size: Tab presses per focus log read in batched mode
+        bidirectional: Also trace with Shift+Tab, concurrently in a second
+            page, and compare the reverse path with the forward one
         
     Returns:
-        Dict with url, focus_path, and element_count
+        Dict with url, focus_path, element_count, order_comparison and
+        violations (a keyboard trap, if one was found), plus
+        reverse_comparison when bidirectional
+    """
+    async with FocusTracer(
+        headless=headless,
+        session=session,
+        readiness=readiness,
+        cache=cache,
+        mode=mode,
+        focus_timeout_ms=focus_timeout_ms,
+        focus_stats=focus_stats,
+        batch_size=batch_size
+    ) as tracer:
+        dom_order: List[FocusElement] = []
+        traps: List[FocusTrap] = []
+        reverse_path = None
+        if bidirectional:
+            focus_path, reverse_path = await tracer.trace_bidirectional(
+                url, max_elements=max_elements, context=context, dom_order=dom_order, traps=traps
+            )
+        else:
+            focus_path = await tracer.trace(
+                url, max_elements=max_elements, context=context, dom_order=dom_order, traps=traps
+            )
+        return build_trace_result(
+            url,
+            focus_path,
+            dom_order,
+            truncated=tracer.reached_limit(focus_path, max_elements),
+            trap=primary_trap(traps),
+            reverse_path=reverse_path,
+            reverse_truncated=reverse_path is not None and tracer.reached_limit(
+                reverse_path, max_elements, reverse=True
+            )
+        )
+
+
+def build_trace_result(
+    url: str,
+    focus_path: List[FocusElement],
+    dom_order: Optional[List[FocusElement]] = None,
+    truncated: bool = False,
+    trap: Optional[FocusTrap] = None,
+    reverse_path: Optional[List[FocusElement]] = None,
+    reverse_truncated: bool = False
+) -> Dict[str, Any]:
     """
-    async with FocusTracer(headless=headless) as tracer:
-        focus_path = await tracer.trace(url, max_elements=max_elements)
+    Convert a traced focus path into the dict format used in reports.
+    
+    Args:
+        url: The traced URL
+        focus_path: List of FocusElement in focus order
+        dom_order: Optional focusable elements in DOM order; when given,
+            the result includes a DOM vs focus order comparison
+        truncated: Whether the trace stopped at max_elements, in which
+            case elements past the end are not reported as missing
+        trap: Keyboard trap that ended the trace, reported as a violation
+        reverse_path: Optional Shift+Tab path; when given and neither
+            trace was capped, the result includes a comparison of the
+            forward path with the reversed reverse path
+        reverse_truncated: Whether the reverse trace stopped at max_elements
         
-        return {
-            "url": url,
-            "focus_path": [
-                {
-                    "position": e.position,
-                    "tag_name": e.tag_name,
-                    "selector": e.selector,
-                    "text_content": e.text_content,
-                    "tab_index": e.tab_index,
-                    "role": e.role
-                }
-                for e in focus_path
-            ],
-            "element_count": len(focus_path)
-        }
+    Returns:
+        Dict with url, focus_path, element_count and violations (plus
+        order_comparison when dom_order is given and reverse_comparison
+        when reverse_path is given)
+    """
+    result = {
+        "url": url,
+        "focus_path": [
+            {
+                "position": e.position,
+                "tag_name": e.tag_name,
+                "selector": e.selector,
+                "text_content": e.text_content,
+                "tab_index": e.tab_index,
+                "role": e.role,
+                "context_path": e.context_path
+            }
+            for e in focus_path
+        ],
+        "element_count": len(focus_path),
+        "violations": [keyboard_trap_violation(trap)] if trap else []
+    }
+    
+    if dom_order is not None:
+        comparison = compare_dom_vs_focus_order(
+            [e.qualified_selector for e in dom_order],
+            [e.qualified_selector for e in focus_path]
+        )
+        if truncated:
+            # Elements the capped trace never reached are not missing
+            reached = len(focus_path)
+            comparison["discrepancies"] = [
+                d for d in comparison["discrepancies"]
+                if d["type"] != "missing" or d["dom_position"] < reached
+            ]
+            comparison["summary"]["missing"] = sum(
+                len(d["selectors"]) for d in comparison["discrepancies"] if d["type"] == "missing"
+            )
+            comparison["matches"] = not comparison["discrepancies"]
+            comparison["truncated"] = True
+        result["order_comparison"] = comparison
+    
+    if reverse_path is not None:
+        result["reverse_element_count"] = len(reverse_path)
+        if not truncated and not reverse_truncated:
+            # Shift+Tab should visit exactly the forward path, backwards
+            result["reverse_comparison"] = compare_dom_vs_focus_order(
+                [e.qualified_selector for e in focus_path],
+                [e.qualified_selector for e in reversed(reverse_path)]
+            )
+    
+    return result
+
+
+def primary_trap(traps: List[FocusTrap]) -> Optional[FocusTrap]:
+    """The trap to report for a trace: the Tab one, else a Shift+Tab one"""
+    return next((t for t in traps if not t.reverse), traps[0] if traps else None)
+
+
+def keyboard_trap_violation(trap: FocusTrap) -> Dict[str, Any]:
+    """Describe a keyboard trap in the violation format of axe results"""
+    cycle = " → ".join(e.qualified_selector for e in trap.elements)
+    key = "Shift+Tab" if trap.reverse else "Tab"
+    return {
+        "rule_id": "wcag212-keyboard-trap",
+        "impact": "critical",
+        "description": (
+            f"Keyboard Trap (SC 2.1.2): {key} keeps cycling through {len(trap.elements)} "
+            f"element(s) from focus position {trap.start} and never reaches the end of the page: {cycle}"
+        ),
+        "help_url": "https://www.w3.org/WAI/WCAG21/Understanding/no-keyboard-trap.html",
+        "nodes": [
+            {
+                "html": f"<{e.tag_name}>{e.text_content}</{e.tag_name}>",
+                "target": [e.qualified_selector]
+            }
+            for e in trap.elements
+        ]
+    }
+
+
+def _longest_increasing_subsequence(values: List[int]) -> List[int]:
+    """Return the indexes of one longest strictly increasing subsequence (O(n log n))"""
+    tails: List[int] = []       # tails[k]: value ending the best run of length k+1
+    tail_indexes: List[int] = []
+    previous = [-1] * len(values)
+    
+    for i, value in enumerate(values):
+        k = bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_indexes.append(i)
+        else:
+            tails[k] = value
+            tail_indexes[k] = i
+        previous[i] = tail_indexes[k - 1] if k else -1
+    
+    result = []
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i != -1:
+        result.append(i)
+        i = previous[i]
+    return result[::-1]
+
+
+def _group_runs(items: List[Dict[str, Any]], keys: Tuple[str, ...]) -> List[List[Dict[str, Any]]]:
+    """Group items into runs where every key advances by exactly one"""
+    runs: List[List[Dict[str, Any]]] = []
+    for item in items:
+        if runs and all(item[k] == runs[-1][-1][k] + 1 for k in keys):
+            runs[-1].append(item)
+        else:
+            runs.append([item])
+    return runs
 
 
 def compare_dom_vs_focus_order(dom_order: List[str], focus_order: List[str]) -> Dict[str, Any]:
     """
     Compare DOM order with actual focus order.
     
+    The orders are aligned rather than zipped: the longest run of elements
+    whose focus order follows the DOM (a longest increasing subsequence)
+    is taken as in order, and everything else is reported as moved,
+    missing (in the DOM order only) or extra (in the focus order only).
+    Adjacent elements that moved together are reported as one record.
+    Runs in O(n log n).
+    
     Args:
         dom_order: List of selectors in DOM order
         focus_order: List of selectors in focus order
         
     Returns:
-        Dict with matches (bool) and discrepancies list
+        Dict with matches (bool), discrepancies list and summary counts
     """
-    discrepancies = []
+    # Pair repeated selectors by occurrence so duplicates stay distinct
+    def keyed(order: List[str]) -> List[Tuple[str, int]]:
+        counts: Dict[str, int] = {}
+        keys = []
+        for selector in order:
+            keys.append((selector, counts.get(selector, 0)))
+            counts[selector] = counts.get(selector, 0) + 1
+        return keys
     
-    for i, (dom_sel, focus_sel) in enumerate(zip(dom_order, focus_order)):
-        if dom_sel != focus_sel:
-            discrepancies.append({
-                "position": i,
-                "dom_selector": dom_sel,
-                "focus_selector": focus_sel
-            })
+    dom_keys = keyed(dom_order)
+    focus_keys = keyed(focus_order)
+    dom_index = {key: i for i, key in enumerate(dom_keys)}
+    focus_index = {key: i for i, key in enumerate(focus_keys)}
+    
+    common = [(j, dom_index[key]) for j, key in enumerate(focus_keys) if key in dom_index]
+    in_order = {common[i][0] for i in _longest_increasing_subsequence([d for _, d in common])}
+    
+    moved = [
+        {"selector": focus_order[j], "dom_position": d, "focus_position": j}
+        for j, d in common if j not in in_order
+    ]
+    missing = [
+        {"selector": dom_order[i], "dom_position": i}
+        for i, key in enumerate(dom_keys) if key not in focus_index
+    ]
+    extra = [
+        {"selector": focus_order[j], "focus_position": j}
+        for j, key in enumerate(focus_keys) if key not in dom_index
+    ]
     
-    # Check for length differences
-    if len(dom_order) != len(focus_order):
+    discrepancies = []
+    for run in _group_runs(moved, ("dom_position", "focus_position")):
         discrepancies.append({
-            "type": "length_mismatch",
-            "dom_count": len(dom_order),
-            "focus_count": len(focus_order)
+            "type": "moved",
+            "selectors": [m["selector"] for m in run],
+            "dom_position": run[0]["dom_position"],
+            "focus_position": run[0]["focus_position"]
+        })
+    for run in _group_runs(missing, ("dom_position",)):
+        discrepancies.append({
+            "type": "missing",
+            "selectors": [m["selector"] for m in run],
+            "dom_position": run[0]["dom_position"]
+        })
+    for run in _group_runs(extra, ("focus_position",)):
+        discrepancies.append({
+            "type": "extra",
+            "selectors": [m["selector"] for m in run],
+            "focus_position": run[0]["focus_position"]
         })
     
     return {
         "matches": len(discrepancies) == 0,
-        "discrepancies": discrepancies
+        "discrepancies": discrepancies,
+        "summary": {
+            "in_order": len(in_order),
+            "moved": len(moved),
+            "missing": len(missing),
+            "extra": len(extra)
+        }
     }
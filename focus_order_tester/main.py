@@ -11,15 +11,38 @@ import argparse
 import asyncio
 import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional
 
 from .url_handler import parse_urls, read_urls_from_file, validate_url
+from dataclasses import asdict
+
+from .browser_session import BrowserSession, ContextPool
+from .resource_blocker import ResourceBlocker
+from .readiness import ReadinessConfig, parse_policy, parse_rule
+from .result_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_ENTRIES, ResultCache
 from .axe_runner import AxeRunner, run_axe_analysis
-from .focus_tracer import trace_focus_path
-from .trigger_tracker import TriggerTracker
+from .focus_events import DEFAULT_FOCUS_TIMEOUT_MS, FIXED_SLEEP_MS, FocusWaitStats
+from .focus_tracer import (
+    DEFAULT_BATCH_SIZE, TRACE_MODES, FocusTracer, build_trace_result, primary_trap, trace_focus_path
+)
+from .trigger_tracker import (
+    DEFAULT_TRIGGER_BUDGET, DEFAULT_TRIGGER_CACHE_HOURS, DEFAULT_TRIGGER_CONCURRENCY, TriggerCache, TriggerTracker
+)
+from .sharding import process_urls_sharded
 from .report_generator import generate_json_report, generate_html_report, generate_md_report
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command line arguments.
@@ -87,116 +110,815 @@ Examples:
         help="Trace focus after clicking trigger elements (for F85 detection)"
     )
     
+    parser.add_argument(
+        "--trigger-budget",
+        type=int,
+        default=DEFAULT_TRIGGER_BUDGET,
+        metavar="N",
+        help=f"Triggers tested per page, 0 for all (default: {DEFAULT_TRIGGER_BUDGET})"
+    )
+    
+    parser.add_argument(
+        "--trigger-concurrency",
+        type=_positive_int,
+        default=DEFAULT_TRIGGER_CONCURRENCY,
+        metavar="N",
+        help=f"Pages per URL testing triggers at once (default: {DEFAULT_TRIGGER_CONCURRENCY})"
+    )
+    
+    parser.add_argument(
+        "--trigger-confirm",
+        action="store_true",
+        help="Confirm short non-adjacent trigger-to-dialog distances by pressing Tab"
+    )
+    
+    parser.add_argument(
+        "--no-trigger-reuse",
+        dest="trigger_reuse",
+        action="store_false",
+        help="Click every trigger, even ones identical to a trigger tested on an earlier page"
+    )
+    
+    parser.add_argument(
+        "--trace-mode",
+        choices=TRACE_MODES,
+        default="keyboard",
+        help="How --trace-focus finds the focus path: press Tab per element "
+             "(keyboard), compute it in the page (analytic), compute it "
+             "and verify its boundaries with Tab (hybrid), or press Tab in "
+             "bursts and read an in-page focus log (batched)"
+    )
+    
+    parser.add_argument(
+        "--trace-reverse",
+        action="store_true",
+        help="Also trace --trace-focus with Shift+Tab, concurrently in a second "
+             "page, and report where it is not the exact reverse of Tab"
+    )
+    
+    parser.add_argument(
+        "--trace-batch",
+        dest="trace_batch_size",
+        type=_positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        metavar="K",
+        help=f"Tab presses per burst in batched trace mode (default: {DEFAULT_BATCH_SIZE})"
+    )
+    
+    parser.add_argument(
+        "--focus-timeout",
+        dest="focus_timeout_ms",
+        type=float,
+        default=DEFAULT_FOCUS_TIMEOUT_MS,
+        metavar="MS",
+        help=f"Longest wait for focus to move after a Tab press (default: {DEFAULT_FOCUS_TIMEOUT_MS})"
+    )
+    
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of URLs to process concurrently (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Load each URL once and run all analysis phases on that page"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of OS processes to shard the URL list across (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--max-contexts",
+        type=int,
+        default=None,
+        help="Maximum live browser contexts (default: same as --concurrency)"
+    )
+    
+    parser.add_argument(
+        "--context-pages",
+        dest="pages_per_context",
+        type=int,
+        default=50,
+        help="Recycle a browser context after this many URLs, 0 to disable (default: 50)"
+    )
+    
+    parser.add_argument(
+        "--browser-pages",
+        dest="pages_per_browser",
+        type=int,
+        default=1000,
+        help="Relaunch the browser after this many URLs, 0 to disable (default: 1000)"
+    )
+    
+    parser.add_argument(
+        "--browser-rss-mb",
+        dest="rss_limit_mb",
+        type=float,
+        default=None,
+        help="Relaunch the browser when its memory use exceeds this many MB"
+    )
+    
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Skip images, media, web fonts and analytics/ad requests"
+    )
+    
+    parser.add_argument(
+        "--block-domain",
+        dest="block_domains",
+        action="append",
+        default=None,
+        metavar="DOMAIN",
+        help="Extra domain to block with --block-resources (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--readiness",
+        type=parse_policy,
+        default=None,
+        metavar="POLICY",
+        help="When a page is ready: domcontentloaded, load, networkidle, "
+             "dom-quiet[:MS], network-quiet[:MS] or selector:CSS"
+    )
+    
+    parser.add_argument(
+        "--readiness-rule",
+        dest="readiness_rules",
+        type=parse_rule,
+        action="append",
+        default=None,
+        metavar="PATTERN=POLICY",
+        help="Readiness policy for URLs matching a glob pattern (repeatable)"
+    )
+    
+    parser.add_argument(
+        "--readiness-timeout",
+        type=float,
+        default=10000,
+        metavar="MS",
+        help="Hard cap on readiness waits in milliseconds (default: 10000)"
+    )
+    
+    parser.add_argument(
+        "--axe-cdn-fallback",
+        dest="allow_cdn",
+        action="store_true",
+        help="Load axe-core from the CDN if the bundled lib/axe.min.js is missing"
+    )
+    
+    parser.add_argument(
+        "--axe-full-results",
+        dest="axe_lean",
+        action="store_false",
+        help="Transfer the complete axe-core result instead of trimmed violations"
+    )
+    
+    parser.add_argument(
+        "--axe-max-nodes",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Report at most N nodes per axe rule"
+    )
+    
+    parser.add_argument(
+        "--axe-max-html",
+        dest="axe_max_html_length",
+        type=int,
+        default=None,
+        metavar="CHARS",
+        help="Truncate each reported node's HTML to CHARS characters"
+    )
+    
+    parser.add_argument(
+        "--cache",
+        dest="cache_path",
+        default=str(DEFAULT_CACHE_PATH),
+        metavar="PATH",
+        help=f"Result cache file for unchanged pages (default: {DEFAULT_CACHE_PATH})"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Analyze every page even if an identical one is cached"
+    )
+    
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        metavar="N",
+        help=f"Maximum cached results before least recently used are evicted (default: {DEFAULT_MAX_ENTRIES})"
+    )
+    
+    parser.add_argument(
+        "--cache-focus-trace",
+        action="store_true",
+        help="Also reuse cached focus traces for unchanged pages"
+    )
+    
+    parser.add_argument(
+        "--cache-triggers",
+        action="store_true",
+        help="Keep trigger results in the result cache for later runs"
+    )
+    
+    parser.add_argument(
+        "--trigger-cache-hours",
+        type=float,
+        default=DEFAULT_TRIGGER_CACHE_HOURS,
+        metavar="HOURS",
+        help=f"Test cached triggers again after HOURS (default: {DEFAULT_TRIGGER_CACHE_HOURS})"
+    )
+    
     return parser.parse_args(args)
 
 
+def _append_error(result: Dict[str, Any], error_msg: str) -> None:
+    """Record a phase error on a result without discarding earlier ones"""
+    result["error"] = error_msg if not result["error"] else f"{result['error']}; {error_msg}"
+    print(f"⚠️ {error_msg}")
+
+
+def _new_result(url: str) -> Dict[str, Any]:
+    """Create an empty result dict for a URL"""
+    return {
+        "url": url,
+        "timestamp": datetime.now().isoformat(),
+        "violations": [],
+        "violation_count": 0,
+        "error": None
+    }
+
+
+def _record_axe_violations(result: Dict[str, Any], violations: List[Any]) -> None:
+    """Store axe-core violations on a result"""
+    result["violations"] = [
+        {
+            "rule_id": v.rule_id,
+            "description": v.description,
+            "impact": v.impact,
+            "help_url": v.help_url,
+            "nodes": v.nodes,
+            "omitted_nodes": v.omitted_nodes
+        }
+        for v in violations
+    ]
+    result["violation_count"] += len(violations)
+
+
+def _record_focus_trace(result: Dict[str, Any], trace_result: Dict[str, Any]) -> None:
+    """Store a focus path trace on a result"""
+    result["focus_path"] = trace_result.get("focus_path", [])
+    result["focus_element_count"] = trace_result.get("element_count", 0)
+    if "order_comparison" in trace_result:
+        result["order_comparison"] = trace_result["order_comparison"]
+    if "reverse_comparison" in trace_result:
+        result["reverse_comparison"] = trace_result["reverse_comparison"]
+    
+    trace_violations = trace_result.get("violations", [])
+    result["violations"].extend(trace_violations)
+    result["violation_count"] += len(trace_violations)
+
+
+def _record_trigger_results(result: Dict[str, Any], trigger_results: List[Any]) -> None:
+    """Store trigger click analysis and any F85 violations on a result"""
+    result["trigger_results"] = [
+        {
+            "trigger": r.trigger_selector,
+            "trigger_text": r.trigger_text,
+            "dialog": r.dialog_selector,
+            "distance": r.distance,
+            "is_adjacent": r.is_adjacent,
+            "f85_violation": r.f85_violation,
+            "open_latency_ms": r.open_latency_ms,
+            "from_cache": r.from_cache,
+            "tested_on": r.tested_on,
+            "focus_path": [
+                {"tag": e.tag_name, "text": e.text_content} 
+                for e in r.focus_path_after_click
+            ]
+        }
+        for r in trigger_results
+    ]
+    
+    # Add specific F85 violation if detected
+    for r in trigger_results:
+        if r.f85_violation:
+            result["violations"].append({
+                "rule_id": "wcag243-f85-dialog-position",
+                "impact": "serious",
+                "description": f"Focus Order Failure (F85): Dialog '{r.dialog_selector}' is not adjacent to trigger '{r.trigger_selector}' in focus order."
+                    + (f" Measured on {r.tested_on}, which has the same trigger." if r.from_cache else ""),
+                "help_url": "https://www.w3.org/WAI/WCAG21/Techniques/failures/F85",
+                "nodes": [{"html": f"<button>{r.trigger_text}</button> ... <dialog>..."}]
+            })
+            result["violation_count"] += 1
+
+
+async def _process_url(
+    session: BrowserSession,
+    runner: AxeRunner,
+    context: Any,
+    url: str,
+    trace_focus: bool = False,
+    trace_triggers: bool = False,
+    readiness: Optional[ReadinessConfig] = None,
+    focus_cache: Optional[ResultCache] = None,
+    trace_mode: str = "keyboard",
+    focus_timeout_ms: float = DEFAULT_FOCUS_TIMEOUT_MS,
+    focus_stats: Optional[FocusWaitStats] = None,
+    trace_batch_size: int = DEFAULT_BATCH_SIZE,
+    trace_reverse: bool = False,
+    trigger_budget: int = DEFAULT_TRIGGER_BUDGET,
+    trigger_concurrency: int = DEFAULT_TRIGGER_CONCURRENCY,
+    trigger_confirm: bool = False,
+    trigger_cache: Optional[TriggerCache] = None
+) -> Dict[str, Any]:
+    """
+    Run every enabled analysis phase against a single URL.
+    
+    Each phase is isolated: a failure is recorded in the result's
+    error field and the remaining phases still run. All phases share
+    the run's browser session and the worker's context, but each phase
+    navigates to the URL on its own page.
+    
+    Args:
+        session: Shared browser session for the run
+        runner: Active AxeRunner on the shared session
+        context: Browser context owned by the calling worker
+        url: URL to test
+        trace_focus: Whether to include focus path tracing
+        trace_triggers: Whether to include click trigger tracking (F85)
+        readiness: Optional page readiness configuration for every phase
+        focus_cache: Optional result cache for focus traces
+        trace_mode: Focus trace mode, one of TRACE_MODES
+        focus_timeout_ms: Longest wait for focus to move after a Tab press
+        focus_stats: Optional stats that receive the per-step focus waits
+        trace_batch_size: Tab presses per burst in batched trace mode
+        trace_reverse: Also trace with Shift+Tab and compare the paths
+        trigger_budget: Triggers tested per page (0 = all)
+        trigger_concurrency: Pages testing triggers at once
+        trigger_confirm: Confirm borderline F85 distances with Tab presses
+        trigger_cache: Optional run-wide results of already tested triggers
+        
+    Returns:
+        Result dict for the URL
+    """
+    result = _new_result(url)
+    
+    # Axe Analysis
+    try:
+        timings: Dict[str, Any] = {}
+        violations = await runner.analyze(url, context=context, timings=timings)
+        result.update(timings)
+        _record_axe_violations(result, violations)
+    except Exception as e:
+        # Capture Axe error but continue to other checks
+        _append_error(result, f"Axe analysis failed: {str(e)}")
+
+    # Focus path tracing verification
+    if trace_focus:
+        try:
+            trace_result = await trace_focus_path(
+                url,
+                session=session,
+                context=context,
+                readiness=readiness,
+                cache=focus_cache,
+                mode=trace_mode,
+                focus_timeout_ms=focus_timeout_ms,
+                focus_stats=focus_stats,
+                batch_size=trace_batch_size,
+                bidirectional=trace_reverse
+            )
+            _record_focus_trace(result, trace_result)
+        except Exception as e:
+            _append_error(result, f"Focus tracing failed: {str(e)}")
+    
+    # Trigger tracking (F85)
+    if trace_triggers:
+        try:
+            async with TriggerTracker(
+                session=session,
+                context=context,
+                readiness=readiness,
+                focus_timeout_ms=focus_timeout_ms,
+                focus_stats=focus_stats,
+                trigger_budget=trigger_budget,
+                trigger_concurrency=trigger_concurrency,
+                confirm_distance=trigger_confirm,
+                trigger_cache=trigger_cache
+            ) as tracker:
+                trigger_results = await tracker.analyze_f85(url)
+                _record_trigger_results(result, trigger_results)
+        except Exception as e:
+            _append_error(result, f"Trigger tracking failed: {str(e)}")
+
+    return result
+
+
+async def _process_url_pipeline(
+    session: BrowserSession,
+    runner: AxeRunner,
+    tracer: FocusTracer,
+    context: Any,
+    url: str,
+    trace_focus: bool = False,
+    trace_triggers: bool = False,
+    readiness: Optional[ReadinessConfig] = None,
+    trace_reverse: bool = False,
+    trigger_budget: int = DEFAULT_TRIGGER_BUDGET,
+    trigger_concurrency: int = DEFAULT_TRIGGER_CONCURRENCY,
+    trigger_confirm: bool = False,
+    trigger_cache: Optional[TriggerCache] = None
+) -> Dict[str, Any]:
+    """
+    Run every enabled analysis phase against a single loaded page.
+    
+    The URL is navigated once and the phases run in order of how much
+    they disturb the page: axe (read-only), then the focus trace (moves
+    focus only), then trigger clicks (mutating, restored between
+    triggers by the tracker).
+    
+    Args:
+        session: Shared browser session for the run
+        runner: Active AxeRunner on the shared session
+        tracer: Active FocusTracer on the shared session
+        context: Browser context owned by the calling worker
+        url: URL to test
+        trace_focus: Whether to include focus path tracing
+        trace_triggers: Whether to include click trigger tracking (F85)
+        readiness: Optional page readiness configuration
+        trace_reverse: Also trace with Shift+Tab, in a second page of the
+            same context, and compare the paths
+        trigger_budget: Triggers tested per page (0 = all)
+        trigger_concurrency: Pages testing triggers at once
+        trigger_confirm: Confirm borderline F85 distances with Tab presses
+        trigger_cache: Optional run-wide results of already tested triggers
+        
+    Returns:
+        Result dict for the URL
+    """
+    result = _new_result(url)
+    page = await context.new_page()
+    
+    try:
+        try:
+            ready = await (readiness or ReadinessConfig()).navigate(page, url)
+            result["readiness"] = asdict(ready)
+        except Exception as e:
+            _append_error(result, f"Navigation failed: {str(e)}")
+            return result
+        
+        try:
+            violations = await runner.analyze_page(page)
+            _record_axe_violations(result, violations)
+        except Exception as e:
+            _append_error(result, f"Axe analysis failed: {str(e)}")
+        
+        if trace_focus:
+            try:
+                dom_order: List[Any] = []
+                traps: List[Any] = []
+                reverse_path = None
+                if trace_reverse:
+                    focus_path, reverse_path = await tracer.trace_page_bidirectional(
+                        page, dom_order=dom_order, traps=traps
+                    )
+                else:
+                    focus_path = await tracer.trace_page(page, dom_order=dom_order, traps=traps)
+                _record_focus_trace(result, build_trace_result(
+                    url,
+                    focus_path,
+                    dom_order,
+                    truncated=tracer.reached_limit(focus_path),
+                    trap=primary_trap(traps),
+                    reverse_path=reverse_path,
+                    reverse_truncated=reverse_path is not None and tracer.reached_limit(
+                        reverse_path, reverse=True
+                    )
+                ))
+            except Exception as e:
+                _append_error(result, f"Focus tracing failed: {str(e)}")
+        
+        if trace_triggers:
+            try:
+                async with TriggerTracker(
+                    session=session,
+                    context=context,
+                    readiness=readiness,
+                    focus_timeout_ms=tracer.focus_timeout_ms,
+                    focus_stats=tracer.focus_stats,
+                    trigger_budget=trigger_budget,
+                    trigger_concurrency=trigger_concurrency,
+                    confirm_distance=trigger_confirm,
+                    trigger_cache=trigger_cache
+                ) as tracker:
+                    # Navigation already waited for readiness
+                    trigger_results = await tracker.analyze_page(page, ready=True)
+                    _record_trigger_results(result, trigger_results)
+            except Exception as e:
+                _append_error(result, f"Trigger tracking failed: {str(e)}")
+    finally:
+        await page.close()
+    
+    return result
+
+
 async def process_urls(
     urls: List[str],
     headless: bool = True,
     trace_focus: bool = False,
-    trace_triggers: bool = False
+    trace_triggers: bool = False,
+    concurrency: int = 1,
+    pipeline: bool = False,
+    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+    max_contexts: Optional[int] = None,
+    pages_per_context: int = 50,
+    pages_per_browser: int = 1000,
+    rss_limit_mb: Optional[float] = None,
+    block_resources: bool = False,
+    block_domains: Optional[List[str]] = None,
+    readiness: Optional[ReadinessConfig] = None,
+    allow_cdn: bool = False,
+    axe_lean: bool = True,
+    axe_max_nodes: Optional[int] = None,
+    axe_max_html_length: Optional[int] = None,
+    cache_path: Optional[str] = None,
+    cache_size: int = DEFAULT_MAX_ENTRIES,
+    cache_focus_trace: bool = False,
+    trace_mode: str = "keyboard",
+    focus_timeout_ms: float = DEFAULT_FOCUS_TIMEOUT_MS,
+    trace_batch_size: int = DEFAULT_BATCH_SIZE,
+    trace_reverse: bool = False,
+    trigger_budget: int = DEFAULT_TRIGGER_BUDGET,
+    trigger_concurrency: int = DEFAULT_TRIGGER_CONCURRENCY,
+    trigger_confirm: bool = False,
+    trigger_reuse: bool = True,
+    cache_triggers: bool = False,
+    trigger_cache_hours: float = DEFAULT_TRIGGER_CACHE_HOURS,
+    stats: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     """
     Process multiple URLs for focus order testing.
     
+    URLs are pulled from a shared queue by a bounded pool of workers.
+    A single browser is launched for the whole run and shared by every
+    analyzer. Each worker leases a browser context from a ContextPool for
+    every URL, so pages of concurrent workers never share cookies or
+    storage, and contexts and the browser are recycled to bound memory.
+    
     Args:
-        urls: List of URLs to test
-        headless: Whether to run browser in headless mode
         urls: List of URLs to test
         headless: Whether to run browser in headless mode
         trace_focus: Whether to include focus path tracing
         trace_triggers: Whether to include click trigger tracking (F85)
+        concurrency: Number of URLs processed at the same time
+        pipeline: Load each URL once and run all phases on that page
+        on_result: Optional callback invoked with (index, result) as soon
+            as each URL finishes, for streaming results out of the run
+        max_contexts: Maximum live browser contexts (defaults to concurrency)
+        pages_per_context: Recycle a context after this many URLs (0 = never)
+        pages_per_browser: Relaunch the browser after this many URLs (0 = never)
+        rss_limit_mb: Relaunch the browser when its RSS exceeds this many MB
+        block_resources: Abort images, media, fonts and analytics/ad requests
+        block_domains: Extra domains to add to the blocking denylist
+        readiness: Page readiness policies (defaults to each analyzer's own
+            load state)
+        allow_cdn: Load axe-core from the CDN if the local bundle is missing
+        axe_lean: Trim axe results in the page to the reported fields
+        axe_max_nodes: Maximum nodes reported per axe rule
+        axe_max_html_length: Maximum length of each reported node's HTML
+        cache_path: Result cache file; pages whose normalized DOM matches
+            a cached entry skip axe (None disables caching)
+        cache_size: Maximum cached results before LRU eviction
+        cache_focus_trace: Also cache focus traces
+        trace_mode: Focus trace mode, one of TRACE_MODES
+        focus_timeout_ms: Longest wait for focus to move after a Tab press
+        trace_batch_size: Tab presses per burst in batched trace mode
+        trace_reverse: Also trace with Shift+Tab and compare the paths
+        trigger_budget: Triggers tested per page (0 = all)
+        trigger_concurrency: Pages per URL testing triggers at once
+        trigger_confirm: Confirm borderline F85 distances with Tab presses
+        trigger_reuse: Test each distinct trigger component once per run and
+            reuse its result on other pages
+        cache_triggers: Also keep trigger results in the result cache
+        trigger_cache_hours: Age after which cached trigger results expire
+        stats: Optional dict that receives run statistics
         
     Returns:
-        List of results for each URL
+        List of results for each URL, in input order
     """
-    results = []
-    
-    async with AxeRunner(headless=headless) as runner:
-        for url in urls:
-            result = {
-                "url": url,
-                "timestamp": datetime.now().isoformat(),
-                "violations": [],
-                "violation_count": 0,
-                "error": None
-            }
-            
-            # Axe Analysis
-            try:
-                violations = await runner.analyze(url)
-                result["violations"] = [
-                    {
-                        "rule_id": v.rule_id,
-                        "description": v.description,
-                        "impact": v.impact,
-                        "help_url": v.help_url,
-                        "nodes": v.nodes
-                    }
-                    for v in violations
-                ]
-                result["violation_count"] += len(violations)
-            except Exception as e:
-                # Capture Axe error but continue to other checks
-                error_msg = f"Axe analysis failed: {str(e)}"
-                result["error"] = error_msg if not result["error"] else f"{result['error']}; {error_msg}"
-                print(f"⚠️ {error_msg}")
-
-            # Focus path tracing verification
-            if trace_focus:
+    results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, url in enumerate(urls):
+        queue.put_nowait((index, url))
+    
+    blocker = ResourceBlocker(extra_domains=block_domains) if block_resources else None
+    cache = ResultCache(cache_path, max_entries=cache_size) if cache_path else None
+    focus_cache = cache if cache_focus_trace else None
+    focus_stats = FocusWaitStats()
+    trigger_cache = None
+    if trace_triggers and trigger_reuse:
+        # A connection of its own keeps trigger lookups out of the page
+        # result cache's hit rate
+        trigger_store = ResultCache(cache_path, max_entries=cache_size) if cache_path and cache_triggers else None
+        trigger_cache = TriggerCache(trigger_store, config=[trigger_confirm], max_age_hours=trigger_cache_hours)
+    
+    async with BrowserSession(headless=headless, resource_blocker=blocker) as session, \
+            AxeRunner(
+                session=session,
+                readiness=readiness,
+                allow_cdn=allow_cdn,
+                lean=axe_lean,
+                max_nodes=axe_max_nodes,
+                max_html_length=axe_max_html_length,
+                cache=cache
+            ) as runner, \
+            FocusTracer(
+                session=session,
+                readiness=readiness,
+                cache=focus_cache,
+                mode=trace_mode,
+                focus_timeout_ms=focus_timeout_ms,
+                focus_stats=focus_stats,
+                batch_size=trace_batch_size
+            ) as tracer:
+        pool = ContextPool(
+            session,
+            max_contexts=max_contexts or concurrency,
+            pages_per_context=pages_per_context,
+            pages_per_browser=pages_per_browser,
+            rss_limit_mb=rss_limit_mb,
+            context_factory=runner.new_context
+        )
+        
+        async def worker() -> None:
+            while True:
                 try:
-                    trace_result = await trace_focus_path(url, headless=headless)
-                    result["focus_path"] = trace_result.get("focus_path", [])
-                    result["focus_element_count"] = trace_result.get("element_count", 0)
+                    index, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                try:
+                    context = await pool.acquire()
                 except Exception as e:
-                     error_msg = f"Focus tracing failed: {str(e)}"
-                     result["error"] = error_msg if not result["error"] else f"{result['error']}; {error_msg}"
-                     print(f"⚠️ {error_msg}")
-            
-            # Trigger tracking (F85)
-            if trace_triggers:
+                    result = _new_result(url)
+                    _append_error(result, f"Context creation failed: {str(e)}")
+                    results[index] = result
+                    if on_result:
+                        on_result(index, result)
+                    continue
+                
+                broken = False
                 try:
-                    async with TriggerTracker(headless=headless) as tracker:
-                        trigger_results = await tracker.analyze_f85(url)
-                        result["trigger_results"] = [
-                            {
-                                "trigger": r.trigger_selector,
-                                "trigger_text": r.trigger_text,
-                                "dialog": r.dialog_selector,
-                                "distance": r.distance,
-                                "is_adjacent": r.is_adjacent,
-                                "f85_violation": r.f85_violation,
-                                "focus_path": [
-                                    {"tag": e.tag_name, "text": e.text_content} 
-                                    for e in r.focus_path_after_click
-                                ]
-                            }
-                            for r in trigger_results
-                        ]
-                        
-                        # Add specific F85 violation if detected
-                        for r in trigger_results:
-                            if r.f85_violation:
-                                result["violations"].append({
-                                    "rule_id": "wcag243-f85-dialog-position",
-                                    "impact": "serious",
-                                    "description": f"Focus Order Failure (F85): Dialog '{r.dialog_selector}' is not adjacent to trigger '{r.trigger_selector}' in focus order.",
-                                    "help_url": "https://www.w3.org/WAI/WCAG21/Techniques/failures/F85",
-                                    "nodes": [{"html": f"<button>{r.trigger_text}</button> ... <dialog>..."}]
-                                })
-                                result["violation_count"] += 1
+                    if pipeline:
+                        result = await _process_url_pipeline(
+                            session,
+                            runner,
+                            tracer,
+                            context,
+                            url,
+                            trace_focus=trace_focus,
+                            trace_triggers=trace_triggers,
+                            readiness=readiness,
+                            trace_reverse=trace_reverse,
+                            trigger_budget=trigger_budget,
+                            trigger_concurrency=trigger_concurrency,
+                            trigger_confirm=trigger_confirm,
+                            trigger_cache=trigger_cache
+                        )
+                    else:
+                        result = await _process_url(
+                            session,
+                            runner,
+                            context,
+                            url,
+                            trace_focus=trace_focus,
+                            trace_triggers=trace_triggers,
+                            readiness=readiness,
+                            focus_cache=focus_cache,
+                            trace_mode=trace_mode,
+                            focus_timeout_ms=focus_timeout_ms,
+                            focus_stats=focus_stats,
+                            trace_batch_size=trace_batch_size,
+                            trace_reverse=trace_reverse,
+                            trigger_budget=trigger_budget,
+                            trigger_concurrency=trigger_concurrency,
+                            trigger_confirm=trigger_confirm,
+                            trigger_cache=trigger_cache
+                        )
                 except Exception as e:
-                     error_msg = f"Trigger tracking failed: {str(e)}"
-                     result["error"] = error_msg if not result["error"] else f"{result['error']}; {error_msg}"
-                     print(f"⚠️ {error_msg}")
-
-            results.append(result)
-            print(f"✓ Processed: {url} ({result.get('violation_count', 0)} violations)")
+                    # Phase errors are recorded per phase; anything reaching
+                    # here (e.g. page creation) may have broken the context
+                    broken = True
+                    result = _new_result(url)
+                    _append_error(result, f"Processing failed: {str(e)}")
+                finally:
+                    await pool.release(context, broken=broken)
+                
+                results[index] = result
+                if on_result:
+                    on_result(index, result)
+                print(f"✓ Processed: {url} ({result.get('violation_count', 0)} violations)")
+        
+        worker_count = max(1, min(concurrency, len(urls)))
+        try:
+            outcomes = await asyncio.gather(
+                *(worker() for _ in range(worker_count)), return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    print(f"⚠️ Worker stopped: {str(outcome)}")
+        finally:
+            await pool.close()
+            if cache is not None:
+                cache.close()
+            if trigger_cache is not None and trigger_cache.store is not None:
+                trigger_cache.store.close()
+        
+        if stats is not None:
+            stats["context_pool"] = asdict(pool.stats)
+            if blocker:
+                stats["blocked_resources"] = asdict(blocker.stats)
+            if cache is not None:
+                stats["result_cache"] = asdict(cache.stats)
+            if focus_stats.steps:
+                stats["focus_waits"] = asdict(focus_stats)
+            if trigger_cache is not None:
+                stats["trigger_cache"] = asdict(trigger_cache.stats)
     
     return results
 
 
 
+def _build_readiness(parsed: argparse.Namespace) -> Optional[ReadinessConfig]:
+    """Build a readiness config from CLI options, or None for analyzer defaults"""
+    if not parsed.readiness and not parsed.readiness_rules:
+        return None
+    return ReadinessConfig(
+        default=parsed.readiness,
+        rules=parsed.readiness_rules,
+        timeout_ms=parsed.readiness_timeout
+    )
+
+
+def _print_run_stats(stats: Dict[str, Any]) -> None:
+    """Print the run statistics collected by process_urls"""
+    pool = stats.get("context_pool")
+    if pool:
+        print(
+            f"   Browser contexts: {pool['contexts_created']} created, "
+            f"{pool['contexts_recycled']} recycled, "
+            f"peak {pool['peak_live_contexts']} live"
+        )
+        if pool.get("browser_relaunches"):
+            print(f"   Browser relaunches: {pool['browser_relaunches']}")
+    
+    blocked = stats.get("blocked_resources")
+    if blocked:
+        kinds = {**blocked.get("by_type", {}), **blocked.get("by_domain", {})}
+        breakdown = ", ".join(f"{k}: {v}" for k, v in sorted(kinds.items(), key=lambda kv: -kv[1]))
+        print(
+            f"   Blocked requests: {blocked['requests_blocked']} of "
+            f"{blocked['requests_blocked'] + blocked['requests_allowed']}"
+            + (f" ({breakdown})" if breakdown else "")
+        )
+    
+    cache = stats.get("result_cache")
+    if cache:
+        lookups = cache["hits"] + cache["misses"]
+        rate = cache["hits"] / lookups * 100 if lookups else 0.0
+        print(f"   Result cache: {cache['hits']} hits of {lookups} lookups ({rate:.1f}%)")
+    
+    waits = stats.get("focus_waits")
+    if waits:
+        average = waits["wait_ms"] / waits["steps"]
+        print(
+            f"   Focus waits: {waits['steps']} Tab presses, {average:.1f} ms average "
+            f"(fixed sleep: {FIXED_SLEEP_MS} ms), {waits['timeouts']} timed out"
+        )
+    
+    triggers = stats.get("trigger_cache")
+    if triggers:
+        print(
+            f"   Triggers: {triggers['tested']} tested, "
+            f"{triggers['skipped']} skipped as seen on an earlier page"
+        )
+
+
 async def main(args: Optional[List[str]] = None) -> None:
     """
     Main entry point for the focus order tester.
@@ -224,12 +946,42 @@ async def main(args: Optional[List[str]] = None) -> None:
     print(f"\n🔍 Testing {len(urls)} URL(s) for WCAG SC 2.4.3 Focus Order...\n")
     
     # Process URLs
-    results = await process_urls(
-        urls,
-        headless=parsed.headless,
-        trace_focus=getattr(parsed, 'trace_focus', False),
-        trace_triggers=getattr(parsed, 'trace_triggers', False)
-    )
+    options = {
+        "headless": parsed.headless,
+        "trace_focus": getattr(parsed, 'trace_focus', False),
+        "trace_triggers": getattr(parsed, 'trace_triggers', False),
+        "concurrency": parsed.concurrency,
+        "pipeline": parsed.pipeline,
+        "max_contexts": parsed.max_contexts,
+        "pages_per_context": parsed.pages_per_context,
+        "pages_per_browser": parsed.pages_per_browser,
+        "rss_limit_mb": parsed.rss_limit_mb,
+        "block_resources": parsed.block_resources,
+        "block_domains": parsed.block_domains,
+        "readiness": _build_readiness(parsed),
+        "allow_cdn": parsed.allow_cdn,
+        "axe_lean": parsed.axe_lean,
+        "axe_max_nodes": parsed.axe_max_nodes,
+        "axe_max_html_length": parsed.axe_max_html_length,
+        "cache_path": parsed.cache_path if parsed.use_cache else None,
+        "cache_size": parsed.cache_size,
+        "cache_focus_trace": parsed.cache_focus_trace,
+        "trace_mode": parsed.trace_mode,
+        "focus_timeout_ms": parsed.focus_timeout_ms,
+        "trace_batch_size": parsed.trace_batch_size,
+        "trace_reverse": parsed.trace_reverse,
+        "trigger_budget": parsed.trigger_budget,
+        "trigger_concurrency": parsed.trigger_concurrency,
+        "trigger_confirm": parsed.trigger_confirm,
+        "trigger_reuse": parsed.trigger_reuse,
+        "cache_triggers": parsed.cache_triggers,
+        "trigger_cache_hours": parsed.trigger_cache_hours
+    }
+    stats: Dict[str, Any] = {}
+    if parsed.workers > 1:
+        results = await process_urls_sharded(urls, workers=parsed.workers, stats=stats, **options)
+    else:
+        results = await process_urls(urls, stats=stats, **options)
     
     # Generate report
     if parsed.format == "html":
@@ -247,6 +999,7 @@ async def main(args: Optional[List[str]] = None) -> None:
     print(f"   Total pages: {len(results)}")
     print(f"   Pages with violations: {pages_with_issues}")
     print(f"   Total violations: {violations_count}")
+    _print_run_stats(stats)
     
     if parsed.output:
         print(f"\n📄 Report saved to: {parsed.output}")
@@ -0,0 +1,218 @@
+"""
+Page Scripts Module for Focus Order Tester
+
+In-page JavaScript helpers shared by the analyzers. Each is a block of
+statements, concatenated into the scripts passed to page.evaluate.
+"""
+
+
+# Binds `identity`, installed once per document: uid(el) numbers elements
+# on first sight through a WeakMap (nothing is written to the DOM), path(el)
+# builds a CSS selector that matches only el within its document or shadow
+# root, contextPath(el) lists the selectors of the iframes and shadow hosts
+# enclosing el from the top document down, active() resolves the focused
+# element through open shadow roots and same-origin frames, and describe(el)
+# returns the FocusElement fields plus whether el is opaque (a cross-origin
+# frame or likely closed shadow host, whose Tab stops all report el).
+# Prepended to every script that reports elements.
+IDENTITY_JS = """
+        const identity = window.__focusOrderTesterIdentity || (window.__focusOrderTesterIdentity = (() => {
+            const ids = new WeakMap();
+            let next = 0;
+            const uid = el => {
+                if (!ids.has(el)) ids.set(el, ++next);
+                return ids.get(el);
+            };
+            const uniqueId = (el, root) => el.id &&
+                root.querySelectorAll('#' + CSS.escape(el.id)).length === 1;
+            const path = el => {
+                const root = el.getRootNode();
+                if (uniqueId(el, root)) return '#' + CSS.escape(el.id);
+                const parts = [];
+                for (let node = el; node; node = node.parentElement) {
+                    if (node !== el && uniqueId(node, root)) {
+                        parts.unshift('#' + CSS.escape(node.id));
+                        break;
+                    }
+                    if (node === node.ownerDocument.documentElement) {
+                        parts.unshift(node.localName);
+                        break;
+                    }
+                    let nth = 1;
+                    for (let s = node.previousElementSibling; s; s = s.previousElementSibling) {
+                        if (s.tagName === node.tagName) nth++;
+                    }
+                    parts.unshift(node.localName + ':nth-of-type(' + nth + ')');
+                }
+                return parts.join(' > ');
+            };
+            // instanceof would fail for nodes of other frames' realms
+            const contextPath = el => {
+                const hosts = [];
+                for (let node = el; ;) {
+                    const root = node.getRootNode();
+                    if (root.host) {
+                        node = root.host;
+                    } else if (root !== document && root.defaultView && root.defaultView.frameElement) {
+                        node = root.defaultView.frameElement;
+                    } else {
+                        return hosts;
+                    }
+                    hosts.unshift(path(node));
+                }
+            };
+            const active = () => {
+                let el = document.activeElement;
+                while (el) {
+                    if (el.shadowRoot && el.shadowRoot.activeElement) {
+                        el = el.shadowRoot.activeElement;
+                        continue;
+                    }
+                    const doc = el.contentDocument;
+                    if (doc && doc.activeElement && doc.activeElement !== doc.body) {
+                        el = doc.activeElement;
+                        continue;
+                    }
+                    return el;
+                }
+                return null;
+            };
+            // Focus inside a cross-origin frame or a closed shadow root is
+            // reported on the frame or host, which cannot be looked into
+            const opaque = el => (el.tagName === 'IFRAME' || el.tagName === 'FRAME') ? !el.contentDocument :
+                !el.shadowRoot && (el.localName.includes('-') || (el.tabIndex < 0 && !el.hasAttribute('tabindex')));
+            const describe = el => ({
+                uid: uid(el),
+                opaque: opaque(el),
+                tagName: el.tagName.toLowerCase(),
+                selector: path(el),
+                contextPath: contextPath(el),
+                textContent: (el.textContent || '').trim().slice(0, 100),
+                tabIndex: el.tabIndex,
+                role: el.getAttribute('role'),
+                ariaLabel: el.getAttribute('aria-label')
+            });
+            return {uid, path, contextPath, active, describe};
+        })());
+"""
+
+# Binds `focusScope`, `flatOrder` and `tabOrder`. focusScope() collects, in
+# one walk of the flat tree, every element that takes part in sequential
+# focus navigation: elements with tabindex >= 0 or natively focusable,
+# minus hidden, disabled and inert ones, and minus every radio button of a
+# group but the checked (or first). Open shadow roots, slots and
+# same-origin frames are walked in place and become nested scopes, as in
+# the HTML spec's focus navigation scopes. flatOrder(scope) lists the
+# {el, tabIndex} entries in flat tree order, tabOrder(scope) lists the
+# elements in sequential navigation order: per scope, positive tabindex
+# ascending, then the rest in tree order.
+FOCUSABLES_JS = """
+        const NATIVE = 'a[href], area[href], button, input:not([type="hidden"]), select, ' +
+            'textarea, iframe, audio[controls], video[controls], ' +
+            '[contenteditable]:not([contenteditable="false"])';
+        
+        const styleOf = el => el.ownerDocument.defaultView.getComputedStyle(el);
+        
+        const rejectSubtree = el => {
+            if (el.hasAttribute('inert')) return true;
+            const parent = el.parentElement;
+            // Content of a closed <details> is not rendered, its summary is
+            if (parent && parent.tagName === 'DETAILS' && !parent.open &&
+                parent.querySelector(':scope > summary') !== el) return true;
+            return styleOf(el).display === 'none';
+        };
+        
+        const tabIndexOf = el => {
+            const attr = el.getAttribute('tabindex');
+            const value = attr === null ? NaN : parseInt(attr, 10);
+            if (!Number.isNaN(value)) return value;
+            if (el.matches(NATIVE)) return 0;
+            const parent = el.parentElement;
+            if (el.tagName === 'SUMMARY' && parent && parent.tagName === 'DETAILS' &&
+                parent.querySelector(':scope > summary') === el) return 0;
+            return null;
+        };
+        
+        const isFocusable = (el, tabIndex) => tabIndex !== null && tabIndex >= 0 &&
+            !el.matches(':disabled') && styleOf(el).visibility === 'visible' &&
+            el.getClientRects().length > 0;
+        
+        // Elements a scope owner renders in place of its light DOM children
+        const scopeRoots = el => {
+            if (el.shadowRoot) return Array.from(el.shadowRoot.children);
+            if (el.tagName === 'SLOT') {
+                const assigned = el.assignedElements({flatten: true});
+                return assigned.length ? assigned : Array.from(el.children);
+            }
+            const doc = (el.tagName === 'IFRAME' || el.tagName === 'FRAME') && el.contentDocument;
+            return doc ? (doc.body ? [doc.body] : []) : null;
+        };
+        
+        const focusScope = () => {
+            const collect = (roots, items) => {
+                for (const el of roots) {
+                    if (rejectSubtree(el)) continue;
+                    const tabIndex = tabIndexOf(el);
+                    const focusable = isFocusable(el, tabIndex);
+                    const inner = scopeRoots(el);
+                    if (inner === null) {
+                        if (focusable) items.push({el, tabIndex});
+                        collect(el.children, items);
+                    } else if (tabIndex === null || tabIndex >= 0) {
+                        // A negative tabindex takes the whole scope out of
+                        // navigation. A frame is not a stop of its own; a
+                        // host with a tabindex is, before its contents.
+                        const isFrame = !el.shadowRoot && el.tagName !== 'SLOT';
+                        items.push({
+                            el, tabIndex: tabIndex || 0,
+                            own: focusable && !isFrame && el.hasAttribute('tabindex'),
+                            scope: collect(inner, [])
+                        });
+                    }
+                }
+                return items;
+            };
+            return collect([document.body || document.documentElement], []);
+        };
+        
+        // Only one radio button per group takes part in Tab navigation
+        const radioFilter = entries => {
+            const isGroupedRadio = el => el.tagName === 'INPUT' && el.type === 'radio' && el.name;
+            const groups = new Map();
+            const groupOf = el => {
+                const owner = el.form || el.getRootNode();
+                if (!groups.has(owner)) groups.set(owner, new Map());
+                return groups.get(owner);
+            };
+            for (const c of entries) {
+                if (!isGroupedRadio(c.el)) continue;
+                const group = groupOf(c.el);
+                const chosen = group.get(c.el.name);
+                if (!chosen || (c.el.checked && !chosen.el.checked)) group.set(c.el.name, c);
+            }
+            return entries.filter(c => !isGroupedRadio(c.el) || groupOf(c.el).get(c.el.name) === c);
+        };
+        
+        const flatten = (items, out) => {
+            for (const item of items) {
+                if (!item.scope || item.own) out.push({el: item.el, tabIndex: item.tabIndex});
+                if (item.scope) flatten(item.scope, out);
+            }
+            return out;
+        };
+        
+        const flatOrder = scope => radioFilter(flatten(scope, []));
+        
+        const tabOrder = scope => {
+            const kept = new Set(flatOrder(scope).map(c => c.el));
+            const order = (items, out) => {
+                const positive = items.filter(c => c.tabIndex > 0).sort((a, b) => a.tabIndex - b.tabIndex);
+                for (const item of positive.concat(items.filter(c => c.tabIndex === 0))) {
+                    if ((!item.scope || item.own) && kept.has(item.el)) out.push(item.el);
+                    if (item.scope) order(item.scope, out);
+                }
+                return out;
+            };
+            return order(scope, []);
+        };
+"""
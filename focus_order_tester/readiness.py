@@ -0,0 +1,308 @@
+"""
+Readiness Module for Focus Order Tester
+
+Decides when a loaded page is ready to analyze. Policies replace fixed
+wait_until values: DOM mutation quiescence, a selector appearing, network
+quiet that ignores chatty third-party hosts, or a plain load state. Every
+wait is bounded by a hard cap.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any, Iterable, List, Optional, Tuple
+from playwright.async_api import Error as PlaywrightError, Page, Request, TimeoutError as PlaywrightTimeoutError
+
+from .resource_blocker import DEFAULT_BLOCKED_DOMAINS, match_domain
+
+
+# Requests that stay open by design and never let the network go quiet
+_LONG_LIVED_TYPES = frozenset({"eventsource", "websocket"})
+
+# Playwright errors raised when the document being waited on is replaced
+_NAVIGATION_ERRORS = ("Execution context was destroyed", "navigation")
+
+
+def is_navigation_error(error: Exception) -> bool:
+    """Whether a Playwright error means the page navigated under the caller"""
+    return any(text in str(error) for text in _NAVIGATION_ERRORS)
+
+
+@dataclass
+class ReadinessResult:
+    """How a page became ready"""
+    policy: str
+    elapsed_ms: float
+    timed_out: bool = False
+
+
+class ReadinessPolicy:
+    """
+    Base class for readiness policies.
+
+    prepare() runs before navigation (to observe the load from its start)
+    and returns per-page state handed to wait().
+    """
+
+    def describe(self) -> str:
+        raise NotImplementedError
+
+    async def prepare(self, page: Page) -> Any:
+        return None
+
+    async def wait(self, page: Page, state: Any, timeout_ms: float) -> None:
+        raise NotImplementedError
+
+    async def cleanup(self, page: Page, state: Any) -> None:
+        pass
+
+
+@dataclass
+class LoadState(ReadinessPolicy):
+    """Wait for a Playwright load state (domcontentloaded, load, networkidle)"""
+    state: str = "domcontentloaded"
+
+    def describe(self) -> str:
+        return self.state
+
+    async def wait(self, page: Page, state: Any, timeout_ms: float) -> None:
+        await page.wait_for_load_state(self.state, timeout=timeout_ms)
+
+
+@dataclass
+class DomQuiescence(ReadinessPolicy):
+    """Wait until the DOM has not mutated for quiet_ms"""
+    quiet_ms: int = 500
+
+    def describe(self) -> str:
+        return f"dom-quiet:{self.quiet_ms}"
+
+    async def wait(self, page: Page, state: Any, timeout_ms: float) -> None:
+        # The in-page cap disconnects the observer even if Python stops waiting
+        await page.evaluate("""
+            ([quietMs, capMs]) => new Promise(resolve => {
+                let timer;
+                const done = () => {
+                    observer.disconnect();
+                    clearTimeout(cap);
+                    resolve();
+                };
+                const observer = new MutationObserver(() => {
+                    clearTimeout(timer);
+                    timer = setTimeout(done, quietMs);
+                });
+                observer.observe(document, {
+                    subtree: true, childList: true, attributes: true, characterData: true
+                });
+                timer = setTimeout(done, quietMs);
+                const cap = setTimeout(done, capMs);
+            })
+        """, [self.quiet_ms, timeout_ms])
+
+
+@dataclass
+class SelectorPresent(ReadinessPolicy):
+    """Wait until a CSS selector matches an element in the page"""
+    selector: str = "body"
+
+    def describe(self) -> str:
+        return f"selector:{self.selector}"
+
+    async def wait(self, page: Page, state: Any, timeout_ms: float) -> None:
+        await page.wait_for_selector(self.selector, state="attached", timeout=timeout_ms)
+
+
+class _NetworkMonitor:
+    """Tracks in-flight requests of a page, skipping ignored hosts"""
+
+    def __init__(self, page: Page, ignore_domains: frozenset):
+        self.page = page
+        self.ignore_domains = ignore_domains
+        self.in_flight = set()
+        self.last_activity = time.monotonic()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _ignored(self, request: Request) -> bool:
+        return (
+            request.resource_type in _LONG_LIVED_TYPES
+            or match_domain(request.url, self.ignore_domains) is not None
+        )
+
+    def _on_request(self, request: Request) -> None:
+        if not self._ignored(request):
+            self.in_flight.add(request)
+            self.last_activity = time.monotonic()
+
+    def _on_done(self, request: Request) -> None:
+        if request in self.in_flight:
+            self.in_flight.discard(request)
+            self.last_activity = time.monotonic()
+
+    def detach(self) -> None:
+        self.page.remove_listener("request", self._on_request)
+        self.page.remove_listener("requestfinished", self._on_done)
+        self.page.remove_listener("requestfailed", self._on_done)
+
+
+@dataclass
+class NetworkQuiet(ReadinessPolicy):
+    """
+    Wait until no relevant request has been in flight for quiet_ms.
+
+    Requests to ignored domains (analytics and ad hosts by default) and
+    long-lived event streams are not counted, so heartbeats and long
+    polling do not hold the page hostage the way networkidle does.
+    """
+    quiet_ms: int = 500
+    ignore_domains: Tuple[str, ...] = DEFAULT_BLOCKED_DOMAINS
+
+    def describe(self) -> str:
+        return f"network-quiet:{self.quiet_ms}"
+
+    async def prepare(self, page: Page) -> Any:
+        return _NetworkMonitor(page, frozenset(d.lower() for d in self.ignore_domains))
+
+    async def wait(self, page: Page, state: Any, timeout_ms: float) -> None:
+        monitor = state or await self.prepare(page)
+        quiet = self.quiet_ms / 1000
+        while True:
+            idle_for = time.monotonic() - monitor.last_activity
+            if not monitor.in_flight and idle_for >= quiet:
+                return
+            await asyncio.sleep(max(0.05, quiet - idle_for) if not monitor.in_flight else 0.05)
+
+    async def cleanup(self, page: Page, state: Any) -> None:
+        if state:
+            state.detach()
+
+
+def parse_policy(spec: str) -> ReadinessPolicy:
+    """
+    Parse a readiness policy from its command line form.
+
+    Forms:
+        domcontentloaded | load | networkidle
+        dom-quiet[:MS]
+        network-quiet[:MS]
+        selector:CSS
+
+    Raises:
+        ValueError: If the spec is not recognised
+    """
+    name, _, arg = spec.partition(":")
+    if name in ("domcontentloaded", "load", "networkidle") and not arg:
+        return LoadState(name)
+    if name == "dom-quiet":
+        return DomQuiescence(int(arg)) if arg else DomQuiescence()
+    if name == "network-quiet":
+        return NetworkQuiet(int(arg)) if arg else NetworkQuiet()
+    if name == "selector" and arg:
+        return SelectorPresent(arg)
+    raise ValueError(f"Unknown readiness policy: {spec}")
+
+
+def parse_rule(rule: str) -> Tuple[str, ReadinessPolicy]:
+    """
+    Parse a per-URL readiness rule of the form PATTERN=POLICY.
+
+    PATTERN is a shell-style glob matched against the full URL.
+
+    Raises:
+        ValueError: If the rule has no '=' or the policy is unknown
+    """
+    pattern, sep, spec = rule.partition("=")
+    if not sep or not pattern:
+        raise ValueError(f"Readiness rule must look like PATTERN=POLICY: {rule}")
+    return pattern, parse_policy(spec)
+
+
+class ReadinessConfig:
+    """
+    Chooses a readiness policy per URL and applies it with a hard cap.
+
+    Usage:
+        readiness = ReadinessConfig(
+            DomQuiescence(500),
+            rules=[("https://app.example.com/*", SelectorPresent("#root"))],
+        )
+        result = await readiness.navigate(page, url)
+    """
+
+    def __init__(
+        self,
+        default: Optional[ReadinessPolicy] = None,
+        rules: Optional[Iterable[Tuple[str, ReadinessPolicy]]] = None,
+        timeout_ms: float = 10000
+    ):
+        self.default = default or LoadState()
+        self.rules: List[Tuple[str, ReadinessPolicy]] = list(rules or [])
+        self.timeout_ms = timeout_ms
+
+    def policy_for(self, url: str) -> ReadinessPolicy:
+        """Return the policy of the first matching rule, or the default"""
+        for pattern, policy in self.rules:
+            if fnmatch(url, pattern):
+                return policy
+        return self.default
+
+    async def navigate(self, page: Page, url: str) -> ReadinessResult:
+        """Navigate to a URL and wait until it is ready"""
+        policy = self.policy_for(url)
+        state = await policy.prepare(page)
+        start = time.monotonic()
+        try:
+            await page.goto(url, wait_until="commit")
+            return await self._wait(page, policy, state, start)
+        finally:
+            await policy.cleanup(page, state)
+
+    async def reload(self, page: Page) -> ReadinessResult:
+        """Reload a page and wait until it is ready again"""
+        policy = self.policy_for(page.url)
+        state = await policy.prepare(page)
+        start = time.monotonic()
+        try:
+            await page.reload(wait_until="commit")
+            return await self._wait(page, policy, state, start)
+        finally:
+            await policy.cleanup(page, state)
+
+    async def wait(self, page: Page) -> ReadinessResult:
+        """Wait until an already navigated page is ready"""
+        policy = self.policy_for(page.url)
+        state = await policy.prepare(page)
+        try:
+            return await self._wait(page, policy, state, time.monotonic())
+        finally:
+            await policy.cleanup(page, state)
+
+    async def _wait(self, page: Page, policy: ReadinessPolicy, state: Any, start: float) -> ReadinessResult:
+        timed_out = False
+        while True:
+            remaining_ms = self.timeout_ms - (time.monotonic() - start) * 1000
+            if remaining_ms <= 0:
+                # Playwright reads a zero timeout as no timeout at all
+                timed_out = True
+                break
+            try:
+                # Never analyze a page without a parsed document
+                await page.wait_for_load_state("domcontentloaded", timeout=remaining_ms)
+                remaining_ms = max(0.0, self.timeout_ms - (time.monotonic() - start) * 1000)
+                await asyncio.wait_for(policy.wait(page, state, remaining_ms), remaining_ms / 1000)
+            except (asyncio.TimeoutError, PlaywrightTimeoutError):
+                timed_out = True
+            except PlaywrightError as e:
+                # A client-side redirect replaced the document: wait on the
+                # new one within what is left of the cap
+                if not is_navigation_error(e):
+                    raise
+                continue
+            break
+
+        return ReadinessResult(
+            policy=policy.describe(),
+            elapsed_ms=round((time.monotonic() - start) * 1000, 1),
+            timed_out=timed_out
+        )
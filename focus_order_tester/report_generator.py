@@ -44,6 +44,42 @@ class ReportGenerator:
         }
 
 
+def _order_summary(comparison: Dict[str, Any], match_text: str = "Focus order follows DOM order") -> str:
+    """One-line summary of a DOM vs focus order comparison"""
+    if comparison.get("matches"):
+        text = match_text
+    else:
+        counts = comparison.get("summary", {})
+        text = (
+            f"{counts.get('moved', 0)} moved, {counts.get('missing', 0)} missing, "
+            f"{counts.get('extra', 0)} extra ({counts.get('in_order', 0)} in order)"
+        )
+    if comparison.get("truncated"):
+        text += " - focus trace stopped at its element limit"
+    return text
+
+
+_REVERSE_MATCH_TEXT = "Shift+Tab order is the exact reverse of Tab order"
+
+
+def _discrepancy_table(comparison: Dict[str, Any], first: str, second: str) -> List[str]:
+    """Markdown table lines for the discrepancies of an order comparison"""
+    discrepancies = comparison.get("discrepancies", [])
+    if not discrepancies:
+        return []
+    lines = [
+        f"| Type | Elements | {first} | {second} |",
+        f"|------|----------|{'-' * (len(first) + 2)}|{'-' * (len(second) + 2)}|"
+    ]
+    for d in discrepancies:
+        elements = ", ".join(f"`{sel}`" for sel in d.get("selectors", []))
+        lines.append(
+            f"| {d.get('type', '')} | {elements} | {d.get('dom_position', '-')} | {d.get('focus_position', '-')} |"
+        )
+    lines.append("")
+    return lines
+
+
 def generate_json_report(
     results: List[Dict[str, Any]], 
     output_path: Optional[str] = None
@@ -148,6 +184,14 @@ def generate_html_report(
             
             html_parts.append("    </div>")
         
+        comparison = result.get("order_comparison")
+        if comparison:
+            html_parts.append(f"    <p>DOM vs focus order: {_order_summary(comparison)}</p>")
+        
+        reverse = result.get("reverse_comparison")
+        if reverse:
+            html_parts.append(f"    <p>Tab vs Shift+Tab order: {_order_summary(reverse, _REVERSE_MATCH_TEXT)}</p>")
+        
         html_parts.append("  </div>")
     
     html_parts.extend(["</body>", "</html>"])
@@ -256,11 +300,29 @@ def generate_md_report(
             for item in focus_path:
                 pos = item.get("position", 0)
                 tag = item.get("tag_name", "")
-                selector = item.get("selector", "")
+                selector = " >>> ".join([*item.get("context_path", []), item.get("selector", "")])
                 text = item.get("text_content", "")[:30]  # Truncate long text
                 md_parts.append(f"| {pos} | `{tag}` | `{selector}` | {text} |")
             md_parts.append("")
         
+        # DOM order vs focus order section
+        comparison = result.get("order_comparison")
+        if comparison:
+            md_parts.append("### 🔀 DOM Order vs Focus Order")
+            md_parts.append("")
+            md_parts.append(f"**{_order_summary(comparison)}**")
+            md_parts.append("")
+            md_parts.extend(_discrepancy_table(comparison, "DOM Position", "Focus Position"))
+        
+        # Tab vs Shift+Tab section
+        reverse = result.get("reverse_comparison")
+        if reverse:
+            md_parts.append("### ↩️ Tab vs Shift+Tab Order")
+            md_parts.append("")
+            md_parts.append(f"**{_order_summary(reverse, _REVERSE_MATCH_TEXT)}**")
+            md_parts.append("")
+            md_parts.extend(_discrepancy_table(reverse, "Tab Position", "Reversed Shift+Tab Position"))
+        
         # Trigger analysis section
         trigger_results = result.get("trigger_results", [])
         if trigger_results:
@@ -284,6 +346,8 @@ def generate_md_report(
                 elif distance > 1:
                      # Warn if distance is high but not strictly marked as violation yet (though logic says it is)
                      status = f"⚠️ Distance: {distance}"
+                if res.get('from_cache'):
+                    status += f" (measured on {res.get('tested_on') or 'an earlier page'})"
                 
                 md_parts.append(f"| {trigger} | {dialog} | {distance} | {status} |")
             md_parts.append("")
@@ -0,0 +1,127 @@
+"""
+Resource Blocker Module for Focus Order Tester
+
+Aborts requests that focus-order and axe checks never need (images, media,
+web fonts, analytics and ad beacons) through context-level routing.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Route
+
+
+# Resource types that never affect focus order or the SC 2.4.3 axe rules
+DEFAULT_BLOCKED_TYPES = (
+    "image",
+    "media",
+    "font",
+)
+
+# Third-party analytics, tag manager and ad hosts (subdomains included)
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.io",
+    "mixpanel.com",
+)
+
+
+def match_domain(url: str, domains: Set[str]) -> Optional[str]:
+    """
+    Find the entry of a domain list that a URL's host belongs to.
+
+    Args:
+        url: URL to check
+        domains: Lower-case domains; each also matches its subdomains
+
+    Returns:
+        The matching domain, or None
+    """
+    host = (urlparse(url).hostname or "").lower()
+    while host:
+        if host in domains:
+            return host
+        _, _, host = host.partition(".")
+    return None
+
+
+@dataclass
+class BlockStats:
+    """Counts of requests aborted by a ResourceBlocker"""
+    requests_blocked: int = 0
+    requests_allowed: int = 0
+    by_type: Dict[str, int] = field(default_factory=dict)
+    by_domain: Dict[str, int] = field(default_factory=dict)
+
+
+class ResourceBlocker:
+    """
+    Request interception profile applied to whole browser contexts.
+
+    Note that Playwright disables the HTTP cache for routed contexts, so
+    this pays off on pages where the blocked bytes outweigh cache hits.
+
+    Usage:
+        blocker = ResourceBlocker(extra_domains=["ads.example.com"])
+        await blocker.attach(context)
+    """
+
+    def __init__(
+        self,
+        blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+        blocked_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+        extra_domains: Optional[Iterable[str]] = None
+    ):
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_domains = frozenset(
+            d.lower().lstrip(".") for d in [*blocked_domains, *(extra_domains or [])]
+        )
+        self.stats = BlockStats()
+
+    async def attach(self, context: BrowserContext) -> None:
+        """Route every request of a context through the blocker"""
+        await context.route("**/*", self._handle)
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        Decide whether a request should be aborted.
+
+        Args:
+            resource_type: Playwright resource type (e.g. "image")
+            url: Request URL
+
+        Returns:
+            Matched resource type or denylisted domain, or None to allow
+        """
+        if resource_type in self.blocked_types:
+            return resource_type
+
+        return match_domain(url, self.blocked_domains)
+
+    async def _handle(self, route: Route) -> None:
+        request = route.request
+        reason = self.block_reason(request.resource_type, request.url)
+        if reason is None:
+            self.stats.requests_allowed += 1
+            await route.continue_()
+            return
+
+        self.stats.requests_blocked += 1
+        if reason == request.resource_type:
+            self.stats.by_type[reason] = self.stats.by_type.get(reason, 0) + 1
+        else:
+            self.stats.by_domain[reason] = self.stats.by_domain.get(reason, 0) + 1
+        await route.abort("blockedbyclient")
@@ -0,0 +1,170 @@
+"""
+Result Cache Module for Focus Order Tester
+
+Persists analysis results keyed by URL, a normalized hash of the loaded
+DOM and the analyzer configuration, so unchanged pages can skip axe (and
+optionally the focus trace) on later runs. Entries are evicted least
+recently used once the cache exceeds its size bound.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
+from playwright.async_api import Page
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "focus_order_tester" / "results.sqlite"
+DEFAULT_MAX_ENTRIES = 100000
+
+# Serializes the DOM without scripts, styles, comments, nonces and
+# whitespace runs, which change between loads of an otherwise identical
+# page, and hashes it in the page so only the digest crosses CDP.
+# crypto.subtle is missing outside secure contexts; two differently
+# seeded FNV-1a passes stand in for it there.
+_DOM_HASH_JS = """
+    async () => {
+        const root = document.documentElement.cloneNode(true);
+        root.querySelectorAll('script, style, noscript').forEach(el => el.remove());
+        root.querySelectorAll('[nonce]').forEach(el => el.removeAttribute('nonce'));
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_COMMENT);
+        const comments = [];
+        while (walker.nextNode()) comments.push(walker.currentNode);
+        comments.forEach(c => c.remove());
+        const text = root.outerHTML.replace(/\\s+/g, ' ');
+
+        if (window.crypto && crypto.subtle) {
+            const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+            return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+        }
+        const fnv = seed => {
+            let hash = seed;
+            for (let i = 0; i < text.length; i++) {
+                hash ^= text.charCodeAt(i);
+                hash = Math.imul(hash, 16777619) >>> 0;
+            }
+            return hash.toString(16).padStart(8, '0');
+        };
+        return fnv(2166136261) + fnv(84696351);
+    }
+"""
+
+
+async def page_fingerprint(page: Page) -> str:
+    """Return the normalized DOM hash of a loaded page"""
+    return await page.evaluate(_DOM_HASH_JS)
+
+
+def cache_key(kind: str, url: str, dom_hash: str, config: Sequence[Any]) -> str:
+    """
+    Build a cache key for one analysis of one page state.
+
+    Args:
+        kind: Analysis the entry belongs to (e.g. "axe", "focus")
+        url: Page URL
+        dom_hash: Normalized DOM hash from page_fingerprint()
+        config: Everything else the result depends on, such as the axe
+            version and rule set
+
+    Returns:
+        Hex digest identifying the entry
+    """
+    material = json.dumps([kind, url, dom_hash, list(config)], sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Lookup counts of a ResultCache"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of JSON results in a SQLite file.
+
+    Safe to share between worker processes; each process opens its own
+    connection and the size bound is enforced approximately.
+
+    Usage:
+        with ResultCache("results.sqlite", max_entries=50000) as cache:
+            value = cache.get(key)
+            if value is None:
+                cache.put(key, compute())
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self._entries = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value for a key, or None on a miss"""
+        row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+
+        self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.stats.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, evicting old entries if needed"""
+        now = time.time()
+        data = json.dumps(value)
+        updated = self._db.execute(
+            "UPDATE results SET value = ?, last_used = ? WHERE key = ?", (data, now, key)
+        ).rowcount
+        if not updated:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+                (key, data, now)
+            )
+            self._entries += 1
+        self.stats.stores += 1
+
+        if self.max_entries and self._entries > self.max_entries:
+            self._evict(self._entries - self.max_entries)
+
+    def _evict(self, count: int) -> None:
+        evicted = self._db.execute(
+            "DELETE FROM results WHERE key IN "
+            "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+            (count,)
+        ).rowcount
+        self.stats.evictions += evicted
+        # Other processes may have added or evicted rows in the meantime
+        self._entries = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
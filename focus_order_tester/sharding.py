@@ -0,0 +1,161 @@
+"""
+Sharding Module for Focus Order Tester
+
+Splits a URL list across OS processes, each running its own browser and
+event loop, and merges the streamed results back in input order.
+"""
+import asyncio
+import multiprocessing
+import queue
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+
+# How long the parent blocks on the result queue before checking worker health
+_POLL_INTERVAL = 0.5
+
+
+def shard_urls(urls: List[str], workers: int) -> List[List[Tuple[int, str]]]:
+    """
+    Split URLs into round-robin shards, keeping each URL's input index.
+
+    Round-robin keeps shards balanced when slow pages are clustered
+    (e.g. one heavy site listed in a block).
+
+    Args:
+        urls: List of URLs to split
+        workers: Number of shards wanted
+
+    Returns:
+        Non-empty shards of (index, url) pairs
+    """
+    workers = max(1, min(workers, len(urls)))
+    shards = [list(enumerate(urls))[i::workers] for i in range(workers)]
+    return [shard for shard in shards if shard]
+
+
+def _run_shard(shard_id: int, shard: List[Tuple[int, str]], options: Dict[str, Any], results_queue) -> None:
+    """Child process entry point: process one shard and stream results back"""
+    # Imported here so the child does not need main at module import time
+    from .main import process_urls
+
+    indexes = [index for index, _ in shard]
+    urls = [url for _, url in shard]
+
+    def on_result(position: int, result: Dict[str, Any]) -> None:
+        results_queue.put(("result", indexes[position], result))
+
+    stats: Dict[str, Any] = {}
+    asyncio.run(process_urls(urls, on_result=on_result, stats=stats, **options))
+    results_queue.put(("done", shard_id, stats))
+
+
+def merge_stats(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """
+    Add one worker's run statistics into a combined stats dict.
+
+    Numbers are summed, so peaks become the total across workers;
+    nested dicts are merged recursively.
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            merge_stats(target.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = target.get(key, 0) + value
+        else:
+            target.setdefault(key, value)
+
+
+def _error_result(url: str, message: str) -> Dict[str, Any]:
+    """Build a result for a URL whose worker process died"""
+    return {
+        "url": url,
+        "timestamp": datetime.now().isoformat(),
+        "violations": [],
+        "violation_count": 0,
+        "error": message
+    }
+
+
+async def process_urls_sharded(
+    urls: List[str],
+    workers: int,
+    stats: Optional[Dict[str, Any]] = None,
+    **options: Any
+) -> List[Dict[str, Any]]:
+    """
+    Process URLs across several OS processes.
+
+    Each process runs process_urls on its shard with its own browser and
+    event loop. Results are streamed back over a queue as they finish and
+    merged into a single list in input order, the same structure
+    process_urls returns.
+
+    Args:
+        urls: List of URLs to test
+        workers: Number of processes to use
+        stats: Optional dict that receives the merged run statistics
+        **options: Keyword arguments forwarded to process_urls
+
+    Returns:
+        List of results for each URL, in input order
+    """
+    shards = shard_urls(urls, workers)
+    # spawn: never fork a process that already holds an event loop or driver
+    mp_context = multiprocessing.get_context("spawn")
+    results_queue = mp_context.Queue()
+    processes = [
+        mp_context.Process(target=_run_shard, args=(shard_id, shard, options, results_queue), daemon=True)
+        for shard_id, shard in enumerate(shards)
+    ]
+    for process in processes:
+        process.start()
+
+    loop = asyncio.get_running_loop()
+    results: List[Any] = [None] * len(urls)
+    finished = set()
+
+    def record(kind: str, key: Any, payload: Any) -> None:
+        if kind == "result":
+            results[key] = payload
+        elif kind == "done":
+            finished.add(key)
+            if stats is not None:
+                merge_stats(stats, payload)
+
+    try:
+        while len(finished) < len(processes):
+            try:
+                record(*await loop.run_in_executor(None, results_queue.get, True, _POLL_INTERVAL))
+                continue
+            except queue.Empty:
+                pass
+
+            # A shard that exited may have queued its last results and its
+            # "done" marker after the poll timed out; collect them first
+            while True:
+                try:
+                    record(*results_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # A process that exited without its "done" marker crashed
+            crashed = [
+                shard_id for shard_id, process in enumerate(processes)
+                if shard_id not in finished and process.exitcode is not None
+            ]
+            for shard_id in crashed:
+                finished.add(shard_id)
+                for index, url in shards[shard_id]:
+                    if results[index] is None:
+                        results[index] = _error_result(
+                            url,
+                            f"Worker process exited unexpectedly (exit code {processes[shard_id].exitcode})"
+                        )
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    return results
@@ -5,11 +5,245 @@ Detects and tests interactive triggers (like buttons) to verify focus order beha
 specifically for dynamic content like dialogs (F85).
 """
 import asyncio
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page, Locator
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import List, Dict, Any, Optional, Sequence
+from playwright.async_api import BrowserContext, Page, Error as PlaywrightError
+
+from .browser_session import BrowserSession
+from .focus_events import DEFAULT_FOCUS_TIMEOUT_MS, FocusWaitStats, press_and_wait_for_focus
+from .readiness import LoadState, ReadinessConfig, is_navigation_error
+from .result_cache import ResultCache, cache_key
+from .focus_tracer import FocusElement, element_from_description
+from .page_scripts import FOCUSABLES_JS, IDENTITY_JS
+
+
+# Triggers tested per page (0 = all detected) and pages testing them at once
+DEFAULT_TRIGGER_BUDGET = 10
+DEFAULT_TRIGGER_CONCURRENCY = 3
+
+# Persisted trigger results older than this are tested again, so a dialog
+# fixed on the site stops being reported
+DEFAULT_TRIGGER_CACHE_HOURS = 24
+
+# Longest wait for a trigger to be found, read or clicked; a trigger that
+# is missing or covered is skipped rather than held for Playwright's 30 s
+TRIGGER_ACTION_TIMEOUT_MS = 3000
+
+# A click that changes nothing for DIALOG_QUIET_MS opened no dialog; a
+# page that keeps mutating is given up on after DIALOG_WAIT_CAP_MS
+DIALOG_QUIET_MS = 200
+DIALOG_WAIT_CAP_MS = 2000
+
+# Analytic distances up to this many Tab stops are confirmed with real
+# key presses when confirmation is enabled
+BORDERLINE_DISTANCE = 3
+
+# Installed before the click: resolves window.__focusOrderTesterDialogWait
+# with the open latency as soon as a dialog-like element that was not
+# visible before becomes visible (checked on DOM mutations and toggle
+# events), or with null once the DOM has been quiet for quietMs after the
+# click. Before the click only the cap runs, since Playwright's
+# actionability checks can take longer than quietMs. The click is marked
+# by its capture listener or, if the page never sees the event, by
+# calling window.__focusOrderTesterDialogClicked() once click() returns;
+# the latency is measured from that moment, and the opened element is
+# kept in window.__focusOrderTesterDialog.
+_DIALOG_WATCH_JS = """
+    ([quietMs, capMs]) => {
+        const DIALOGS = '[role="dialog"], [role="alertdialog"], dialog[open], .modal';
+        const visible = el => el.getClientRects().length > 0 &&
+            getComputedStyle(el).visibility === 'visible';
+        const before = new Set(Array.from(document.querySelectorAll(DIALOGS)).filter(visible));
+        let clickedAt = null;
+        window.__focusOrderTesterDialog = null;
+        
+        window.__focusOrderTesterDialogWait = new Promise(resolve => {
+            let quiet;
+            let done = false;
+            const finish = latency => {
+                if (done) return;
+                done = true;
+                observer.disconnect();
+                document.removeEventListener('toggle', check, true);
+                document.removeEventListener('click', clicked, true);
+                clearTimeout(quiet);
+                clearTimeout(cap);
+                resolve(latency);
+            };
+            const check = () => {
+                if (done) return;
+                const opened = Array.from(document.querySelectorAll(DIALOGS))
+                    .find(el => !before.has(el) && visible(el));
+                if (opened && clickedAt !== null) {
+                    window.__focusOrderTesterDialog = opened;
+                    return finish(performance.now() - clickedAt);
+                }
+                // The quiet period only counts from the click
+                if (clickedAt === null) return;
+                clearTimeout(quiet);
+                quiet = setTimeout(() => finish(null), quietMs);
+            };
+            const clicked = () => {
+                if (clickedAt !== null) return;
+                clickedAt = performance.now();
+                check();
+            };
+            window.__focusOrderTesterDialogClicked = clicked;
+            const observer = new MutationObserver(check);
+            observer.observe(document, {subtree: true, childList: true, attributes: true});
+            document.addEventListener('toggle', check, true);
+            document.addEventListener('click', clicked, true);
+            const cap = setTimeout(() => finish(null), capMs);
+        });
+    }
+"""
+
+# Applies the trigger heuristics to every button in one round trip and
+# returns a unique selector per candidate. Buttons inside open shadow roots
+# get their hosts' selectors chained in front with Playwright's ">>".
+#
+# Each candidate also gets a structural fingerprint, so the same component
+# can be recognized on other pages of the site: the host, the trigger's
+# text and markup, the tags and roles of its ancestors and, when its
+# aria-controls target is already in the DOM, that element's markup and
+# ancestors. Markup is reduced to tags, the values of a few identifying
+# attributes and the names of the rest, so generated ids and per-page
+# content do not change it. The result is hashed with two FNV-1a passes.
+_DETECT_TRIGGERS_JS = """
+    (buttons) => {
+""" + IDENTITY_JS + """
+        const TEXT_HINT = /open|show|dialog|modal/;
+        const KEPT = new Set(['class', 'role', 'type', 'aria-haspopup', 'aria-modal']);
+        const MARKUP_NODES = 200;
+        const signature = el => el.localName + '[' + Array.from(el.attributes)
+            .filter(a => a.name !== 'id')
+            .map(a => KEPT.has(a.name) ? a.name + '=' + a.value.trim() : a.name)
+            .sort().join(' ') + ']';
+        const markup = root => {
+            const parts = [signature(root)];
+            const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+            while (parts.length < MARKUP_NODES && walker.nextNode()) parts.push(signature(walker.currentNode));
+            return parts.join('');
+        };
+        const ancestry = el => {
+            const parts = [];
+            for (let node = el.parentElement; node && node !== document.body; node = node.parentElement) {
+                parts.push(node.localName + (node.getAttribute('role') ? '=' + node.getAttribute('role') : ''));
+            }
+            return parts.join('<');
+        };
+        const hash = text => {
+            const fnv = seed => {
+                let h = seed;
+                for (let i = 0; i < text.length; i++) {
+                    h ^= text.charCodeAt(i);
+                    h = Math.imul(h, 16777619) >>> 0;
+                }
+                return h.toString(16).padStart(8, '0');
+            };
+            return fnv(2166136261) + fnv(84696351);
+        };
+        const fingerprint = (el, text, controls) => {
+            const root = el.getRootNode();
+            const target = controls && root.getElementById ? root.getElementById(controls.split(/\\s+/)[0]) : null;
+            return hash(JSON.stringify([
+                location.host,
+                text.replace(/\\s+/g, ' '),
+                markup(el),
+                ancestry(el),
+                target ? [markup(target), ancestry(target)] : null
+            ]));
+        };
+        const candidates = [];
+        for (const el of buttons) {
+            const hasPopup = el.getAttribute('aria-haspopup');
+            const controls = el.getAttribute('aria-controls');
+            const text = (el.textContent || '').trim();
+            if (!hasPopup && !controls && !TEXT_HINT.test(text.toLowerCase())) continue;
+            candidates.push({
+                selector: identity.contextPath(el).concat(identity.path(el)).join(' >> '),
+                text: text.slice(0, 50),
+                hasPopup,
+                controls,
+                fingerprint: fingerprint(el, text, controls)
+            });
+        }
+        return candidates;
+    }
+"""
+
+# Runs on the clicked trigger: finds the opened dialog (or any visible
+# one) and counts the Tab stops from the focused element (or the trigger,
+# if focus was lost) to the dialog's first focusable element in the
+# computed sequential focus order, wrapping past the document end. Returns
+# distance 0 when focus is already inside the dialog and null distance
+# when the start or the dialog is not in the order.
+_DIALOG_DISTANCE_JS = """
+    (trigger) => {
+""" + IDENTITY_JS + FOCUSABLES_JS + """
+        const DIALOGS = '[role="dialog"], [role="alertdialog"], dialog[open], .modal';
+        const dialog = window.__focusOrderTesterDialog ||
+            Array.from(document.querySelectorAll(DIALOGS)).find(el => el.getClientRects().length > 0);
+        if (!dialog) return null;
+        const within = el => {
+            for (let node = el; node; node = node.parentNode || node.host) {
+                if (node === dialog) return true;
+            }
+            return false;
+        };
+        
+        const result = {dialogSelector: identity.path(dialog), distance: null, path: []};
+        const focused = identity.active();
+        const start = focused && focused !== document.body ? focused : trigger;
+        if (within(start)) {
+            result.distance = 0;
+            return result;
+        }
+        
+        const order = tabOrder(focusScope());
+        const from = order.indexOf(start) !== -1 ? order.indexOf(start) : order.indexOf(trigger);
+        const to = order.findIndex(within);
+        if (from === -1 || to === -1) return result;
+        
+        result.distance = to > from ? to - from : order.length - from + to;
+        for (let i = 1; i <= result.distance; i++) {
+            result.path.push(identity.describe(order[(from + i) % order.length]));
+        }
+        return result;
+    }
+"""
+
+
+# Describes the focused element after a Tab press and, if it is inside
+# the dialog the watch saw open (or any dialog-like element), that
+# dialog's selector
+_FOCUSED_DIALOG_JS = """
+    () => {
+""" + IDENTITY_JS + """
+        const DIALOGS = '[role="dialog"], [role="alertdialog"], dialog, .modal, .dialog';
+        const el = identity.active();
+        if (!el || el === document.body) return null;
+        
+        const opened = window.__focusOrderTesterDialog;
+        let dialog = null;
+        for (let node = el; node && !dialog; node = node.parentNode || node.host) {
+            if (node === opened || (node.matches && node.matches(DIALOGS))) dialog = node;
+        }
+        return {element: identity.describe(el), dialogSelector: dialog ? identity.path(dialog) : null};
+    }
+"""
+
+
+@dataclass
+class TriggerCandidate:
+    """A button that looks like it opens a dialog"""
+    selector: str
+    text: str
+    has_popup: Optional[str] = None  # aria-haspopup value
+    controls: Optional[str] = None  # aria-controls value
+    fingerprint: Optional[str] = None  # Structural hash, equal for the same component on other pages
 
-from .focus_tracer import FocusElement, FocusTracer
 
 @dataclass
 class TriggerResult:
@@ -21,156 +255,257 @@ class TriggerResult:
     is_adjacent: bool = False
     f85_violation: bool = False
     focus_path_after_click: List[FocusElement] = field(default_factory=list)
+    open_latency_ms: Optional[float] = None  # Click to dialog visible, if one was seen
+    from_cache: bool = False  # Reused from an identical trigger instead of clicked
+    # Page the trigger was clicked on; for a reused result, the page the
+    # distance and focus path were measured on
+    tested_on: Optional[str] = None
+
+
+def _trigger_result(data: Dict[str, Any]) -> TriggerResult:
+    """Rebuild a TriggerResult from its asdict() form"""
+    data = dict(data)
+    data["focus_path_after_click"] = [FocusElement(**e) for e in data["focus_path_after_click"]]
+    return TriggerResult(**data)
+
+
+@dataclass
+class TriggerCacheStats:
+    """Trigger counts of a TriggerCache"""
+    tested: int = 0
+    skipped: int = 0
+
+
+class TriggerCache:
+    """
+    Results of tested triggers, keyed by their structural fingerprint.
+    
+    Shared by the TriggerTrackers of a run, so a component repeated on
+    every page of a site (a header menu or login button) is clicked once
+    and its result reused elsewhere. Given a ResultCache, results are also
+    stored there under config and reused by later runs for max_age_hours.
+    The store should be a connection of its own, so trigger lookups do not
+    count in the stats of the page result cache.
+    
+    Usage:
+        trigger_cache = TriggerCache()
+        async with TriggerTracker(trigger_cache=trigger_cache) as tracker:
+            ...
+        print(trigger_cache.stats.skipped)
+    """
+    
+    def __init__(
+        self,
+        store: Optional[ResultCache] = None,
+        config: Sequence[Any] = (),
+        max_age_hours: float = DEFAULT_TRIGGER_CACHE_HOURS
+    ):
+        self.store = store
+        self.config = list(config)
+        self.max_age_hours = max_age_hours
+        self.stats = TriggerCacheStats()
+        self._results: Dict[str, TriggerResult] = {}
+    
+    def get(self, fingerprint: str) -> Optional[TriggerResult]:
+        """Return the result of an identical trigger, or None if none was tested"""
+        result = self._results.get(fingerprint)
+        if result is None and self.store is not None:
+            stored = self.store.get(cache_key("trigger", "", fingerprint, self.config))
+            # Lookups refresh an entry's LRU position but not its age
+            if stored is not None and time.time() - stored["stored_at"] <= self.max_age_hours * 3600:
+                result = self._results[fingerprint] = _trigger_result(stored["result"])
+        return result
+    
+    def put(self, fingerprint: str, result: TriggerResult) -> None:
+        """Record the result of a tested trigger"""
+        self._results[fingerprint] = result
+        if self.store is not None:
+            self.store.put(
+                cache_key("trigger", "", fingerprint, self.config),
+                {"stored_at": time.time(), "result": asdict(result)}
+            )
 
 
 class TriggerTracker:
     """
     Tracks focus behavior after clicking trigger elements.
     Designed to detect WCAG F85 violations (dialog position).
+    
+    Pass a shared BrowserSession (and optionally a context on it) to reuse
+    one browser across analyzers; otherwise the tracker owns a private
+    session. Pages are considered ready at network idle unless a
+    ReadinessConfig is given.
+    
+    After each Tab press the tracker waits for the page to report the
+    focus change (up to focus_timeout_ms) and records the wait in
+    focus_stats.
+    
+    Up to trigger_budget triggers are clicked per page, by up to
+    trigger_concurrency pages of the same context at once: the analyzed
+    page plus freshly loaded copies of it. Each page works through its
+    share of the triggers, returning to its pre-click state in between.
+    
+    The distance from a trigger to its dialog is computed from the page's
+    sequential focus order in one evaluate. With confirm_distance, short
+    non-adjacent distances (and ones the order cannot give) are checked by
+    pressing Tab.
+    
+    With a trigger_cache, triggers whose fingerprint matches one already
+    tested (on any page) are not clicked and do not count against the
+    budget; the earlier result is returned
+    for them, marked from_cache and naming in tested_on the page its
+    distance and focus path come from.
     """
     
-    def __init__(self, headless: bool = True):
-        self.headless = headless
-        self._playwright = None
-        self._browser: Optional[Browser] = None
+    def __init__(
+        self,
+        headless: bool = True,
+        session: Optional[BrowserSession] = None,
+        context: Optional[BrowserContext] = None,
+        readiness: Optional[ReadinessConfig] = None,
+        focus_timeout_ms: float = DEFAULT_FOCUS_TIMEOUT_MS,
+        focus_stats: Optional[FocusWaitStats] = None,
+        trigger_budget: int = DEFAULT_TRIGGER_BUDGET,
+        trigger_concurrency: int = DEFAULT_TRIGGER_CONCURRENCY,
+        confirm_distance: bool = False,
+        trigger_cache: Optional[TriggerCache] = None
+    ):
+        if trigger_concurrency < 1:
+            raise ValueError("trigger_concurrency must be at least 1")
+        self.headless = session.headless if session else headless
+        self.session = session
+        self.readiness = readiness or ReadinessConfig(LoadState("networkidle"))
+        self.focus_timeout_ms = focus_timeout_ms
+        self.focus_stats = focus_stats if focus_stats is not None else FocusWaitStats()
+        self.trigger_budget = trigger_budget
+        self.trigger_concurrency = trigger_concurrency
+        self.confirm_distance = confirm_distance
+        self.trigger_cache = trigger_cache
         self.page: Optional[Page] = None
+        self._created_page: Optional[Page] = None
+        self._owns_session = session is None
+        self._context = context
+        self._owns_context = context is None
     
     async def __aenter__(self):
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        if self._owns_session:
+            self.session = BrowserSession(headless=self.headless)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        if self._owns_context and self._context:
+            await self._context.close()
+        elif self._created_page:
+            await self._created_page.close()
+        self._context = None
+        self._created_page = None
+        self.page = None
+        if self._owns_session and self.session:
+            await self.session.close()
+            self.session = None
 
     async def _ensure_page(self, url: Optional[str] = None):
         """Ensure a page is open and optionally navigate to URL"""
-        if not self._browser:
+        if not self.session:
             raise RuntimeError("TriggerTracker must be used as async context manager")
         
         if not self.page:
-            context = await self._browser.new_context()
-            self.page = await context.new_page()
+            if not self._context:
+                self._context = await self.session.new_context()
+            self.page = self._created_page = await self._context.new_page()
         
         if url:
-            await self.page.goto(url, wait_until="networkidle")
+            await self.readiness.navigate(self.page, url)
 
-    async def detect_triggers(self) -> List[Locator]:
+    async def detect_triggers(self) -> List[TriggerCandidate]:
         """
         Detect potential trigger elements that might open dialogs.
         Looks for buttons with aria-haspopup, aria-controls, or specific text patterns.
+        
+        All buttons are inspected by a single in-page evaluate, however
+        many the page has.
         """
         if not self.page:
             return []
 
-        triggers = []
-        buttons = await self.page.get_by_role("button").all()
-        
-        for btn in buttons:
-            has_popup = await btn.get_attribute("aria-haspopup")
-            aria_controls = await btn.get_attribute("aria-controls")
-            text = (await btn.text_content() or "").lower()
-            
-            # Heuristics for potential dialog triggers
-            if (has_popup or 
-                aria_controls or 
-                "open" in text or 
-                "show" in text or 
-                "dialog" in text or 
-                "modal" in text):
-                triggers.append(btn)
-                
-        return triggers
-
-    async def click_and_trace(self, trigger_selector: str) -> TriggerResult:
+        candidates = await self.page.get_by_role("button").evaluate_all(_DETECT_TRIGGERS_JS)
+        return [
+            TriggerCandidate(
+                selector=c["selector"],
+                text=c["text"],
+                has_popup=c.get("hasPopup"),
+                controls=c.get("controls"),
+                fingerprint=c.get("fingerprint")
+            )
+            for c in candidates
+        ]
+
+    async def click_and_trace(self, trigger_selector: str, page: Optional[Page] = None) -> TriggerResult:
         """
         Click a specific trigger and trace focus path to find the dialog.
         
         Args:
             trigger_selector: CSS selector of the trigger to click
+            page: Page to test in (defaults to the tracker's page)
             
         Returns:
             TriggerResult containing distance and violation status
         """
-        if not self.page:
+        page = page or self.page
+        if not page:
             raise RuntimeError("Page not initialized")
 
-        # Get trigger info before clicking
-        trigger = self.page.locator(trigger_selector).first
-        trigger_text = (await trigger.text_content() or "").strip()[:50]
+        # Get trigger info before clicking, and hold on to the element
+        # itself: its selector may match another one once the DOM changes
+        trigger = page.locator(trigger_selector).first
+        trigger_text = (await trigger.text_content(timeout=TRIGGER_ACTION_TIMEOUT_MS) or "").strip()[:50]
+        handle = await trigger.element_handle(timeout=TRIGGER_ACTION_TIMEOUT_MS)
         
-        # Click the trigger
-        await trigger.click()
-        
-        # Wait a bit for animations/DOM updates
-        await asyncio.sleep(0.5)
-        
-        # Start tracing focus from current position
-        # Note: We reuse logic similar to FocusTracer but here we just tab forward
-        # until we hit a dialog or run out of reasonable steps
+        # Watch for a dialog from before the click, then wait until one
+        # opens or the page settles
+        url = page.url
+        await page.evaluate(_DIALOG_WATCH_JS, [DIALOG_QUIET_MS, DIALOG_WAIT_CAP_MS])
+        await trigger.click(timeout=TRIGGER_ACTION_TIMEOUT_MS)
+        try:
+            open_latency_ms = await page.evaluate(
+                "() => { window.__focusOrderTesterDialogClicked(); return window.__focusOrderTesterDialogWait; }"
+            )
+            measured = await handle.evaluate(_DIALOG_DISTANCE_JS) if open_latency_ms is not None else None
+        except PlaywrightError as e:
+            # The click navigated (a link styled as a button, a form
+            # submit) and destroyed the watch: no dialog opened. Load the
+            # page again so the next trigger starts from it. Other errors,
+            # such as the trigger vanishing, fail this trigger only.
+            if page.url == url and not is_navigation_error(e):
+                raise
+            await self.readiness.navigate(page, url)
+            return TriggerResult(trigger_selector=trigger_selector, trigger_text=trigger_text, tested_on=url)
+        finally:
+            try:
+                await handle.dispose()
+            except PlaywrightError:
+                pass  # Went with the old document after a navigation
         
-        focus_path = []
-        dialog_found = False
+        focus_path: List[FocusElement] = []
         dialog_selector = None
-        distance = 0
+        distance = -1
+        if measured:
+            dialog_selector = measured["dialogSelector"]
+            focus_path = [element_from_description(info, i + 1) for i, info in enumerate(measured["path"])]
+            if measured["distance"] is not None:
+                distance = measured["distance"]
         
-        # Trace up to 20 steps to find dialog
-        for i in range(20):
-            # Press Tab
-            await self.page.keyboard.press("Tab")
-            await asyncio.sleep(0.05)
-            
-            # Get current element
-            element_info = await self.page.evaluate("""
-                () => {
-                    const el = document.activeElement;
-                    if (!el || el === document.body) return null;
-                    
-                    let selector = el.tagName.toLowerCase();
-                    if (el.id) selector = '#' + el.id;
-                    else if (el.className) selector += '.' + el.className.split(' ').join('.');
-                    
-                    // Check if it looks like a dialog or is inside one
-                    const dialogParent = el.closest('[role="dialog"], dialog, .modal, .dialog');
-                    const isInDialog = dialogParent !== null;
-                    const isDialogItself = el.getAttribute('role') === 'dialog' || el.tagName === 'DIALOG';
-                     
-                    return {
-                        tagName: el.tagName.toLowerCase(),
-                        selector: selector,
-                        textContent: (el.textContent || '').trim().slice(0, 50),
-                        role: el.getAttribute('role'),
-                        isInDialog: isInDialog,
-                        dialogSelector: dialogParent ? (dialogParent.id ? '#' + dialogParent.id : dialogParent.className) : null
-                    };
-                }
-            """)
-            
-            if not element_info:
-                continue
-
-            focus_element = FocusElement(
-                tag_name=element_info["tagName"],
-                selector=element_info["selector"],
-                text_content=element_info["textContent"],
-                tab_index=0, # Simplified
-                position=i + 1,
-                role=element_info["role"]
-            )
-            focus_path.append(focus_element)
-            
-            # Check if we landed in a dialog
-            if element_info["isInDialog"]:
-                distance = i + 1
-                dialog_found = True
-                dialog_selector = element_info["dialogSelector"]
-                break
+        # Only distances near the adjacency limit, or ones the order could
+        # not give, are worth pressing Tab for
+        if self.confirm_distance and (distance == -1 or 1 < distance <= BORDERLINE_DISTANCE):
+            steps = distance if distance > 0 else BORDERLINE_DISTANCE
+            confirmed, confirmed_selector, confirmed_path = await self._tab_to_dialog(page, steps)
+            if confirmed != -1:
+                distance = confirmed
+                dialog_selector = dialog_selector or confirmed_selector
+                focus_path = confirmed_path
         
-        # Reset state (reload page or close dialog) - needed for next tests?
-        # For now, we assume one test per page load or caller handles reset
+        dialog_found = dialog_selector is not None and distance != -1
         
         # Analyze results
         is_adjacent = distance <= 1 if dialog_found else False
@@ -187,35 +522,157 @@ class TriggerTracker:
             distance=distance if dialog_found else -1,
             is_adjacent=is_adjacent,
             f85_violation=f85_violation,
-            focus_path_after_click=focus_path
+            focus_path_after_click=focus_path,
+            open_latency_ms=round(open_latency_ms, 1) if open_latency_ms is not None else None,
+            tested_on=url
         )
 
+    async def _tab_to_dialog(self, page: Page, max_steps: int):
+        """
+        Press Tab until focus lands in a dialog, at most max_steps times.
+        
+        Returns:
+            Tuple of (distance or -1, dialog selector, focus path)
+        """
+        focus_path = []
+        
+        for i in range(max_steps):
+            # Press Tab and wait for focus to move
+            await press_and_wait_for_focus(page, "Tab", self.focus_timeout_ms, self.focus_stats)
+            
+            focused = await page.evaluate(_FOCUSED_DIALOG_JS)
+            if not focused:
+                continue
+            focus_path.append(element_from_description(focused["element"], i + 1))
+            
+            # Check if we landed in a dialog
+            if focused["dialogSelector"]:
+                return i + 1, focused["dialogSelector"], focus_path
+        
+        return -1, None, focus_path
+
     async def analyze_f85(self, url: str) -> List[TriggerResult]:
         """
         Analyze a page for F85 violations by detecting and testing triggers.
         """
         await self._ensure_page(url)
+        return await self._analyze_triggers()
+
+    async def analyze_page(self, page: Page, ready: bool = False) -> List[TriggerResult]:
+        """
+        Analyze an already loaded page for F85 violations.
+        
+        The page belongs to the caller and is left open.
         
-        results = []
+        Args:
+            page: Loaded Playwright page
+            ready: The caller already waited for the page to be ready, so
+                the tracker's readiness wait is skipped
+            
+        Returns:
+            List of TriggerResult for triggers that opened a dialog
+        """
+        self.page = page
+        if not ready:
+            await self.readiness.wait(page)
+        return await self._analyze_triggers()
+
+    async def _analyze_triggers(self) -> List[TriggerResult]:
+        """Detect triggers on the current page and test them concurrently"""
         triggers = await self.detect_triggers()
+        if not triggers:
+            return []
         
-        # Currently only test the first few relevant triggers to avoid long runtimes
-        # In a real tool, might want to be more exhaustive or configurable
-        for i, trigger in enumerate(triggers[:3]):
-            # Get safe selector
-            selector = await trigger.evaluate("""
-                (el) => {
-                    if (el.id) return '#' + el.id;
-                    return el.tagName.toLowerCase(); // simplified
+        # The budget counts clicks: triggers already tested on another page
+        # are reused without using it up
+        pending: asyncio.Queue = asyncio.Queue()
+        outcomes: List[Optional[TriggerResult]] = [None] * len(triggers)
+        for index, trigger in enumerate(triggers):
+            known = self._known_result(trigger)
+            if known:
+                outcomes[index] = known
+            elif not self.trigger_budget or pending.qsize() < self.trigger_budget:
+                pending.put_nowait((index, trigger))
+        
+        async def worker(page: Page) -> None:
+            snapshot = None
+            while True:
+                try:
+                    index, trigger = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                # Each trigger needs the page in its pre-click state; a
+                # trigger that fails is skipped, not the whole page
+                try:
+                    if snapshot is None:
+                        snapshot = await self._snapshot_state(page)
+                    else:
+                        await self._restore_state(snapshot, page)
+                    outcomes[index] = await self.click_and_trace(trigger.selector, page)
+                except Exception as e:
+                    print(f"⚠️ Trigger '{trigger.selector}' failed on {page.url}: {e}")
+                    continue
+                if self.trigger_cache is not None and trigger.fingerprint:
+                    self.trigger_cache.stats.tested += 1
+                    self.trigger_cache.put(trigger.fingerprint, outcomes[index])
+        
+        async def copy_worker() -> None:
+            # A copy that fails to load leaves its share to the other pages
+            page = await self.page.context.new_page()
+            try:
+                await self.readiness.navigate(page, self.page.url)
+                await worker(page)
+            finally:
+                await page.close()
+        
+        copies = min(self.trigger_concurrency, pending.qsize()) - 1
+        if copies >= 0:
+            # Every worker runs to completion, so no page is closed under
+            # a sibling that is still clicking
+            for error in await asyncio.gather(
+                worker(self.page), *(copy_worker() for _ in range(copies)), return_exceptions=True
+            ):
+                if isinstance(error, Exception):
+                    print(f"⚠️ Trigger page for {self.page.url} failed: {error}")
+        
+        # Only keep results where we actually found a dialog interaction
+        return [r for r in outcomes if r is not None and r.dialog_selector]
+
+    def _known_result(self, trigger: TriggerCandidate) -> Optional[TriggerResult]:
+        """The cached result of an identical trigger, addressed to this one"""
+        if self.trigger_cache is None or not trigger.fingerprint:
+            return None
+        known = self.trigger_cache.get(trigger.fingerprint)
+        if known is None:
+            return None
+        self.trigger_cache.stats.skipped += 1
+        return replace(known, trigger_selector=trigger.selector, trigger_text=trigger.text, from_cache=True)
+
+    async def _snapshot_state(self, page: Optional[Page] = None) -> str:
+        """Fingerprint the current URL and serialized DOM"""
+        return await (page or self.page).evaluate("""
+            () => {
+                const html = document.documentElement.outerHTML;
+                let hash = 0x811c9dc5;
+                for (let i = 0; i < html.length; i++) {
+                    hash ^= html.charCodeAt(i);
+                    hash = Math.imul(hash, 0x01000193);
                 }
-            """)
-            
-            # We need to reload page for each trigger to ensure clean state
-            if i > 0:
-                await self.page.reload(wait_until="networkidle")
-                
-            res = await self.click_and_trace(selector)
-            if res.dialog_selector: # Only keep results where we actually found a dialog interaction
-                results.append(res)
-                
-        return results
+                return location.href + '|' + html.length + ':' + (hash >>> 0).toString(16);
+            }
+        """)
+
+    async def _restore_state(self, snapshot: str, page: Optional[Page] = None) -> None:
+        """
+        Return the page to the state captured by _snapshot_state.
+        
+        Dismissing the dialog with Escape is usually enough; a full reload
+        is only done when the DOM still differs from the snapshot.
+        """
+        page = page or self.page
+        await page.keyboard.press("Escape")
+        if await self._snapshot_state(page) == snapshot:
+            await page.evaluate("() => document.activeElement && document.activeElement.blur()")
+            return
+        
+        await self.readiness.reload(page)
@@ -6,6 +6,7 @@ Tests cover:
 - Running axe-core on a page
 - Filtering SC 2.4.3 related rules
 - Parsing violation results
+- Loading the axe-core bundle once and injecting it per context
 """
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -16,8 +17,12 @@ from focus_order_tester.axe_runner import (
     AxeRunner,
     FocusOrderViolation,
     SC_243_RULES,
+    AXE_BUNDLE_SHA256,
+    AXE_CDN_URL,
+    load_axe_bundle,
     run_axe_analysis
 )
+from focus_order_tester.browser_session import BrowserSession
 
 
 class TestSC243Rules:
@@ -112,3 +117,111 @@ class TestRunAxeAnalysis:
         result = await run_axe_analysis("data:text/html,<html><body>Test</body></html>")
         assert "timestamp" in result
         assert "url" in result
+
+
+class TestAxeBundle:
+    """Test in-memory axe-core bundle loading and injection"""
+    
+    def test_bundled_axe_matches_pinned_hash(self):
+        """Shipped bundle should load with its version and pinned hash"""
+        bundle = load_axe_bundle()
+        assert bundle.version == "4.8.4"
+        assert bundle.sha256 == AXE_BUNDLE_SHA256
+    
+    def test_hash_mismatch_rejected(self, tmp_path):
+        """A bundle that does not match the expected hash should be rejected"""
+        path = tmp_path / "axe.min.js"
+        path.write_text("/*! axe v0.0.1 */ window.axe = {};")
+        with pytest.raises(ValueError):
+            load_axe_bundle(path, "0" * 64)
+    
+    @pytest.mark.asyncio
+    async def test_missing_bundle_raises_without_cdn(self, tmp_path):
+        """A missing bundle should fail fast unless CDN fallback is allowed"""
+        session = BrowserSession()
+        with pytest.raises(FileNotFoundError):
+            async with AxeRunner(session=session, axe_path=tmp_path / "missing.js"):
+                pass
+        async with AxeRunner(session=session, axe_path=tmp_path / "missing.js", allow_cdn=True) as runner:
+            assert runner.bundle is None
+    
+    @pytest.mark.asyncio
+    async def test_init_script_added_once_per_context(self):
+        """Each context should get axe-core as an init script exactly once"""
+        session = BrowserSession()
+        session.get_browser = AsyncMock()
+        async with AxeRunner(session=session) as runner:
+            context = await runner.new_context()
+            await runner.prepare_context(context)
+            context.add_init_script.assert_awaited_once_with(script=runner.bundle.source)
+    
+    @pytest.mark.asyncio
+    async def test_ensure_axe_skips_matching_version(self):
+        """Pages already running the bundled version should not be re-injected"""
+        async with AxeRunner(session=BrowserSession()) as runner:
+            page = AsyncMock()
+            page.evaluate.return_value = runner.bundle.version
+            await runner._ensure_axe(page)
+            page.add_script_tag.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_ensure_axe_injects_on_mismatch(self):
+        """A missing or foreign axe should be replaced from memory, not the CDN"""
+        async with AxeRunner(session=BrowserSession()) as runner:
+            page = AsyncMock()
+            page.evaluate.return_value = "3.5.0"
+            await runner._ensure_axe(page)
+            page.add_script_tag.assert_awaited_once_with(content=runner.bundle.source)
+    
+    @pytest.mark.asyncio
+    async def test_cdn_used_only_without_bundle(self, tmp_path):
+        """The CDN should be used only when fallback is allowed and no bundle exists"""
+        async with AxeRunner(session=BrowserSession(), axe_path=tmp_path / "x.js", allow_cdn=True) as runner:
+            page = AsyncMock()
+            await runner._ensure_axe(page)
+            page.add_script_tag.assert_awaited_once_with(url=AXE_CDN_URL)
+
+
+class TestLeanResults:
+    """Test trimmed axe-core result payloads"""
+    
+    @pytest.mark.asyncio
+    async def test_run_axe_passes_lean_options(self):
+        """_run_axe should send the rules and caps to the page"""
+        runner = AxeRunner(session=BrowserSession(), max_nodes=3, max_html_length=200)
+        runner._ensure_axe = AsyncMock()
+        page = AsyncMock()
+        page.evaluate.return_value = {"violations": []}
+        
+        await runner._run_axe(page)
+        
+        args = page.evaluate.await_args.args
+        assert "resultTypes" in args[0]
+        assert args[1] == {
+            "rules": SC_243_RULES,
+            "lean": True,
+            "maxNodes": 3,
+            "maxHtml": 200,
+        }
+    
+    def test_parse_lean_violation(self):
+        """Trimmed violations should parse, keeping the omitted node count"""
+        runner = AxeRunner()
+        violations = runner._parse_violations({"violations": [{
+            "id": "tabindex",
+            "impact": "serious",
+            "description": "No positive tabindex",
+            "helpUrl": "https://example.com/tabindex",
+            "omittedNodes": 7,
+            "nodes": [{"html": "<p tabindex=\"5\">", "target": ["p"], "failureSummary": "Fix"}]
+        }]})
+        
+        assert violations[0].rule_id == "tabindex"
+        assert violations[0].omitted_nodes == 7
+        assert violations[0].nodes[0]["target"] == ["p"]
+    
+    def test_parse_full_violation_defaults_omitted(self):
+        """Full axe results have no omitted count and should default to zero"""
+        runner = AxeRunner()
+        violations = runner._parse_violations({"violations": [{"id": "tabindex", "nodes": []}]})
+        assert violations[0].omitted_nodes == 0
@@ -0,0 +1,170 @@
+"""
+Tests for Browser Session Module
+
+Tests cover:
+- Lazy, one-time browser launch
+- Injection of a shared session into the analyzers
+- Context pool limits and recycling
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from focus_order_tester.browser_session import BrowserSession, ContextPool, browser_rss_mb
+from focus_order_tester.axe_runner import AxeRunner
+from focus_order_tester.focus_tracer import FocusTracer
+from focus_order_tester.trigger_tracker import TriggerTracker
+
+
+def _mock_playwright():
+    """Build a patched async_playwright() whose browser can be inspected"""
+    browser = AsyncMock()
+    playwright = AsyncMock()
+    playwright.chromium.launch.return_value = browser
+    factory = MagicMock()
+    factory.return_value.start = AsyncMock(return_value=playwright)
+    return factory, playwright, browser
+
+
+class TestBrowserSession:
+    """Test BrowserSession lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_no_launch_until_used(self):
+        """Entering the session should not launch a browser"""
+        factory, playwright, _ = _mock_playwright()
+        with patch('focus_order_tester.browser_session.async_playwright', factory):
+            async with BrowserSession():
+                pass
+            playwright.chromium.launch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_launches_once_for_many_contexts(self):
+        """Browser should be launched once no matter how many contexts are made"""
+        factory, playwright, browser = _mock_playwright()
+        with patch('focus_order_tester.browser_session.async_playwright', factory):
+            async with BrowserSession() as session:
+                for _ in range(5):
+                    await session.new_context()
+            playwright.chromium.launch.assert_called_once()
+            assert browser.new_context.await_count == 5
+            browser.close.assert_awaited_once()
+
+
+class TestSessionInjection:
+    """Test that analyzers reuse an injected session"""
+
+    @pytest.mark.asyncio
+    async def test_analyzers_share_injected_session(self):
+        """Injected session should be used and left open by every analyzer"""
+        session = BrowserSession(headless=False)
+        session.close = AsyncMock()
+
+        async with AxeRunner(session=session) as runner:
+            assert runner.session is session
+            assert runner.headless == False
+        async with FocusTracer(session=session) as tracer:
+            assert tracer.session is session
+        async with TriggerTracker(session=session) as tracker:
+            assert tracker.session is session
+
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tracker_leaves_injected_context_open(self):
+        """TriggerTracker should close only its own page on an injected context"""
+        session = BrowserSession()
+        context = AsyncMock()
+
+        async with TriggerTracker(session=session, context=context) as tracker:
+            await tracker._ensure_page()
+
+        context.new_page.assert_awaited_once()
+        context.new_page.return_value.close.assert_awaited_once()
+        context.close.assert_not_called()
+
+
+def _pool(**kwargs):
+    """Build a ContextPool over a mocked session and context factory"""
+    session = BrowserSession()
+    session.relaunch = AsyncMock()
+    factory = AsyncMock(side_effect=lambda: AsyncMock())
+    return ContextPool(session, context_factory=factory, **kwargs), session, factory
+
+
+class TestContextPool:
+    """Test ContextPool leasing and recycling"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_released_context(self):
+        """A released context should be leased again"""
+        pool, _, factory = _pool()
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+        assert second is first
+        assert factory.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_pages_per_context(self):
+        """A context should be closed and replaced after K leases"""
+        pool, _, factory = _pool(pages_per_context=2)
+        for _ in range(5):
+            context = await pool.acquire()
+            await pool.release(context)
+        assert pool.stats.contexts_created == 3
+        assert pool.stats.contexts_recycled == 2
+        assert factory.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_broken_context_is_not_reused(self):
+        """A context released as broken should be closed, not leased again"""
+        pool, _, factory = _pool()
+        first = await pool.acquire()
+        await pool.release(first, broken=True)
+        first.close.assert_awaited_once()
+
+        second = await pool.acquire()
+        assert second is not first
+        assert factory.await_count == 2
+        assert pool.stats.contexts_recycled == 1
+
+    @pytest.mark.asyncio
+    async def test_max_contexts_blocks_acquire(self):
+        """acquire() should wait while max_contexts are leased"""
+        pool, _, _ = _pool(max_contexts=1)
+        held = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await pool.release(held)
+        assert await asyncio.wait_for(waiter, 1) is held
+        assert pool.stats.peak_live_contexts == 1
+
+    @pytest.mark.asyncio
+    async def test_relaunches_browser_after_pages_per_browser(self):
+        """Browser should be relaunched once all leases are returned"""
+        pool, session, _ = _pool(max_contexts=2, pages_per_browser=2)
+        first = await pool.acquire()
+        second = await pool.acquire()
+        await pool.release(first)
+        await pool.release(second)
+
+        session.relaunch.assert_awaited_once()
+        assert pool.stats.browser_relaunches == 1
+        assert pool.live_contexts == 0
+
+    @pytest.mark.asyncio
+    async def test_relaunches_browser_over_rss_limit(self):
+        """Browser should be relaunched when RSS exceeds the limit"""
+        pool, session, _ = _pool(rss_limit_mb=100)
+        with patch('focus_order_tester.browser_session.browser_rss_mb', return_value=150.0):
+            context = await pool.acquire()
+            await pool.release(context)
+        session.relaunch.assert_awaited_once()
+
+    def test_browser_rss_is_non_negative(self):
+        """RSS probe should return a size or None when /proc is missing"""
+        rss = browser_rss_mb()
+        assert rss is None or rss >= 0
@@ -0,0 +1,76 @@
+"""
+Tests for Focus Events Module
+
+Tests cover:
+- Installing the focus recorder once per context
+- Waiting for the focus event caused by a key press
+- Timing out and recording wait statistics
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+from focus_order_tester.focus_events import (
+    FocusWaitStats,
+    _on_focus,
+    install_focus_recorder,
+    press_and_wait_for_focus
+)
+
+
+def _page(context=None):
+    """Build a mock page whose Tab presses report a focus change"""
+    page = AsyncMock()
+    page.context = context or AsyncMock()
+    page.keyboard.press.side_effect = lambda key: _on_focus({"page": page}, {"type": "focusin"})
+    return page
+
+
+class TestInstallFocusRecorder:
+    """Test recorder installation"""
+    
+    @pytest.mark.asyncio
+    async def test_binding_exposed_once_per_context(self):
+        """Pages sharing a context should register the binding only once"""
+        context = AsyncMock()
+        for _ in range(3):
+            await install_focus_recorder(_page(context))
+        
+        context.expose_binding.assert_awaited_once()
+        context.add_init_script.assert_awaited_once()
+
+
+class TestPressAndWaitForFocus:
+    """Test event-driven waits after key presses"""
+    
+    @pytest.mark.asyncio
+    async def test_returns_when_focus_event_arrives(self):
+        """A focus event should end the wait well before the timeout"""
+        page = _page()
+        stats = FocusWaitStats()
+        
+        assert await press_and_wait_for_focus(page, "Tab", timeout_ms=5000, stats=stats)
+        
+        page.keyboard.press.assert_awaited_once_with("Tab")
+        assert stats.steps == 1
+        assert stats.timeouts == 0
+        assert stats.wait_ms < 1000
+    
+    @pytest.mark.asyncio
+    async def test_times_out_without_focus_event(self):
+        """No focus event should time out and be counted"""
+        page = _page()
+        page.keyboard.press.side_effect = None
+        stats = FocusWaitStats()
+        
+        assert not await press_and_wait_for_focus(page, "Tab", timeout_ms=20, stats=stats)
+        assert stats.timeouts == 1
+    
+    @pytest.mark.asyncio
+    async def test_stale_events_are_discarded(self):
+        """Events queued before the press should not satisfy the wait"""
+        page = _page()
+        await install_focus_recorder(page)
+        _on_focus({"page": page}, {"type": "focusin"})
+        page.keyboard.press.side_effect = None
+        
+        assert not await press_and_wait_for_focus(page, "Tab", timeout_ms=20)
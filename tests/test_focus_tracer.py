@@ -7,17 +7,27 @@ Tests cover:
 - Recording focus path sequence
 - Detecting focus traps
 - Comparing DOM order vs focus order
+- Analytic, hybrid and batched trace modes
+- Streaming traces with iter_trace
+- Keyboard trap detection
+- Concurrent forward and reverse traces
 """
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from contextlib import aclosing
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Import the module we're testing (doesn't exist yet - will fail)
 from focus_order_tester.focus_tracer import (
     FocusTracer,
     FocusElement,
+    FocusTrap,
+    build_trace_result,
+    primary_trap,
     trace_focus_path,
     compare_dom_vs_focus_order
 )
+from focus_order_tester.result_cache import ResultCache
 
 
 class TestFocusElement:
@@ -104,6 +114,481 @@ class TestFocusTracer:
             assert len(result) <= 10
 
 
+class TestAnalyticMode:
+    """Test the single-evaluate focus order computation"""
+    
+    def test_unknown_mode_rejected(self):
+        """An unknown trace mode should raise ValueError"""
+        with pytest.raises(ValueError):
+            FocusTracer(mode="mouse")
+    
+    @pytest.mark.asyncio
+    async def test_analytic_orders_positive_tabindex_first(self):
+        """Positive tabindex first, hidden/disabled/inert skipped, one radio per group"""
+        html = """
+        <html><body>
+            <a href='#' id='link'>Link</a>
+            <button id='late' tabindex='2'>Late</button>
+            <button id='early' tabindex='1'>Early</button>
+            <button id='off' disabled>Off</button>
+            <div hidden><a href='#' id='hidden'>Hidden</a></div>
+            <div inert><button id='inert'>Inert</button></div>
+            <input type='radio' name='r' id='r1'><input type='radio' name='r' id='r2' checked>
+        </body></html>
+        """
+        async with FocusTracer(mode="analytic") as tracer:
+            result = await tracer.trace(f"data:text/html,{html}")
+            assert [e.selector for e in result] == ["#early", "#late", "#link", "#r2"]
+    
+    @pytest.mark.asyncio
+    async def test_analytic_uses_single_evaluate(self):
+        """Analytic mode should not press any keys"""
+        page = AsyncMock()
+        page.evaluate.return_value = {
+            "order": [_log_entry("#b"), _log_entry("#a")],
+            "dom": [_log_entry("#a"), _log_entry("#b")],
+        }
+        tracer = FocusTracer(mode="analytic")
+        dom_order = []
+        
+        result = await tracer.trace_page(page, dom_order=dom_order)
+        
+        assert [e.selector for e in result] == ["#b", "#a"]
+        assert [e.selector for e in dom_order] == ["#a", "#b"]
+        page.evaluate.assert_awaited_once()
+        page.keyboard.press.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_hybrid_falls_back_to_keyboard_on_mismatch(self):
+        """A failed boundary check should trace by keyboard instead"""
+        tracer = FocusTracer(mode="hybrid")
+        analytic = [FocusElement("a", "#a", "A", 0, 0)]
+        keyboard = [FocusElement("button", "#b", "B", 0, 0)]
+        tracer._analytic_order = AsyncMock(return_value=analytic)
+        tracer._verify_boundaries = AsyncMock(return_value=False)
+        tracer._tab_through = lambda page, max_elements, **kwargs: _iterate(keyboard)
+        
+        assert await tracer.trace_page(AsyncMock()) == keyboard
+    
+    @pytest.mark.asyncio
+    async def test_hybrid_checks_only_boundaries(self):
+        """Hybrid verification should press Tab once per checkpoint"""
+        tracer = FocusTracer(mode="hybrid")
+        path = [FocusElement("button", f"#b{i}", "", 1 if i < 2 else 0, i) for i in range(50)]
+        page = AsyncMock()
+        page.evaluate.return_value = True
+        
+        assert await tracer._verify_boundaries(page, path)
+        # First element, first tabindex=0 element and last element
+        assert page.keyboard.press.await_count == 3
+
+
+async def _iterate(items):
+    """Async generator over a list, standing in for a trace"""
+    for item in items:
+        yield item
+
+
+def _log_entry(selector, uid=None):
+    """Build an in-page element description"""
+    uid = uid if uid is not None else hash(selector)
+    return {"uid": uid, "tagName": "a", "selector": selector, "textContent": "", "tabIndex": 0}
+
+
+class TestStableIdentity:
+    """Test cycle detection on elements without ids"""
+    
+    @pytest.mark.asyncio
+    async def test_keyboard_trace_stops_at_first_repeat(self):
+        """Wrapping around to an id-less element should end the trace"""
+        cycle = [
+            _log_entry("html > body > a:nth-of-type(1)", uid=1),
+            _log_entry("html > body > a:nth-of-type(2)", uid=2),
+        ]
+        page = AsyncMock()
+        steps = iter(cycle * 50)
+        # The starting evaluate takes the with-DOM flag, the per-step one no arguments
+        page.evaluate.side_effect = lambda script, *args: None if args else next(steps)
+        tracer = FocusTracer()
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()) as press:
+            result = await tracer.trace_page(page, max_elements=100)
+        
+        assert [e.uid for e in result] == [1, 2]
+        assert press.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_dom_order_captured_by_starting_evaluate(self):
+        """The DOM order should come from the evaluate that starts the trace"""
+        page = AsyncMock()
+        dom = [_log_entry("#a", uid=1), _log_entry("#b", uid=2)]
+        steps = iter([dom[1], dom[0], dom[1]])
+        page.evaluate.side_effect = lambda script, *args: dom if args and args[0] else next(steps)
+        tracer = FocusTracer()
+        dom_order = []
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+            result = await tracer.trace_page(page, dom_order=dom_order)
+        
+        assert [e.uid for e in dom_order] == [1, 2]
+        assert [e.uid for e in result] == [2, 1]
+        assert page.evaluate.await_count == 4
+
+
+class TestBatchedMode:
+    """Test burst Tab presses with an in-page focus log"""
+    
+    @pytest.mark.asyncio
+    async def test_reads_log_once_per_burst(self):
+        """K presses should be followed by a single log read"""
+        page = AsyncMock()
+        reads = [[_log_entry(f"#a{i}") for i in range(5)], [_log_entry(f"#a{i}") for i in range(5, 10)]]
+        page.evaluate.side_effect = lambda script, *args: reads.pop(0) if "read()" in script else None
+        tracer = FocusTracer(mode="batched", batch_size=5)
+        
+        result = await tracer.trace_page(page, max_elements=10)
+        
+        assert [e.position for e in result] == list(range(10))
+        assert page.keyboard.press.await_count == 10
+        log_reads = [c for c in page.evaluate.await_args_list if "read()" in c.args[0]]
+        assert len(log_reads) == 2
+    
+    @pytest.mark.asyncio
+    async def test_stops_at_cycle(self):
+        """A repeated element should end the trace without another burst"""
+        page = AsyncMock()
+        reads = [[_log_entry("#a"), _log_entry("#b"), _log_entry("#a")]]
+        page.evaluate.side_effect = lambda script, *args: reads.pop(0) if "read()" in script else None
+        tracer = FocusTracer(mode="batched", batch_size=3)
+        
+        result = await tracer.trace_page(page, max_elements=100)
+        
+        assert [e.selector for e in result] == ["#a", "#b"]
+        assert page.keyboard.press.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_stops_when_focus_leaves_document(self):
+        """A null entry (focus left the page) should end the trace"""
+        page = AsyncMock()
+        reads = [[_log_entry("#a"), None]]
+        page.evaluate.side_effect = lambda script, *args: reads.pop(0) if "read()" in script else None
+        tracer = FocusTracer(mode="batched", batch_size=4)
+        
+        result = await tracer.trace_page(page)
+        
+        assert [e.selector for e in result] == ["#a"]
+
+
+class TestIterTrace:
+    """Test the streaming trace API"""
+    
+    def _tracer_with_page(self, page, **kwargs):
+        """Build a tracer whose session hands out the given page"""
+        context = AsyncMock()
+        context.new_page.return_value = page
+        session = MagicMock()
+        session.headless = True
+        session.new_context = AsyncMock(return_value=context)
+        tracer = FocusTracer(session=session, readiness=AsyncMock(), **kwargs)
+        return tracer, context
+    
+    @pytest.mark.asyncio
+    async def test_yields_before_trace_completes(self):
+        """Elements should be yielded per step, before the next Tab press"""
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: None if args else _log_entry("#a", uid=1)
+        tracer, _ = self._tracer_with_page(page)
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()) as press:
+            elements = tracer.iter_trace("https://example.com")
+            first = await elements.__anext__()
+            assert first.selector == "#a"
+            assert press.await_count == 1
+            await elements.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_early_close_releases_page_and_skips_cache(self, tmp_path):
+        """Stopping early should close the page and not cache a partial path"""
+        page = AsyncMock()
+        page.url = "https://example.com"
+        uids = iter(range(1, 100))
+        page.evaluate.side_effect = lambda script, *args: (
+            "hash" if "digest" in script else None if args else _log_entry(f"#e{next(uids)}")
+        )
+        with ResultCache(tmp_path / "cache.sqlite") as cache:
+            tracer, context = self._tracer_with_page(page, cache=cache)
+            with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+                async with aclosing(tracer.iter_trace("https://example.com")) as elements:
+                    async for element in elements:
+                        if element.position == 2:
+                            break
+            
+            page.close.assert_awaited_once()
+            context.close.assert_awaited_once()
+            assert cache.stats.stores == 0
+    
+    @pytest.mark.asyncio
+    async def test_trace_collects_iter_trace(self):
+        """trace() should return everything iter_trace yields"""
+        tracer = FocusTracer(session=MagicMock())
+        path = [FocusElement("a", "#a", "", 0, 0), FocusElement("a", "#b", "", 0, 1)]
+        tracer.iter_trace = MagicMock(return_value=_iterate(path))
+        
+        assert await tracer.trace("https://example.com", max_elements=5) == path
+        tracer.iter_trace.assert_called_once_with(
+            "https://example.com", max_elements=5, context=None, dom_order=None, traps=None
+        )
+
+
+class TestKeyboardTrap:
+    """Test detection of short focus cycles"""
+    
+    @pytest.mark.asyncio
+    async def test_trap_confirmed_after_second_lap(self):
+        """A 2-element loop after the start should be reported and end the trace"""
+        a, b, c = (_log_entry(s, uid=i) for i, s in enumerate(("#a", "#b", "#c"), 1))
+        steps = iter([a, b, c, b, c, b] + [c] * 100)
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: None if args else next(steps)
+        tracer = FocusTracer()
+        traps = []
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()) as press:
+            result = await tracer.trace_page(page, max_elements=100, traps=traps)
+        
+        assert [e.selector for e in result] == ["#a", "#b", "#c"]
+        assert press.await_count == 6
+        assert [e.selector for e in traps[0].elements] == ["#b", "#c"]
+        assert traps[0].start == 1
+    
+    @pytest.mark.asyncio
+    async def test_broken_cycle_is_not_a_trap(self):
+        """Focus leaving the cycle during the second lap should not be reported"""
+        a, b, c = (_log_entry(s, uid=i) for i, s in enumerate(("#a", "#b", "#c"), 1))
+        steps = iter([a, b, c, b, a])
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: None if args else next(steps)
+        tracer = FocusTracer()
+        traps = []
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+            result = await tracer.trace_page(page, traps=traps)
+        
+        assert len(result) == 3
+        assert traps == []
+    
+    @pytest.mark.asyncio
+    async def test_wrap_to_start_needs_unreached_elements(self):
+        """Cycling from the first element is a trap only if the DOM has more to reach"""
+        a, b = _log_entry("#a", uid=1), _log_entry("#b", uid=2)
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: [a, b, _log_entry("#c", uid=3)] if args and args[0] else (
+            None if args else next(steps)
+        )
+        tracer = FocusTracer()
+        
+        steps = iter([a, b, a, b, a])
+        traps = []
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+            await tracer.trace_page(page, traps=traps)
+        assert traps == []
+        
+        steps = iter([a, b, a, b, a])
+        traps = []
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+            await tracer.trace_page(page, dom_order=[], traps=traps)
+        assert [e.uid for e in traps[0].elements] == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_batched_stuck_focus_is_a_trap(self):
+        """Bursts that never move focus off an element should report a trap"""
+        page = AsyncMock()
+        reads = [[_log_entry("#a", uid=1), _log_entry("#b", uid=2)], [], []]
+        page.evaluate.side_effect = lambda script, *args: reads.pop(0) if "read()" in script else None
+        tracer = FocusTracer(mode="batched", batch_size=2)
+        traps = []
+        
+        result = await tracer.trace_page(page, traps=traps)
+        
+        assert [e.selector for e in result] == ["#a", "#b"]
+        assert [e.selector for e in traps[0].elements] == ["#b"]
+        assert page.keyboard.press.await_count == 6
+    
+    @pytest.mark.asyncio
+    async def test_opaque_frame_stops_are_not_a_trap(self):
+        """Several Tab stops inside a cross-origin frame should not look like a cycle"""
+        a, b = _log_entry("#a", uid=1), _log_entry("#b", uid=3)
+        frame = {**_log_entry("iframe", uid=2), "tagName": "iframe", "opaque": True}
+        steps = iter([a, frame, frame, frame, b, None])
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: None if args else next(steps)
+        tracer = FocusTracer()
+        traps = []
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+            result = await tracer.trace_page(page, traps=traps)
+        
+        assert [e.selector for e in result] == ["#a", "iframe", "#b"]
+        assert traps == []
+    
+    @pytest.mark.asyncio
+    async def test_focus_kept_in_opaque_frame_ends_trace(self):
+        """Focus that never leaves an opaque frame should end the trace without a trap"""
+        frame = {**_log_entry("iframe", uid=2), "opaque": True}
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: None if args else frame
+        tracer = FocusTracer()
+        traps = []
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()) as press:
+            result = await tracer.trace_page(page, max_elements=10, traps=traps)
+        
+        assert [e.selector for e in result] == ["iframe"]
+        assert press.await_count == 11
+        assert traps == []
+    
+    @pytest.mark.asyncio
+    async def test_batched_quiet_burst_in_opaque_frame_is_not_a_trap(self):
+        """Bursts spent inside a cross-origin frame should not repeat it as stuck focus"""
+        page = AsyncMock()
+        reads = [[_log_entry("#a", uid=1), {**_log_entry("iframe", uid=2), "opaque": True}]]
+        page.evaluate.side_effect = lambda script, *args: (reads.pop(0) if reads else []) if "read()" in script else None
+        tracer = FocusTracer(mode="batched", batch_size=2)
+        traps = []
+        
+        result = await tracer.trace_page(page, max_elements=10, traps=traps)
+        
+        assert [e.selector for e in result] == ["#a", "iframe"]
+        assert traps == []
+        assert page.keyboard.press.await_count == 13
+    
+    def test_trap_reported_as_violation(self):
+        """A trap should become a wcag212-keyboard-trap violation"""
+        path = [FocusElement("a", f"#e{i}", "", 0, i) for i in range(3)]
+        trap = FocusTrap(path[1:], 1)
+        result = build_trace_result("https://example.com", path, trap=trap)
+        
+        violation = result["violations"][0]
+        assert violation["rule_id"] == "wcag212-keyboard-trap"
+        assert [n["target"] for n in violation["nodes"]] == [["#e1"], ["#e2"]]
+        assert build_trace_result("https://example.com", path)["violations"] == []
+
+
+class TestBidirectional:
+    """Test concurrent Tab and Shift+Tab traces"""
+    
+    @pytest.mark.asyncio
+    async def test_reverse_runs_in_second_page_concurrently(self):
+        """The reverse trace should use a second page and overlap the forward one"""
+        page = AsyncMock()
+        page.url = "https://example.com"
+        reverse_page = AsyncMock()
+        page.context.new_page.return_value = reverse_page
+        tracer = FocusTracer(readiness=AsyncMock())
+        running = set()
+        overlapped = []
+        
+        async def fake_trace(p, max_elements=100, dom_order=None, traps=None, reverse=False):
+            running.add(reverse)
+            await asyncio.sleep(0)
+            overlapped.append(running == {False, True})
+            return ["reverse"] if reverse else ["forward"]
+        
+        tracer.trace_page = fake_trace
+        forward, reverse = await tracer.trace_page_bidirectional(page)
+        
+        assert (forward, reverse) == (["forward"], ["reverse"])
+        tracer.readiness.navigate.assert_awaited_once_with(reverse_page, "https://example.com")
+        reverse_page.close.assert_awaited_once()
+        assert any(overlapped)
+    
+    @pytest.mark.asyncio
+    async def test_reverse_presses_shift_tab(self):
+        """A reverse trace should be driven by Shift+Tab, whatever the mode"""
+        page = AsyncMock()
+        steps = iter([_log_entry("#b", uid=2), _log_entry("#a", uid=1), None])
+        page.evaluate.side_effect = lambda script, *args: None if args else next(steps)
+        tracer = FocusTracer(mode="analytic")
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()) as press:
+            result = await tracer.trace_page(page, reverse=True)
+        
+        assert [e.selector for e in result] == ["#b", "#a"]
+        assert all(c.args[1] == "Shift+Tab" for c in press.await_args_list)
+        assert tracer.reached_limit(result, max_elements=2, reverse=True)
+    
+    @pytest.mark.asyncio
+    async def test_reverse_trap_is_marked(self):
+        """A trap found by Shift+Tab should say so, and lose to a forward one"""
+        a, b, c = (_log_entry(s, uid=i) for i, s in enumerate(("#a", "#b", "#c"), 1))
+        steps = iter([a, b, c, b, c, b])
+        page = AsyncMock()
+        page.evaluate.side_effect = lambda script, *args: None if args else next(steps)
+        tracer = FocusTracer()
+        traps = []
+        
+        with patch('focus_order_tester.focus_tracer.press_and_wait_for_focus', AsyncMock()):
+            await tracer.trace_page(page, traps=traps, reverse=True)
+        
+        assert traps[0].reverse is True
+        assert "Shift+Tab keeps cycling" in build_trace_result(
+            "https://example.com", [], trap=traps[0]
+        )["violations"][0]["description"]
+        
+        forward = FocusTrap([FocusElement("a", "#x", "", 0, 0)], 0)
+        assert primary_trap([traps[0], forward]) is forward
+        assert primary_trap(traps) is traps[0]
+        assert primary_trap([]) is None
+    
+    def test_reverse_comparison_in_result(self):
+        """The reversed Shift+Tab path should be diffed against the Tab path"""
+        a, b, c = (FocusElement("a", s, "", 0, i) for i, s in enumerate(("#a", "#b", "#c")))
+        
+        exact = build_trace_result("https://example.com", [a, b, c], reverse_path=[c, b, a])
+        assert exact["reverse_comparison"]["matches"] == True
+        
+        skipped = build_trace_result("https://example.com", [a, b, c], reverse_path=[c, a])
+        assert skipped["reverse_comparison"]["discrepancies"] == [
+            {"type": "missing", "selectors": ["#b"], "dom_position": 1}
+        ]
+        
+        capped = build_trace_result("https://example.com", [a, b], reverse_path=[c, b], truncated=True)
+        assert "reverse_comparison" not in capped
+
+
+class TestShadowAndFrames:
+    """Test elements inside shadow roots and same-origin frames"""
+    
+    @pytest.mark.asyncio
+    async def test_context_path_recorded(self):
+        """The enclosing frame and shadow hosts should be kept per element"""
+        inner = dict(_log_entry("button:nth-of-type(1)", uid=2), contextPath=["#frame", "my-menu"])
+        page = AsyncMock()
+        page.evaluate.return_value = {"order": [_log_entry("#a", uid=1), inner], "dom": None}
+        tracer = FocusTracer(mode="analytic")
+        
+        result = await tracer.trace_page(page)
+        
+        assert result[0].context_path == []
+        assert result[1].context_path == ["#frame", "my-menu"]
+        assert result[1].qualified_selector == "#frame >>> my-menu >>> button:nth-of-type(1)"
+    
+    def test_same_selector_in_two_hosts_stays_distinct(self):
+        """Equal selectors in different shadow roots should not be paired"""
+        first = FocusElement("button", "#ok", "", 0, 0, context_path=["dialog-a"])
+        second = FocusElement("button", "#ok", "", 0, 1, context_path=["dialog-b"])
+        result = build_trace_result("https://example.com", [second, first], [first, second])
+        assert result["order_comparison"]["summary"]["moved"] == 1
+        assert result["focus_path"][0]["context_path"] == ["dialog-b"]
+    
+    def test_scripts_resolve_deep_active_element(self):
+        """Focus checks should look through shadow roots and frames"""
+        from focus_order_tester import focus_tracer, page_scripts
+        assert "shadowRoot.activeElement" in page_scripts.IDENTITY_JS
+        assert "contentDocument" in page_scripts.IDENTITY_JS
+        assert "composedPath()" in focus_tracer._FOCUS_LOG_JS
+
+
 class TestTraceFocusPath:
     """Test convenience function"""
     
@@ -116,6 +601,25 @@ class TestTraceFocusPath:
         assert "element_count" in result
 
 
+class TestBuildTraceResult:
+    """Test trace result assembly"""
+    
+    def test_includes_order_comparison(self):
+        """A DOM order should add the comparison to the result"""
+        a = FocusElement("a", "#a", "", 0, 0)
+        b = FocusElement("a", "#b", "", 0, 1)
+        result = build_trace_result("https://example.com", [b, a], [a, b])
+        assert result["order_comparison"]["summary"]["moved"] == 1
+    
+    def test_truncated_trace_hides_unreached_missing(self):
+        """Elements past a capped trace should not count as missing"""
+        dom = [FocusElement("a", f"#e{i}", "", 0, i) for i in range(5)]
+        result = build_trace_result("https://example.com", dom[:2], dom, truncated=True)
+        comparison = result["order_comparison"]
+        assert comparison["matches"] == True
+        assert comparison["truncated"] == True
+
+
 class TestCompareDomVsFocusOrder:
     """Test DOM vs focus order comparison"""
     
@@ -134,3 +638,26 @@ class TestCompareDomVsFocusOrder:
         result = compare_dom_vs_focus_order(dom_order, focus_order)
         assert result["matches"] == False
         assert len(result["discrepancies"]) > 0
+    
+    def test_single_insertion_is_one_record(self):
+        """An element inserted early should not shift every later position"""
+        dom_order = [f"#e{i}" for i in range(1000)]
+        focus_order = ["#new"] + dom_order
+        result = compare_dom_vs_focus_order(dom_order, focus_order)
+        assert result["discrepancies"] == [{"type": "extra", "selectors": ["#new"], "focus_position": 0}]
+        assert result["summary"]["in_order"] == 1000
+    
+    def test_block_move_is_compact(self):
+        """Adjacent elements moved together should form one move record"""
+        dom_order = ["#a", "#b", "#c", "#d", "#e", "#f"]
+        focus_order = ["#a", "#e", "#f", "#b", "#c", "#d"]
+        result = compare_dom_vs_focus_order(dom_order, focus_order)
+        assert result["discrepancies"] == [
+            {"type": "moved", "selectors": ["#e", "#f"], "dom_position": 4, "focus_position": 1}
+        ]
+    
+    def test_missing_elements_reported(self):
+        """Elements never reached by Tab should be reported as missing"""
+        result = compare_dom_vs_focus_order(["#a", "#b", "#c"], ["#a", "#c"])
+        assert result["discrepancies"] == [{"type": "missing", "selectors": ["#b"], "dom_position": 1}]
+        assert result["summary"]["missing"] == 1
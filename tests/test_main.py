@@ -59,6 +59,109 @@ class TestParseArgs:
         """Should parse --no-headless option"""
         args = parse_args(["https://example.com", "--no-headless"])
         assert args.headless == False
+    
+    def test_parse_pipeline_option(self):
+        """Should parse --pipeline flag"""
+        assert parse_args(["https://example.com"]).pipeline == False
+        assert parse_args(["https://example.com", "--pipeline"]).pipeline == True
+    
+    def test_parse_workers_option(self):
+        """Should parse --workers option and default to 1"""
+        assert parse_args(["https://example.com"]).workers == 1
+        assert parse_args(["https://example.com", "--workers", "4"]).workers == 4
+    
+    def test_parse_context_pool_options(self):
+        """Should parse context pool recycling options"""
+        args = parse_args([
+            "https://example.com",
+            "--max-contexts", "2",
+            "--context-pages", "10",
+            "--browser-pages", "500",
+            "--browser-rss-mb", "2048"
+        ])
+        assert args.max_contexts == 2
+        assert args.pages_per_context == 10
+        assert args.pages_per_browser == 500
+        assert args.rss_limit_mb == 2048
+    
+    def test_parse_block_resources_options(self):
+        """Should parse --block-resources and repeatable --block-domain"""
+        args = parse_args([
+            "https://example.com",
+            "--block-resources",
+            "--block-domain", "ads.example.com",
+            "--block-domain", "beacon.example.com"
+        ])
+        assert args.block_resources == True
+        assert args.block_domains == ["ads.example.com", "beacon.example.com"]
+    
+    def test_parse_readiness_options(self):
+        """Should parse readiness policy, per-URL rules and timeout"""
+        args = parse_args([
+            "https://example.com",
+            "--readiness", "dom-quiet:300",
+            "--readiness-rule", "https://app.example.com/*=selector:#root",
+            "--readiness-timeout", "5000"
+        ])
+        assert args.readiness.quiet_ms == 300
+        pattern, policy = args.readiness_rules[0]
+        assert pattern == "https://app.example.com/*"
+        assert policy.selector == "#root"
+        assert args.readiness_timeout == 5000
+    
+    def test_parse_cache_options(self):
+        """Should enable the result cache by default and allow opting out"""
+        args = parse_args(["https://example.com"])
+        assert args.use_cache == True
+        assert args.cache_path
+        args = parse_args([
+            "https://example.com", "--no-cache", "--cache-size", "10", "--cache-focus-trace"
+        ])
+        assert args.use_cache == False
+        assert args.cache_size == 10
+        assert args.cache_focus_trace == True
+    
+    def test_parse_trigger_options(self):
+        """Should parse the trigger budget and concurrency"""
+        args = parse_args(["https://example.com", "--trigger-budget", "0", "--trigger-concurrency", "5"])
+        assert args.trigger_budget == 0
+        assert args.trigger_concurrency == 5
+        assert args.trigger_confirm == False
+        assert parse_args(["https://example.com", "--trigger-confirm"]).trigger_confirm == True
+    
+    def test_parse_trigger_reuse_options(self):
+        """Trigger reuse should be on by default and persist only on request"""
+        args = parse_args(["https://example.com"])
+        assert args.trigger_reuse == True
+        assert args.cache_triggers == False
+        args = parse_args(["https://example.com", "--no-trigger-reuse", "--cache-triggers"])
+        assert args.trigger_reuse == False
+        assert args.cache_triggers == True
+        assert parse_args(["https://example.com", "--trigger-cache-hours", "6"]).trigger_cache_hours == 6
+    
+    def test_parse_trace_reverse_option(self):
+        """Should enable the Shift+Tab trace on request"""
+        assert parse_args(["https://example.com"]).trace_reverse == False
+        assert parse_args(["https://example.com", "--trace-reverse"]).trace_reverse == True
+    
+    def test_trace_batch_must_be_positive(self):
+        """--trace-batch should reject sizes below 1"""
+        assert parse_args(["https://example.com", "--trace-batch", "4"]).trace_batch_size == 4
+        for value in ("0", "-2", "x"):
+            with pytest.raises(SystemExit):
+                parse_args(["https://example.com", "--trace-batch", value])
+    
+    def test_trigger_concurrency_must_be_positive(self):
+        """--trigger-concurrency should reject values below 1"""
+        for value in ("0", "-1"):
+            with pytest.raises(SystemExit):
+                parse_args(["https://example.com", "--trigger-concurrency", value])
+    
+    def test_parse_concurrency_option(self):
+        """Should parse --concurrency option and default to 1"""
+        assert parse_args(["https://example.com"]).concurrency == 1
+        args = parse_args(["https://example.com", "--concurrency", "8"])
+        assert args.concurrency == 8
 
 
 class TestProcessUrls:
@@ -98,6 +201,103 @@ class TestProcessUrls:
             results = await process_urls(["https://error.com", "https://ok.com"])
             # Should have results for both, one with error
             assert len(results) == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_results_keep_input_order(self):
+        """Results should follow input order even when URLs finish out of order"""
+        async def slow_first(url, **kwargs):
+            if url == "https://slow.com":
+                await asyncio.sleep(0.05)
+            return []
+        
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            mock_instance = AsyncMock()
+            mock_instance.analyze.side_effect = slow_first
+            mock_instance.new_context.side_effect = lambda: AsyncMock()
+            MockRunner.return_value.__aenter__.return_value = mock_instance
+            
+            urls = ["https://slow.com", "https://a.com", "https://b.com"]
+            results = await process_urls(urls, concurrency=3)
+            assert [r["url"] for r in results] == urls
+            # Contexts come from the pool, never more than one per worker
+            assert 1 <= mock_instance.new_context.await_count <= 3
+    
+    @pytest.mark.asyncio
+    async def test_on_result_streams_each_url(self):
+        """on_result should be called with the input index of every URL"""
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            mock_instance = AsyncMock()
+            mock_instance.analyze.return_value = []
+            MockRunner.return_value.__aenter__.return_value = mock_instance
+            
+            streamed = {}
+            await process_urls(
+                ["https://a.com", "https://b.com"],
+                on_result=lambda index, result: streamed.update({index: result["url"]})
+            )
+            assert streamed == {0: "https://a.com", 1: "https://b.com"}
+    
+    @pytest.mark.asyncio
+    async def test_pool_stats_reported(self):
+        """Context pool statistics should be written into stats"""
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            mock_instance = AsyncMock()
+            mock_instance.analyze.return_value = []
+            mock_instance.new_context.side_effect = lambda: AsyncMock()
+            MockRunner.return_value.__aenter__.return_value = mock_instance
+            
+            stats = {}
+            await process_urls(
+                ["https://a.com", "https://b.com", "https://c.com"],
+                pages_per_context=2,
+                stats=stats
+            )
+            assert stats["context_pool"]["contexts_created"] == 2
+            assert stats["context_pool"]["contexts_recycled"] == 1
+            assert stats["context_pool"]["peak_live_contexts"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_errors_are_isolated(self):
+        """A failing URL should not affect other URLs in the pool"""
+        async def fail_one(url, **kwargs):
+            if url == "https://error.com":
+                raise Exception("Boom")
+            return []
+        
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            mock_instance = AsyncMock()
+            mock_instance.analyze.side_effect = fail_one
+            mock_instance.new_context.side_effect = lambda: AsyncMock()
+            MockRunner.return_value.__aenter__.return_value = mock_instance
+            
+            results = await process_urls(
+                ["https://ok.com", "https://error.com", "https://ok2.com"],
+                concurrency=2
+            )
+            assert results[0]["error"] is None
+            assert "Boom" in results[1]["error"]
+            assert results[2]["error"] is None
+    
+    @pytest.mark.asyncio
+    async def test_context_creation_failure_is_isolated(self):
+        """A context that cannot be created should only fail its own URL"""
+        contexts = [Exception("Browser crashed"), AsyncMock()]
+        
+        async def new_context():
+            context = contexts.pop(0)
+            if isinstance(context, Exception):
+                raise context
+            return context
+        
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            mock_instance = AsyncMock()
+            mock_instance.analyze.return_value = []
+            mock_instance.new_context.side_effect = new_context
+            MockRunner.return_value.__aenter__.return_value = mock_instance
+            
+            results = await process_urls(["https://a.com", "https://b.com"])
+            assert "Context creation failed: Browser crashed" in results[0]["error"]
+            assert results[1]["error"] is None
 
 
 class TestMain:
@@ -203,3 +403,122 @@ class TestTraceFocusIntegration:
                 
                 assert results[0]["focus_path"] == mock_trace.return_value["focus_path"]
                 assert results[0]["focus_element_count"] == 2
+
+    
+    @pytest.mark.asyncio
+    async def test_keyboard_trap_added_to_violations(self):
+        """A trap found by the focus trace should count as a violation"""
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            mock_instance = AsyncMock()
+            mock_instance.analyze.return_value = []
+            MockRunner.return_value.__aenter__.return_value = mock_instance
+            
+            with patch('focus_order_tester.main.trace_focus_path') as mock_trace:
+                mock_trace.return_value = {
+                    "url": "https://example.com",
+                    "focus_path": [],
+                    "element_count": 0,
+                    "violations": [{"rule_id": "wcag212-keyboard-trap", "impact": "critical"}]
+                }
+                
+                results = await process_urls(["https://example.com"], trace_focus=True)
+                
+                assert [v["rule_id"] for v in results[0]["violations"]] == ["wcag212-keyboard-trap"]
+                assert results[0]["violation_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reused_f85_result_names_its_page(self):
+        """A violation reused from another page should say where it was measured"""
+        from focus_order_tester.trigger_tracker import TriggerResult
+        reused = TriggerResult(
+            "#menu", "Menu", dialog_selector="#nav", distance=5, f85_violation=True,
+            from_cache=True, tested_on="https://example.com/a"
+        )
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner, \
+                patch('focus_order_tester.main.TriggerTracker') as MockTracker:
+            MockRunner.return_value.__aenter__.return_value = AsyncMock(analyze=AsyncMock(return_value=[]))
+            MockTracker.return_value.__aenter__.return_value = AsyncMock(
+                analyze_f85=AsyncMock(return_value=[reused])
+            )
+            
+            results = await process_urls(["https://example.com/b"], trace_triggers=True)
+        
+        assert results[0]["trigger_results"][0]["tested_on"] == "https://example.com/a"
+        assert "Measured on https://example.com/a" in results[0]["violations"][0]["description"]
+
+
+class TestPipelineMode:
+    """Test single-navigation pipeline mode"""
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_navigates_once_for_all_phases(self):
+        """All phases should run against one page loaded once"""
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner, \
+                patch('focus_order_tester.main.FocusTracer') as MockTracer, \
+                patch('focus_order_tester.main.TriggerTracker') as MockTracker:
+            runner = AsyncMock()
+            runner.analyze_page.return_value = []
+            MockRunner.return_value.__aenter__.return_value = runner
+            context = runner.new_context.return_value
+            page = context.new_page.return_value
+            
+            tracer = AsyncMock()
+            tracer.trace_page.return_value = []
+            tracer.reached_limit = MagicMock(return_value=False)
+            MockTracer.return_value.__aenter__.return_value = tracer
+            
+            tracker = AsyncMock()
+            tracker.analyze_page.return_value = []
+            MockTracker.return_value.__aenter__.return_value = tracker
+            
+            results = await process_urls(
+                ["https://example.com"],
+                trace_focus=True,
+                trace_triggers=True,
+                pipeline=True
+            )
+            
+            page.goto.assert_awaited_once()
+            runner.analyze.assert_not_called()
+            runner.analyze_page.assert_awaited_once_with(page)
+            tracer.trace_page.assert_awaited_once_with(page, dom_order=[], traps=[])
+            tracker.analyze_page.assert_awaited_once_with(page, ready=True)
+            assert results[0]["focus_element_count"] == 0
+            assert results[0]["order_comparison"]["matches"] == True
+            assert results[0]["error"] is None
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_navigation_failure_is_recorded(self):
+        """A failed navigation should be reported without running phases"""
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            runner = AsyncMock()
+            MockRunner.return_value.__aenter__.return_value = runner
+            page = runner.new_context.return_value.new_page.return_value
+            page.goto.side_effect = Exception("net::ERR_NAME_NOT_RESOLVED")
+            
+            results = await process_urls(["https://missing.invalid"], pipeline=True)
+            
+            assert "Navigation failed" in results[0]["error"]
+            runner.analyze_page.assert_not_called()
+            page.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_page_creation_failure_recycles_context(self):
+        """A failed new_page() should be recorded and its context replaced"""
+        with patch('focus_order_tester.main.AxeRunner') as MockRunner:
+            runner = AsyncMock()
+            runner.analyze_page.return_value = []
+            broken = AsyncMock()
+            broken.new_page.side_effect = Exception("Target closed")
+            runner.new_context.side_effect = [broken, AsyncMock()]
+            MockRunner.return_value.__aenter__.return_value = runner
+            
+            stats = {}
+            results = await process_urls(
+                ["https://a.com", "https://b.com"], pipeline=True, stats=stats
+            )
+            
+            assert "Processing failed: Target closed" in results[0]["error"]
+            assert results[1]["error"] is None
+            broken.close.assert_awaited_once()
+            assert stats["context_pool"]["contexts_created"] == 2
@@ -0,0 +1,162 @@
+"""
+Tests for Readiness Module
+
+Tests cover:
+- Parsing readiness policies and per-URL rules
+- Choosing a policy per URL pattern
+- Hard cap and recorded readiness time
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from focus_order_tester.readiness import (
+    ReadinessConfig,
+    LoadState,
+    DomQuiescence,
+    SelectorPresent,
+    NetworkQuiet,
+    parse_policy,
+    parse_rule
+)
+
+
+class TestParsePolicy:
+    """Test policy parsing"""
+
+    def test_load_states(self):
+        """Plain load state names should map to LoadState"""
+        assert parse_policy("networkidle") == LoadState("networkidle")
+        assert parse_policy("domcontentloaded") == LoadState("domcontentloaded")
+
+    def test_quiescence_with_and_without_ms(self):
+        """dom-quiet should accept an optional quiet period"""
+        assert parse_policy("dom-quiet") == DomQuiescence()
+        assert parse_policy("dom-quiet:250") == DomQuiescence(250)
+        assert parse_policy("network-quiet:800").quiet_ms == 800
+
+    def test_selector_keeps_colons(self):
+        """Selectors containing colons should survive parsing"""
+        assert parse_policy("selector:main:not(.loading)") == SelectorPresent("main:not(.loading)")
+
+    def test_unknown_policy_raises(self):
+        """Unknown policies should raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_policy("whenever")
+
+    def test_rule_requires_pattern(self):
+        """Rules must be PATTERN=POLICY"""
+        assert parse_rule("*/shop/*=load") == ("*/shop/*", LoadState("load"))
+        with pytest.raises(ValueError):
+            parse_rule("load")
+
+
+class TestReadinessConfig:
+    """Test policy selection and waiting"""
+
+    def test_policy_for_uses_first_matching_rule(self):
+        """First matching glob should win, otherwise the default"""
+        config = ReadinessConfig(
+            DomQuiescence(),
+            rules=[
+                ("https://app.example.com/*", SelectorPresent("#root")),
+                ("https://*", LoadState("load")),
+            ]
+        )
+        assert config.policy_for("https://app.example.com/x") == SelectorPresent("#root")
+        assert config.policy_for("https://other.com/") == LoadState("load")
+        assert config.policy_for("file:///tmp/a.html") == DomQuiescence()
+
+    @pytest.mark.asyncio
+    async def test_navigate_records_policy_and_time(self):
+        """navigate() should report the policy used and elapsed time"""
+        page = AsyncMock()
+        result = await ReadinessConfig(LoadState("load")).navigate(page, "https://example.com")
+
+        page.goto.assert_awaited_once_with("https://example.com", wait_until="commit")
+        states = [c.args[0] for c in page.wait_for_load_state.await_args_list]
+        assert states == ["domcontentloaded", "load"]
+        assert result.policy == "load"
+        assert result.elapsed_ms >= 0
+        assert result.timed_out is False
+
+    @pytest.mark.asyncio
+    async def test_hard_cap_stops_waiting(self):
+        """A policy that never completes should be cut off by the cap"""
+        page = AsyncMock()
+
+        async def never(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        page.evaluate.side_effect = never
+        config = ReadinessConfig(DomQuiescence(500), timeout_ms=50)
+
+        result = await asyncio.wait_for(config.navigate(page, "https://example.com"), 2)
+        assert result.timed_out is True
+        assert result.policy == "dom-quiet:500"
+
+    @pytest.mark.asyncio
+    async def test_document_wait_shares_the_hard_cap(self):
+        """A slow domcontentloaded should use what is left of the cap and time out softly"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        page = AsyncMock()
+        page.wait_for_load_state.side_effect = PlaywrightTimeoutError("Timeout 50ms exceeded")
+        config = ReadinessConfig(LoadState("load"), timeout_ms=50)
+
+        result = await config.navigate(page, "https://example.com")
+
+        assert result.timed_out is True
+        page.wait_for_load_state.assert_awaited_once()
+        timeout = page.wait_for_load_state.await_args.kwargs["timeout"]
+        assert 0 < timeout <= 50
+
+    @pytest.mark.asyncio
+    async def test_client_side_redirect_waits_on_new_document(self):
+        """A destroyed execution context should restart the wait, not fail the page"""
+        from playwright.async_api import Error as PlaywrightError
+        page = AsyncMock()
+        page.evaluate.side_effect = [
+            PlaywrightError("Execution context was destroyed, most likely because of a navigation"),
+            None
+        ]
+        config = ReadinessConfig(DomQuiescence(500))
+
+        result = await config.navigate(page, "https://example.com")
+
+        assert result.timed_out is False
+        assert page.evaluate.await_count == 2
+        assert page.wait_for_load_state.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_other_errors_still_raise(self):
+        """Errors unrelated to navigation should not be swallowed"""
+        from playwright.async_api import Error as PlaywrightError
+        page = AsyncMock()
+        page.evaluate.side_effect = PlaywrightError("Target page, context or browser has been closed")
+
+        with pytest.raises(PlaywrightError):
+            await ReadinessConfig(DomQuiescence(500)).navigate(page, "https://example.com")
+
+
+class TestNetworkQuiet:
+    """Test network quiet tracking"""
+
+    @pytest.mark.asyncio
+    async def test_ignores_denylisted_hosts(self):
+        """Requests to ignored hosts should not keep the page busy"""
+        page = MagicMock()
+        policy = NetworkQuiet(quiet_ms=10)
+        monitor = await policy.prepare(page)
+
+        beacon = MagicMock(resource_type="xhr", url="https://www.google-analytics.com/collect")
+        monitor._on_request(beacon)
+        assert not monitor.in_flight
+
+        api = MagicMock(resource_type="fetch", url="https://example.com/api")
+        monitor._on_request(api)
+        assert monitor.in_flight
+        monitor._on_done(api)
+
+        await asyncio.wait_for(policy.wait(page, monitor, 1000), 1)
+        await policy.cleanup(page, monitor)
+        assert page.remove_listener.call_count == 3
@@ -183,6 +183,37 @@ class TestGenerateMdReport:
         md = generate_md_report(results)
         assert "❌" in md
     
+    def test_md_report_shows_order_comparison(self):
+        """Should summarize DOM vs focus order mismatches"""
+        results = [{
+            "url": "https://example.com",
+            "violations": [],
+            "order_comparison": {
+                "matches": False,
+                "discrepancies": [{"type": "moved", "selectors": ["#b"], "dom_position": 1, "focus_position": 0}],
+                "summary": {"in_order": 2, "moved": 1, "missing": 0, "extra": 0}
+            }
+        }]
+        md = generate_md_report(results)
+        assert "DOM Order vs Focus Order" in md
+        assert "1 moved" in md
+        assert "`#b`" in md
+    
+    def test_md_report_shows_reverse_comparison(self):
+        """Should summarize where Shift+Tab is not the reverse of Tab"""
+        results = [{
+            "url": "https://example.com",
+            "violations": [],
+            "reverse_comparison": {
+                "matches": False,
+                "discrepancies": [{"type": "missing", "selectors": ["#c"], "dom_position": 2}],
+                "summary": {"in_order": 2, "moved": 0, "missing": 1, "extra": 0}
+            }
+        }]
+        md = generate_md_report(results)
+        assert "Tab vs Shift+Tab Order" in md
+        assert "| missing | `#c` | 2 | - |" in md
+    
     def test_write_md_to_file(self):
         """Should write markdown report to file"""
         results = [{"url": "https://example.com", "violations": []}]
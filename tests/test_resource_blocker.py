@@ -0,0 +1,88 @@
+"""
+Tests for Resource Blocker Module
+
+Tests cover:
+- Blocking by resource type and domain denylist
+- Counting blocked requests
+- Attaching to contexts created by a BrowserSession
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from focus_order_tester.resource_blocker import ResourceBlocker, DEFAULT_BLOCKED_TYPES
+from focus_order_tester.browser_session import BrowserSession
+
+
+def _route(resource_type, url):
+    """Build a mock Playwright route for a request"""
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+class TestBlockReason:
+    """Test request classification"""
+
+    def test_blocks_heavy_resource_types(self):
+        """Images, media and fonts should be blocked"""
+        blocker = ResourceBlocker()
+        for resource_type in ("image", "media", "font"):
+            assert resource_type in DEFAULT_BLOCKED_TYPES
+            assert blocker.block_reason(resource_type, "https://example.com/a") == resource_type
+
+    def test_allows_documents_and_scripts(self):
+        """First-party documents, scripts and styles should pass"""
+        blocker = ResourceBlocker()
+        assert blocker.block_reason("document", "https://example.com/") is None
+        assert blocker.block_reason("script", "https://example.com/app.js") is None
+        assert blocker.block_reason("stylesheet", "https://example.com/app.css") is None
+
+    def test_blocks_denylisted_subdomains(self):
+        """Subdomains of a denylisted domain should be blocked"""
+        blocker = ResourceBlocker()
+        reason = blocker.block_reason("script", "https://www.google-analytics.com/analytics.js")
+        assert reason == "google-analytics.com"
+
+    def test_extra_domains(self):
+        """Configured domains should be added to the denylist"""
+        blocker = ResourceBlocker(extra_domains=["Beacon.Example.org"])
+        assert blocker.block_reason("xhr", "https://beacon.example.org/hit") == "beacon.example.org"
+        assert blocker.block_reason("xhr", "https://example.org/api") is None
+
+
+class TestHandleRoute:
+    """Test route handling and statistics"""
+
+    @pytest.mark.asyncio
+    async def test_counts_blocked_and_allowed(self):
+        """Blocked requests should be aborted and counted by reason"""
+        blocker = ResourceBlocker()
+        image = _route("image", "https://example.com/hero.jpg")
+        tracker = _route("script", "https://stats.doubleclick.net/x.js")
+        page = _route("document", "https://example.com/")
+
+        for route in (image, tracker, page):
+            await blocker._handle(route)
+
+        image.abort.assert_awaited_once()
+        tracker.abort.assert_awaited_once()
+        page.continue_.assert_awaited_once()
+        assert blocker.stats.requests_blocked == 2
+        assert blocker.stats.requests_allowed == 1
+        assert blocker.stats.by_type == {"image": 1}
+        assert blocker.stats.by_domain == {"doubleclick.net": 1}
+
+    @pytest.mark.asyncio
+    async def test_session_attaches_blocker_to_new_contexts(self):
+        """Contexts created by the session should be routed"""
+        blocker = ResourceBlocker()
+        session = BrowserSession(resource_blocker=blocker)
+        browser = AsyncMock()
+        session.get_browser = AsyncMock(return_value=browser)
+
+        context = await session.new_context()
+
+        context.route.assert_awaited_once_with("**/*", blocker._handle)
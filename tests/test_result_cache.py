@@ -0,0 +1,105 @@
+"""
+Tests for Result Cache Module
+
+Tests cover:
+- Storing and retrieving results across cache instances
+- Least recently used eviction
+- Cache keys covering URL, DOM hash and configuration
+- Skipping axe for unchanged pages
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from focus_order_tester.result_cache import ResultCache, cache_key
+from focus_order_tester.axe_runner import AxeRunner, FocusOrderViolation
+from focus_order_tester.browser_session import BrowserSession
+
+
+class TestCacheKey:
+    """Test cache key construction"""
+    
+    def test_key_depends_on_every_part(self):
+        """Changing the URL, DOM hash, kind or config should change the key"""
+        base = cache_key("axe", "https://a.com", "abc", ["4.8.4", ["tabindex"]])
+        assert base == cache_key("axe", "https://a.com", "abc", ["4.8.4", ["tabindex"]])
+        assert base != cache_key("axe", "https://b.com", "abc", ["4.8.4", ["tabindex"]])
+        assert base != cache_key("axe", "https://a.com", "abd", ["4.8.4", ["tabindex"]])
+        assert base != cache_key("focus", "https://a.com", "abc", ["4.8.4", ["tabindex"]])
+        assert base != cache_key("axe", "https://a.com", "abc", ["4.9.0", ["tabindex"]])
+
+
+class TestResultCache:
+    """Test the SQLite LRU cache"""
+    
+    def test_roundtrip_and_persistence(self, tmp_path):
+        """Values should survive reopening the cache file"""
+        path = tmp_path / "cache.sqlite"
+        with ResultCache(path) as cache:
+            assert cache.get("k") is None
+            cache.put("k", [{"rule_id": "tabindex"}])
+            assert cache.stats.misses == 1
+        
+        with ResultCache(path) as cache:
+            assert cache.get("k") == [{"rule_id": "tabindex"}]
+            assert cache.stats.hits == 1
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Entries beyond max_entries should be evicted oldest-use first"""
+        with ResultCache(tmp_path / "cache.sqlite", max_entries=2) as cache:
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.get("a")
+            cache.put("c", 3)
+            
+            assert len(cache) == 2
+            assert cache.get("b") is None
+            assert cache.get("a") == 1
+            assert cache.stats.evictions == 1
+    
+    def test_overwrite_does_not_grow(self, tmp_path):
+        """Storing an existing key should replace it in place"""
+        with ResultCache(tmp_path / "cache.sqlite", max_entries=2) as cache:
+            cache.put("a", 1)
+            cache.put("a", 2)
+            assert len(cache) == 1
+            assert cache.get("a") == 2
+
+
+class TestAxeRunnerCache:
+    """Test that AxeRunner consults the cache"""
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_page_skips_axe(self, tmp_path):
+        """A second analysis of an identical page should not run axe"""
+        page = AsyncMock()
+        page.url = "https://example.com"
+        
+        with ResultCache(tmp_path / "cache.sqlite") as cache, \
+                patch('focus_order_tester.axe_runner.page_fingerprint', AsyncMock(return_value="dom1")):
+            async with AxeRunner(session=BrowserSession(), cache=cache) as runner:
+                runner._run_axe = AsyncMock(return_value={"violations": [
+                    {"id": "tabindex", "impact": "serious", "nodes": [{"html": "<p>", "target": ["p"]}]}
+                ]})
+                first = await runner.analyze_page(page)
+                second = await runner.analyze_page(page)
+        
+        runner._run_axe.assert_awaited_once()
+        assert second == first
+        assert isinstance(second[0], FocusOrderViolation)
+        assert cache.stats.hits == 1
+    
+    @pytest.mark.asyncio
+    async def test_changed_dom_runs_axe_again(self, tmp_path):
+        """A different DOM hash should miss the cache"""
+        page = AsyncMock()
+        page.url = "https://example.com"
+        fingerprint = AsyncMock(side_effect=["dom1", "dom2"])
+        
+        with ResultCache(tmp_path / "cache.sqlite") as cache, \
+                patch('focus_order_tester.axe_runner.page_fingerprint', fingerprint):
+            async with AxeRunner(session=BrowserSession(), cache=cache) as runner:
+                runner._run_axe = AsyncMock(return_value={"violations": []})
+                await runner.analyze_page(page)
+                await runner.analyze_page(page)
+        
+        assert runner._run_axe.await_count == 2
@@ -0,0 +1,86 @@
+"""
+Tests for Sharding Module
+
+Tests cover:
+- Splitting URLs across worker processes
+- Merging results back in input order
+- Handling a crashed worker process
+"""
+import queue
+import pytest
+from unittest.mock import MagicMock, patch
+
+from focus_order_tester.sharding import shard_urls, merge_stats, process_urls_sharded
+
+
+class TestShardUrls:
+    """Test URL sharding"""
+
+    def test_round_robin_keeps_indexes(self):
+        """Should deal URLs round-robin and keep each input index"""
+        shards = shard_urls(["a", "b", "c", "d", "e"], 2)
+        assert shards == [
+            [(0, "a"), (2, "c"), (4, "e")],
+            [(1, "b"), (3, "d")],
+        ]
+
+    def test_more_workers_than_urls(self):
+        """Should not create empty shards"""
+        shards = shard_urls(["a", "b"], 8)
+        assert len(shards) == 2
+
+    def test_every_url_assigned_once(self):
+        """Every URL should land in exactly one shard"""
+        urls = [f"https://example.com/{i}" for i in range(37)]
+        shards = shard_urls(urls, 4)
+        assigned = sorted(index for shard in shards for index, _ in shard)
+        assert assigned == list(range(37))
+
+
+class TestMergeStats:
+    """Test combining per-worker run statistics"""
+
+    def test_sums_nested_counters(self):
+        """Nested numeric counters should be summed across workers"""
+        combined = {}
+        merge_stats(combined, {"context_pool": {"contexts_created": 2, "peak_live_contexts": 1}})
+        merge_stats(combined, {"context_pool": {"contexts_created": 3, "peak_live_contexts": 2}})
+        assert combined == {"context_pool": {"contexts_created": 5, "peak_live_contexts": 3}}
+
+
+class TestProcessUrlsSharded:
+    """Test multi-process execution"""
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_reports_errors_in_order(self):
+        """URLs of a worker that dies should get error results in input order"""
+        urls = ["https://a.com", "https://b.com", "https://c.com"]
+        # An unknown option makes process_urls raise inside every child
+        results = await process_urls_sharded(urls, workers=2, unknown_option=True)
+
+        assert [r["url"] for r in results] == urls
+        assert all("exited unexpectedly" in r["error"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_exited_worker_results_are_drained_before_crash_check(self):
+        """Results queued by a worker that just exited should not be lost"""
+        results_queue = MagicMock()
+        # The blocking poll times out right as the worker finishes
+        results_queue.get.side_effect = queue.Empty
+        results_queue.get_nowait.side_effect = [
+            ("result", 0, {"url": "https://a.com", "error": None}),
+            ("done", 0, {"pages": 1}),
+            queue.Empty
+        ]
+        process = MagicMock(exitcode=0)
+        process.is_alive.return_value = False
+        mp_context = MagicMock()
+        mp_context.Queue.return_value = results_queue
+        mp_context.Process.return_value = process
+
+        stats = {}
+        with patch('focus_order_tester.sharding.multiprocessing.get_context', return_value=mp_context):
+            results = await process_urls_sharded(["https://a.com"], workers=1, stats=stats)
+
+        assert results == [{"url": "https://a.com", "error": None}]
+        assert stats == {"pages": 1}